@@ -9,15 +9,18 @@ from typing import List
 from clipman import init, get
 from tldextract import extract
 from GUI_qt.logs import LogWindow
+from core.__seedwork.infra.log import get_logger, setup_logging
 from GUI_qt.version import version
 from GUI_qt.loading import LoadingWindow
 from GUI_qt.websites import WebSiteOpener
 from GUI_qt.new_version import NewVersion
 from core.config.login_data import delete_login
 from core.providers.domain.entities import Chapter, Manga
+from core.download.domain.dowload_entity import PageDownloadError
 from GUI_qt.git import update_providers, get_last_version
 from core.slicer.application.use_cases import SlicerUseCase
 from core.group_imgs.application.use_cases import GroupImgsUseCase
+from core.browser.application.use_cases import CloseBrowsersUseCase
 from GUI_qt.load_providers import import_classes_recursively, base_path
 from PyQt6.QtCore import QRunnable, QThreadPool, pyqtSignal, QObject, QLocale, QThread
 from GUI_qt.config import get_config, update_lang, update_progress, update_max_download, update_log, update_external_path, update_external
@@ -25,6 +28,7 @@ from core.providers.application.use_cases import ProviderMangaUseCase, ProviderG
 from PyQt6.QtWidgets import QApplication, QMessageBox, QSpacerItem, QSizePolicy, QApplication, QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QFileDialog, QWidget
 from core.config.img_conf import (
     get_config as get_img_config,
+    config_service as img_config_service,
     update_img, update_save,
     update_automatic_width,
     update_custom_width,
@@ -37,8 +41,14 @@ from core.config.img_conf import (
     update_slice,
     update_split_height,
     update_slice_replace_original_files,
-    update_group_replace_original_files
+    update_group_replace_original_files,
+    update_keep_original,
+    update_download_workers,
+    update_domain_workers
 )
+from core.__seedwork.infra.http.http.session_pool import session_pool
+
+log = get_logger('gui')
 
 class WorkerSignals(QObject):
     progress_changed = pyqtSignal(int)
@@ -56,6 +66,11 @@ class DownloadRunnable(QRunnable):
         self.assets = os.path.join(self.current_dir, 'assets')
 
     def run(self):
+        # Um snapshot da configuração para o capítulo inteiro (download, slicer e grupo)
+        with img_config_service.pin():
+            self._run()
+
+    def _run(self):
         try:
             img_conf = get_img_config()
             conf = get_config()
@@ -90,7 +105,17 @@ class DownloadRunnable(QRunnable):
             def update_progress_bar(value):
                 self.signals.progress_changed.emit(int(value))
 
-            ch = ProviderDownloadUseCase(self.provider).execute(pages=pages, fn=update_progress_bar)
+            failed = None
+            try:
+                ch = ProviderDownloadUseCase(self.provider).execute(pages=pages, fn=update_progress_bar)
+            except PageDownloadError as e:
+                # Algumas páginas falharam: o resto do capítulo segue para o
+                # slicer e o agrupamento, e as falhas são mostradas no fim.
+                log.warning('Capítulo %s baixado com %s página(s) faltando', self.ch.number, len(e.failures))
+                failed = e
+                ch = e.chapter
+                if not ch.files:
+                    raise
 
             if img_conf.slice:
                 self.signals.name.emit(translation['slicing'])
@@ -105,6 +130,13 @@ class DownloadRunnable(QRunnable):
                 GroupImgsUseCase().execute(ch, update_progress_bar)
                 self.signals.progress_changed.emit(100)
 
+            if failed is not None:
+                set_progress_bar_style("red")
+                self.signals.download_error.emit(f'{self.ch.name} \n {self.ch.number} \n {str(failed)}')
+
+        except PageDownloadError as e:
+            set_progress_bar_style("red")
+            self.signals.download_error.emit(f'{self.ch.name} \n {self.ch.number} \n {str(e)}')
         except Exception as e:
             set_progress_bar_style("red")
             self.signals.download_error.emit(f'{self.ch.name} \n {self.ch.number} \n {str(e)}')
@@ -190,11 +222,16 @@ class MangaDownloaderApp:
         self.window.search.textChanged.connect(self.filter_chapters)
         self.window.simul_qtd.textChanged.connect(self.setMaxDownload)
         self.window.simul_qtd.wheelEvent = lambda event: event.ignore()
+        self.window.download_workers.textChanged.connect(self.setDownloadWorkers)
+        self.window.download_workers.wheelEvent = lambda event: event.ignore()
+        self.window.domain_workers.textChanged.connect(self.setDomainWorkers)
+        self.window.domain_workers.wheelEvent = lambda event: event.ignore()
         self.window.dev_check.stateChanged.connect(self.toogle_log)
         self.window.group_imgs.toggled.connect(self.toogle_group_img)
         self.window.external.toggled.connect(self.externalProviderChanged)
         self.window.replacegroupcheckBox.toggled.connect(self.toogle_group_replace)
         self.window.replaceslicecheckBox.toggled.connect(self.toogle_slice_replace)
+        self.window.keep_original_checkBox.toggled.connect(self.toogle_keep_original)
         self.window.slicer_box.toggled.connect(self.toogle_group_slice)
         self.window.config.clicked.connect(self.open_config)
         self.window.open_folder.clicked.connect(self.open_folder)
@@ -247,6 +284,13 @@ class MangaDownloaderApp:
             self.window.external.setChecked(conf.external_provider)
         self.window.replaceslicecheckBox.setChecked(data.slice_replace_original_files)
         self.window.replacegroupcheckBox.setChecked(data.group_replace_original_files)
+        self.window.keep_original_checkBox.setChecked(data.keep_original)
+        self.window.download_workers.setValue(data.download_workers)
+        self.window.domain_workers.setValue(data.domain_workers)
+        # O limite de conexões por domínio vale para todo o programa: é
+        # aplicado uma vez aqui e de novo só quando a configuração muda
+        session_pool.configure(data.domain_workers)
+        img_config_service.subscribe(self._apply_domain_workers)
         self.window.group_imgs_combo.setCurrentText(data.group_format)
         self.window.group_imgs_combo.wheelEvent = lambda event: event.ignore()
         self.window.slicer_height.setValue(data.split_height)
@@ -290,6 +334,7 @@ class MangaDownloaderApp:
 
 
     def run(self):
+        self.app.aboutToQuit.connect(CloseBrowsersUseCase().execute)
         sys.exit(self.app.exec())
 
 
@@ -346,9 +391,7 @@ class MangaDownloaderApp:
             self._load_progress()
             
         except Exception as e:
-            print(f"❌ Erro ao iniciar download do capítulo: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception('Erro ao iniciar download do capítulo: %s', e)
             
             # Re-habilita o botão em caso de erro
             download_button.setEnabled(True)
@@ -400,7 +443,7 @@ class MangaDownloaderApp:
                 self.chapters = [chapter for chapter in self.all_chapters if text in chapter.number]
 
         except ValueError as e:
-            print(f"Error: {e}")
+            log.error('Error: %s', e)
             self.chapters = []
 
         self._add_chapters()
@@ -476,7 +519,7 @@ class MangaDownloaderApp:
             if chapter.id not in downloaded_chapter_ids
         ]
         
-        print(f"[DEBUG] Preparando download de {len(chapters_to_download)} capítulos")
+        log.debug('Preparando download de %s capítulos', len(chapters_to_download))
         
         # Cria runnables para cada capítulo
         for chapter in chapters_to_download:
@@ -491,7 +534,7 @@ class MangaDownloaderApp:
         self._load_progress()
         self._add_chapters()
         
-        print(f"[DEBUG] Todos os {len(chapters_to_download)} capítulos foram enfileirados")
+        log.debug('Todos os %s capítulos foram enfileirados', len(chapters_to_download))
 
     def _load_progress(self):
         """Carrega e atualiza a interface de progresso dos downloads"""
@@ -625,6 +668,18 @@ class MangaDownloaderApp:
         update_max_download(max_qtd)
         self.pool.setMaxThreadCount(max_qtd)
 
+    def setDownloadWorkers(self):
+        if not self.initial_data:
+            update_download_workers(int(self.window.download_workers.text()))
+
+    def setDomainWorkers(self):
+        if not self.initial_data:
+            update_domain_workers(int(self.window.domain_workers.text()))
+
+    def _apply_domain_workers(self, config, changed: set):
+        if 'domain_workers' in changed:
+            session_pool.configure(config.domain_workers)
+
     def setSlicerHeight(self):
         slicer_height = int(self.window.slicer_height.text())
         update_split_height(slicer_height)
@@ -699,6 +754,8 @@ class MangaDownloaderApp:
         self.window.open_external_folder.setText(translation['open_folder'])
         self.window.path_label.setText(translation['path_label'])
         self.window.simul_label.setText(translation['download_qtd'])
+        self.window.download_workers_label.setText(translation['download_workers'])
+        self.window.domain_workers_label.setText(translation['domain_workers'])
         self.window.dev_label.setText(translation['dev_label'])
         self.window.dev_check.setText(translation['dev_check'])
         self.window.group_imgs.setTitle(translation['group_images'])
@@ -723,6 +780,8 @@ class MangaDownloaderApp:
         self.window.slicer_ignorable_margin_label.setText(translation['ignore_horizontal_margins'])
         self.window.replaceslicecheckBox.setText(translation['overwrite'])
         self.window.replacegroupcheckBox.setText(translation['overwrite'])
+        self.window.keep_original_checkBox.setText(translation['keep_original'])
+        self.window.keep_original_checkBox.setToolTip(translation['keep_original_tooltip'])
         self.window.external.setTitle(translation['external'])
 
     def toogle_group_img(self, checked):
@@ -741,6 +800,10 @@ class MangaDownloaderApp:
         if not self.initial_data:
             update_slice_replace_original_files(checked)
 
+    def toogle_keep_original(self, checked):
+        if not self.initial_data:
+            update_keep_original(checked)
+
     def toogle_log(self):
         if not self.init_log:
             if self.window.logs.isHidden():
@@ -749,6 +812,9 @@ class MangaDownloaderApp:
                 update_log(True)
             else:
                 self.window.logs.hide()
+                if self.log_window:
+                    self.log_window.detach()
+                    self.log_window.close()
                 self.log_window = None
                 update_log(False)
         else:
@@ -779,6 +845,7 @@ class MangaDownloaderApp:
 
 if __name__ == "__main__":
     try:
+        setup_logging()
 
         if os.environ.get('PYTESTEENV') == 'dev':
             from jurigged import watch
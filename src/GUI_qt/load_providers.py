@@ -5,6 +5,7 @@ from pathlib import Path
 from GUI_qt.config import get_config
 from platformdirs import user_data_path
 from core.providers.domain.provider_repository import ProviderRepository
+from core.__seedwork.infra.http.http.rate_limiter import rate_limiter
 
 data_path = user_data_path('pyteste')
 
@@ -57,4 +58,9 @@ def import_classes_recursively() -> List[ProviderRepository]:
         
         classes += external
 
+    # Limite declarado pelo provider vale para os domínios dele
+    for c in classes:
+        if getattr(c, 'rate_limit', None):
+            rate_limiter.configure_provider(c.domain, c.rate_limit)
+
     return classes
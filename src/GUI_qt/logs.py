@@ -1,25 +1,44 @@
 import os
-import sys
+import logging
+from collections import deque
 from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QTextCursor
+from GUI_qt.metrics import MetricsWindow
 from GUI_qt.load_providers import base_path
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QPushButton
+from core.__seedwork.infra.log import ROOT, HtmlFormatter, setup_logging
 
 current_dir = os.path.join(base_path(), 'GUI_qt')
 assets = os.path.join(current_dir, 'assets')
 
-class LogEmitter(QObject):
-    log_signal = pyqtSignal(str)
+class QtLogHandler(logging.Handler):
+    """
+    Handler da janela de logs. `emit` só guarda o registro numa fila limitada;
+    a formatação em HTML acontece na thread da GUI, em lotes, quando a janela
+    está visível.
+    """
 
-class LogThread(QThread):
-    def __init__(self, emitter):
+    def __init__(self, capacity: int = 5000):
         super().__init__()
-        self.emitter = emitter
+        self.records = deque(maxlen=capacity)
+        self.setFormatter(HtmlFormatter())
 
-    def run(self):
-        sys.stdout = EmittingStream(self.emitter.log_signal)
-        sys.stderr = EmittingStream(self.emitter.log_signal)
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+
+    def drain(self) -> list:
+        lines = []
+        while self.records:
+            try:
+                record = self.records.popleft()
+            except IndexError:
+                break
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        return lines
 
 class LogWindow(QWidget):
     def __init__(self):
@@ -32,48 +51,61 @@ class LogWindow(QWidget):
         self.layout = QVBoxLayout(self)
         self.log_output = QTextEdit(self)
         self.log_output.setReadOnly(True)
+        self.log_output.document().setMaximumBlockCount(5000)
         self.layout.addWidget(self.log_output)
 
-        self.emitter = LogEmitter()
-        self.emitter.log_signal.connect(self.write_log)
+        self.handler = QtLogHandler()
+        root = logging.getLogger(ROOT)
+        root.addHandler(self.handler)
+        if root.getEffectiveLevel() > logging.INFO:
+            root.setLevel(logging.INFO)
 
-        self.log_thread = LogThread(self.emitter)
-        self.log_thread.start()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.flush_logs)
+        self.timer.start(200)
 
         self.clear_button = QPushButton("Clear Logs")
         self.clear_button.clicked.connect(self.clear_logs)
         self.layout.addWidget(self.clear_button)
 
+        self.metrics_window = None
+        self.metrics_button = QPushButton("HTTP Metrics")
+        self.metrics_button.clicked.connect(self.open_metrics)
+        self.layout.addWidget(self.metrics_button)
+
         self.scroll_at_bottom = True
         self.log_output.verticalScrollBar().valueChanged.connect(self.check_scroll_position)
-    
+
     def clear_logs(self):
+        self.handler.records.clear()
         self.log_output.clear()
 
-    def write_log(self, text: str):
-        if "[no-render]" in text:
-            self.log_output.append(text)
-        else:
-            text = text + '<br>'
-            self.log_output.insertHtml(text)
+    def open_metrics(self):
+        if self.metrics_window is None or not self.metrics_window.isVisible():
+            self.metrics_window = MetricsWindow()
+        self.metrics_window.show()
+        self.metrics_window.raise_()
+
+    def flush_logs(self):
+        if not self.isVisible():
+            return
+        lines = self.handler.drain()
+        if not lines:
+            return
+        for line in lines:
+            self.log_output.append(f'<span>{line}</span>')
         if self.scroll_at_bottom:
             self.log_output.moveCursor(QTextCursor.MoveOperation.End)
-    
+
+    def detach(self):
+        self.timer.stop()
+        logging.getLogger(ROOT).removeHandler(self.handler)
+        setup_logging()
+
     def check_scroll_position(self):
         max_value = self.log_output.verticalScrollBar().maximum()
         current_value = self.log_output.verticalScrollBar().value()
-        
-        margin = 10
-        
-        self.scroll_at_bottom = (current_value >= max_value - margin)
-
-class EmittingStream:
-    def __init__(self, signal):
-        self.signal = signal
 
-    def write(self, text):
-        if text.strip():
-            self.signal.emit(text)
+        margin = 10
 
-    def flush(self):
-        pass
\ No newline at end of file
+        self.scroll_at_bottom = (current_value >= max_value - margin)
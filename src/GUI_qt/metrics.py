@@ -0,0 +1,92 @@
+import os
+from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import QTimer
+from GUI_qt.load_providers import base_path
+from core.__seedwork.infra.http.http.metrics import http_metrics
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QFileDialog, QHeaderView
+
+current_dir = os.path.join(base_path(), 'GUI_qt')
+assets = os.path.join(current_dir, 'assets')
+
+COLUMNS = ['Domain', 'Requests', 'Errors', 'Retries', 'Bypasses', 'Cache', 'MB', 'TTFB p50', 'TTFB p95', 'Total p95']
+
+def _seconds(value) -> str:
+    if value is None:
+        return '-'
+    if value == float('inf'):
+        return '> 60s'
+    return f'≤ {value}s'
+
+class MetricsWindow(QWidget):
+    def __init__(self):
+        super().__init__()
+
+        self.setWindowTitle("HTTP Metrics")
+        self.setGeometry(320, 320, 900, 400)
+        self.setWindowIcon(QIcon(os.path.join(assets, 'icon.ico')))
+
+        self.layout = QVBoxLayout(self)
+        self.table = QTableWidget(0, len(COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.table.setSortingEnabled(True)
+        self.layout.addWidget(self.table)
+
+        buttons = QHBoxLayout()
+        for label, slot in (("Refresh", self.refresh), ("Export JSON", self.export_json),
+                            ("Export Prometheus", self.export_prometheus), ("Reset", self.reset)):
+            button = QPushButton(label)
+            button.clicked.connect(slot)
+            buttons.addWidget(button)
+        self.layout.addLayout(buttons)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(2000)
+        self.refresh()
+
+    def refresh(self):
+        snapshot = http_metrics.snapshot()
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(snapshot))
+        for row, (domain, metrics) in enumerate(sorted(snapshot.items())):
+            values = [
+                domain,
+                metrics['requests'],
+                metrics['errors'],
+                metrics['retries'],
+                sum(metrics['bypasses'].values()),
+                sum(metrics['cache'].values()),
+                round(metrics['bytes'] / (1024 * 1024), 2),
+                _seconds(metrics['ttfb_seconds']['p50']),
+                _seconds(metrics['ttfb_seconds']['p95']),
+                _seconds(metrics['total_seconds']['p95']),
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem()
+                if isinstance(value, (int, float)):
+                    item.setData(0, value)
+                else:
+                    item.setText(value)
+                self.table.setItem(row, column, item)
+        self.table.setSortingEnabled(True)
+
+    def _export(self, title: str, name: str, content: str):
+        path, _ = QFileDialog.getSaveFileName(self, title, name)
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+    def export_json(self):
+        self._export("Export JSON", 'metrics.json', http_metrics.to_json())
+
+    def export_prometheus(self):
+        self._export("Export Prometheus", 'metrics.prom', http_metrics.to_prometheus())
+
+    def reset(self):
+        http_metrics.reset()
+        self.refresh()
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        super().closeEvent(event)
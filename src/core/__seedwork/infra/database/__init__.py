@@ -0,0 +1,154 @@
+import sqlite3
+import threading
+from time import monotonic
+from os import makedirs
+from pathlib import Path
+from typing import Any, Callable
+from contextlib import contextmanager
+
+class Database:
+    """
+    Acesso compartilhado a um arquivo SQLite.
+
+    Cada thread mantém uma conexão própria de longa duração (em WAL, com
+    busy_timeout), então as instruções preparadas ficam no cache da conexão
+    entre chamadas e leitores não bloqueiam o escritor. `schema(conn)` cria as
+    tabelas e aplica as migrações uma única vez por processo, na primeira
+    conexão.
+    """
+
+    def __init__(self, path: Path | str, schema: Callable[[sqlite3.Connection], None] | None = None, busy_timeout: float = 10.0):
+        self.path = Path(path)
+        self.schema = schema
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._ready = False
+        self._watcher = None
+
+    def _open(self) -> sqlite3.Connection:
+        makedirs(self.path.parent, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, cached_statements=256, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA busy_timeout={int(self.busy_timeout * 1000)}')
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._open()
+        return conn
+
+    def connect(self) -> sqlite3.Connection:
+        conn = self._connection()
+        if not self._ready:
+            self.migrate()
+        return conn
+
+    def migrate(self) -> None:
+        with self._lock:
+            if self._ready:
+                return
+            if self.schema is not None:
+                with self._connection() as conn:
+                    self.schema(conn)
+            self._ready = True
+
+    @contextmanager
+    def transaction(self):
+        """Conexão da thread dentro de uma transação: commit no fim, rollback em erro."""
+        conn = self.connect()
+        with conn:
+            yield conn
+
+    def execute(self, sql: str, params=()) -> int:
+        with self.transaction() as conn:
+            return conn.execute(sql, params).rowcount
+
+    def fetchone(self, sql: str, params=()) -> tuple | None:
+        return self.connect().execute(sql, params).fetchone()
+
+    def fetchall(self, sql: str, params=()) -> list[tuple]:
+        return self.connect().execute(sql, params).fetchall()
+
+    def data_version(self) -> int:
+        """
+        Contador que muda sempre que outra conexão (outra thread ou outro
+        processo) grava no arquivo. Usa uma conexão própria, só para isso.
+        """
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = self._open()
+            return self._watcher.execute('PRAGMA data_version').fetchone()[0]
+
+    def close(self) -> None:
+        """Fecha a conexão da thread atual."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+def add_column(conn: sqlite3.Connection, table: str, column: str, column_type: str = 'TEXT', default_value=None) -> None:
+    """Migração: cria a coluna se ela ainda não existe, preenchendo `default_value`."""
+    columns = [row[1] for row in conn.execute(f'PRAGMA table_info({table})')]
+    if column not in columns:
+        conn.execute(f'ALTER TABLE {table} ADD COLUMN {column} {column_type}')
+        if default_value is not None:
+            conn.execute(f'UPDATE {table} SET {column} = ? WHERE {column} IS NULL', (default_value,))
+
+class RecordCache:
+    """
+    Cache em memória, por chave, na frente de um `Database`.
+
+    `get` só vai ao disco na primeira leitura de cada chave; quem grava chama
+    `put` (write-through) e quem apaga chama `invalidate`. Gravações feitas
+    por outro processo são percebidas pelo `data_version` do banco, conferido
+    no máximo a cada `check_interval` segundos; quando ele muda o cache
+    inteiro é descartado.
+    """
+
+    def __init__(self, db: Database, check_interval: float = 1.0):
+        self.db = db
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._records: dict = {}
+        self._generation = 0
+        self._version = None
+        self._checked = float('-inf')
+
+    def _validate(self) -> None:
+        now = monotonic()
+        if now - self._checked < self.check_interval:
+            return
+        self._checked = now
+        version = self.db.data_version()
+        if version != self._version:
+            self._version = version
+            self._records.clear()
+            self._generation += 1
+
+    def get(self, key, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._validate()
+            if key in self._records:
+                return self._records[key]
+            generation = self._generation
+        value = load()
+        with self._lock:
+            if generation == self._generation:
+                self._records[key] = value
+        return value
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._generation += 1
+            self._records[key] = value
+
+    def invalidate(self, key=None) -> None:
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._records.clear()
+            else:
+                self._records.pop(key, None)
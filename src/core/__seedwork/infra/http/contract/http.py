@@ -1,18 +1,33 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 import json
 from urllib.parse import urljoin
 
 class Response:
-    def __init__(self, status: int, data: str, content, url):
+    def __init__(self, status: int, data: str | None, content, url, encoding: str | None = None, file: str | None = None, headers=None):
         self.status = status
-        self.data = data
+        self._data = data
         self.content = content
         self.url = url
-    
+        self.encoding = encoding
+        self.file = file
+        self.headers = headers or {}
+
+    @property
+    def data(self) -> str:
+        if self._data is None:
+            if isinstance(self.content, str):
+                self._data = self.content
+            else:
+                self._data = (self.content or b'').decode(self.encoding or 'utf-8', errors='replace')
+        return self._data
+
     def text(self):
         return str(self.content)
-    
+
     def json(self):
+        if self._data is None and isinstance(self.content, (bytes, bytearray)):
+            return json.loads(self.content)
         return json.loads(self.data)
 
 class Http(ABC):
@@ -20,7 +35,19 @@ class Http(ABC):
     @abstractmethod
     def get(url: str, params=None, **kwargs) -> Response:
         raise NotImplementedError()
-    
+
     @abstractmethod
     def post(url, data=None, json=None, **kwargs) -> Response:
-        raise NotImplementedError()
\ No newline at end of file
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_file(url: str, file: str, params=None, **kwargs) -> Response:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def needs_browser(url: str) -> bool:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_many_browser(urls: list[str]) -> Iterator[tuple[str, bytes | None]]:
+        raise NotImplementedError()
@@ -1,228 +1,543 @@
+import os
+import requests
 import tldextract
-import cloudscraper
-from time import sleep
+from typing import Iterator
+from itertools import groupby
+from time import sleep, perf_counter
 from core.config.login_data import get_login
+from core.__seedwork.infra.log import get_logger
 from core.__seedwork.infra.http.contract.http import Http, Response
+from core.__seedwork.infra.http.http.session_pool import session_pool
+from core.__seedwork.infra.http.http.rate_limiter import rate_limiter
+from core.__seedwork.infra.http.http.cache import http_cache
+from core.__seedwork.infra.http.http.single_flight import single_flight
+from core.__seedwork.infra.http.http.circuit_breaker import circuit_breaker, backoff
+from core.__seedwork.infra.http.http.metrics import http_metrics, RequestSample
+from core.__seedwork.infra.http.http.clearance_refresher import clearance_refresher
 from core.config.request_data import get_request, delete_request, insert_request, RequestData
+from core.config.bypass_stats import get_bypass_stats, record_bypass
+from core.cloudflare.application.coordinator import bypass_coordinator
+from core.cloudflare.domain.challenge_entity import ChallengeKind
 from core.cloudflare.application.use_cases import (
-    IsCloudflareBlockingUseCase, 
+    ClassifyChallengeUseCase,
     BypassCloudflareUseCase, 
+    RenewCloudflareUseCase,
     BypassCloudflareNoCapchaUseCase, 
     BypassCloudflareNoCapchaFeachUseCase, 
-    IsCloudflareBlockingTimeOutUseCase, 
-    IsCloudflareEnableCookies,
-    IsCloudflareBlockingBadGateway,
     BypassCloudflareNoCapchaPostUseCase,
-    IsCloudflareAttention
+    BypassCloudflareNoCapchaFetchManyUseCase
 )
 
+log = get_logger('http')
+
+# Domínios que só respondem a fetch feito de dentro do navegador (aviso de cookies).
+browser_fetch_domains: set[str] = set()
+# Domínios cujas estatísticas de bypass já foram consultadas por needs_browser
+browser_fetch_checked: set[str] = set()
+
+# Ordem padrão das estratégias de bypass por tipo de página; as que já
+# funcionaram no domínio (bypass_stats) vêm antes, da mais rápida para a mais lenta.
+BYPASS_ORDER = {
+    ChallengeKind.CHALLENGE: ('cloudflare', 'nocaptcha'),
+    ChallengeKind.COOKIE_WALL: ('nocaptcha_fetch',),
+}
+DEFAULT_BYPASS_ORDER = ('nocaptcha',)
+
 class HttpService(Http):
+
+    @staticmethod
+    def _with_credentials(domain: str, headers=None, cookies=None):
+        for data in (get_request(domain), get_login(domain)):
+            if data:
+                if headers is not None:
+                    headers = {**headers, **data.headers}
+                else:
+                    headers = data.headers
+                if cookies is not None:
+                    cookies = {**cookies, **data.cookies}
+                else:
+                    cookies = data.cookies
+        return headers, cookies
     
     @staticmethod
-    def get(url: str, params=None, headers=None, cookies=None, timeout=None, **kwargs) -> Response:
+    def _session_cookies(domain: str, cookies=None) -> dict:
+        """Cookies que mudam o conteúdo da página: os do chamador e os do login, sem o cf_clearance."""
+        login = get_login(domain)
+        return {**(cookies or {}), **(login.cookies if login else {})}
+
+    @staticmethod
+    def _session_headers(domain: str, headers=None) -> dict:
+        """Cabeçalhos do chamador e os do login (Authorization, por exemplo)."""
+        login = get_login(domain)
+        return {**(headers or {}), **(login.headers if login else {})}
+
+    @staticmethod
+    def _solve_clearance(domain: str, generation: int):
+        """
+        Resolve o desafio uma vez por domínio (bypass_coordinator). Devolve
+        `(data, latência)`; a latência só vem para a thread que executou o
+        bypass e obteve cookie, e ela registra o resultado depois de ver o
+        status da nova tentativa. As que esperaram recebem `(data, None)`.
+        """
+        latency = None
+
+        def solve():
+            nonlocal latency
+            if get_request(domain):
+                delete_request(domain)
+                log.debug('Cookie antigo deletado')
+            session_pool.invalidate(domain)
+            log.debug('→ Chamando BypassCloudflareUseCase.execute()')
+            started = perf_counter()
+            data = None
+            try:
+                data = BypassCloudflareUseCase().execute(f'https://{domain}')
+            finally:
+                solved = bool(data and data.cloudflare_cookie_value)
+                if not solved:
+                    record_bypass(domain, ChallengeKind.CHALLENGE.value, 'cloudflare', False, 0.0)
+            if not solved:
+                return data
+            latency = perf_counter() - started
+            insert_request(RequestData(domain=domain, headers=data.user_agent, cookies=data.cloudflare_cookie_value, expires=data.expires))
+            session_pool.invalidate(domain)
+            return data
+
+        return bypass_coordinator.solve(domain, generation, solve), latency
+
+    @staticmethod
+    def _record_clearance(domain: str, latency: float | None, status: int | None) -> None:
+        """Resultado do cf_clearance obtido por esta thread, pelo status da requisição repetida com ele."""
+        if latency is None:
+            return
+        solved = status is not None and (status in range(200, 299) or status == 404)
+        record_bypass(domain, ChallengeKind.CHALLENGE.value, 'cloudflare', solved, latency if solved else 0.0)
+
+    @staticmethod
+    def _renew_clearance(domain: str, generation: int):
+        """
+        Renovação em segundo plano: o cookie atual continua valendo para os
+        downloads enquanto o navegador trabalha e só é trocado se vier um novo
+        com expiração mais longa.
+        """
+        def renew():
+            current = get_request(domain)
+            data = RenewCloudflareUseCase().execute(f'https://{domain}')
+            if not (data and data.cloudflare_cookie_value):
+                log.debug('Renovação de %s não trouxe cookie; mantendo o atual', domain)
+                return data
+            if current and current.expires and (not data.expires or data.expires <= current.expires):
+                log.debug('cf_clearance de %s não avançou; mantendo o atual', domain)
+                return data
+            insert_request(RequestData(domain=domain, headers=data.user_agent, cookies=data.cloudflare_cookie_value, expires=data.expires))
+            session_pool.invalidate(domain)
+            return data
+        return bypass_coordinator.solve(domain, generation, renew)
+
+    @staticmethod
+    def _proven_strategies(domain: str, kind: ChallengeKind) -> list[str]:
+        """Estratégias que já funcionaram no domínio contra esse tipo de bloqueio (ao menos metade das vezes), da mais rápida para a mais lenta."""
+        proven = [s for s in get_bypass_stats(domain, kind.value) if s.successes and s.success_rate >= 0.5]
+        return [s.strategy for s in sorted(proven, key=lambda s: s.mean_latency)]
+
+    @staticmethod
+    def _bypass_order(domain: str, kind: ChallengeKind) -> list[str]:
+        order = HttpService._proven_strategies(domain, kind)
+        return order + [s for s in BYPASS_ORDER.get(kind, DEFAULT_BYPASS_ORDER) if s not in order]
+
+    @staticmethod
+    def _browser_bypass(strategy: str, domain: str, url: str):
+        if strategy == 'nocaptcha_fetch':
+            return BypassCloudflareNoCapchaFeachUseCase().execute(f'https://{domain}', url) or None
+        content = BypassCloudflareNoCapchaUseCase().execute(url)
+        if content and ClassifyChallengeUseCase().execute(content) not in (ChallengeKind.BAD_GATEWAY, ChallengeKind.TIMEOUT):
+            return content
+        return None
+
+    @staticmethod
+    def _is_memoizable(response: Response) -> bool:
+        content_type = response.headers.get('Content-Type', '')
+        return response.status in range(200, 299) and bool(content_type) and not content_type.startswith('image/')
+
+    @staticmethod
+    def get(url: str, params=None, headers=None, cookies=None, timeout=None, cache=False, cache_ttl=None, **kwargs) -> Response:
+        def fetch():
+            with http_metrics.track('GET', url) as sample:
+                return HttpService._get(url, params=params, headers=headers, cookies=cookies, timeout=timeout, cache=cache, cache_ttl=cache_ttl, sample=sample, **kwargs)
+
+        # Requisições iguais em andamento são juntadas; o resultado só é
+        # reaproveitado depois disso por quem pediu cache.
+        key = single_flight.key(url, params, headers, cookies, timeout, cache, cache_ttl, kwargs)
+        return single_flight.do(key, fetch, memo=HttpService._is_memoizable if cache else None)
+
+    @staticmethod
+    def _get(url: str, params=None, headers=None, cookies=None, timeout=None, cache=False, cache_ttl=None, sample: RequestSample | None = None, **kwargs) -> Response:
         status = 0
         count = 0
         extract = tldextract.extract(url)
         domain = f"{extract.domain}.{extract.suffix}"
+        sample = sample or RequestSample('GET', domain)
+        clearance_refresher.watch(domain)
 
-        scraper = cloudscraper.create_scraper(    
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            }    
-        )
+        cache_key = http_cache.key('GET', url, params, cookies=HttpService._session_cookies(domain, cookies), headers=HttpService._session_headers(domain, headers)) if cache else None
+        cached = http_cache.lookup(cache_key) if cache else None
+        if cached and not cached.has_validators() and http_cache.is_fresh(cached, cache_ttl):
+            log.info('GET CACHE %s', url)
+            sample.cache = 'hit'
+            sample.done(cached.status)
+            return cached.response(url)
      
-        while(status not in range(200, 299) and count <= 10):
-            count += 1
+        # A sonda do meio-aberto sempre é resolvida: a de uma tentativa que
+        # terminou sem success/failure conta como falha antes da próxima
+        # tentativa ou na saída, seja por retorno, erro ou fim das tentativas.
+        probe = None
+        # Latência do cf_clearance obtido por esta thread, registrado quando
+        # sai o status da próxima tentativa
+        clearance = None
+        try:
+            while(status not in range(200, 299) and count <= 10):
+                count += 1
+                sample.retries = count - 1
 
-            request_data = get_request(domain)
+                generation = bypass_coordinator.generation(domain)
+                headers, cookies = HttpService._with_credentials(domain, headers, cookies)
+                request_headers = {**(headers or {}), **cached.conditional_headers()} if cached else headers
 
-            if request_data:
-                re = request_data
-                if headers is not None:
-                    headers = {**headers, **re.headers}
-                else:
-                    headers = re.headers
-                if cookies is not None:
-                    cookies = {**cookies, **re.cookies}
-                else:
-                    cookies = re.cookies
-            
-            login_data = get_login(domain)
-
-            if login_data:
-                re = login_data
-                if headers is not None:
-                    headers = {**headers, **re.headers}
-                else:
-                    headers = re.headers
-                if cookies is not None:
-                    cookies = {**cookies, **re.cookies}
-                else:
-                    cookies = re.cookies
+                circuit_breaker.release(domain, probe)
+                probe = circuit_breaker.before_request(domain)
+                rate_limiter.acquire(domain)
+                try:
+                    started = perf_counter()
+                    with session_pool.session(url) as scraper:
+                        response = scraper.get(url, params=params, headers=request_headers, cookies=cookies, timeout=timeout, **kwargs)
+                    sample.exchange(response, perf_counter() - started)
+                except requests.exceptions.RequestException as e:
+                    circuit_breaker.failure(domain)
+                    log.warning('GET ERROR %s: %s', url, e)
+                    if count > 10:
+                        raise
+                    sleep(backoff(count))
+                    continue
+                status = response.status_code
+                HttpService._record_clearance(domain, clearance, status)
+                clearance = None
 
-            response = scraper.get(url, params=params, headers=headers, cookies=cookies, timeout=timeout, **kwargs)
-            status = response.status_code
+                if status == 304 and cached:
+                    rate_limiter.success(domain)
+                    circuit_breaker.success(domain)
+                    http_cache.refresh(cache_key)
+                    sample.cache = 'revalidated'
+                    sample.done(status)
+                    log.info('GET %s %s', status, url)
+                    return cached.response(url)
 
-            if response.status_code == 403:
-                print(f"<stroke style='color:#add8e6;'>[REQUEST]:</stroke> <span style='color:#add8e6;'>GET</span> <span style='color:red;'>{status}</span> <a href='#'>{url}</a>")
-                print(f"[DEBUG] ========== INÍCIO BYPASS CLOUDFLARE (403) ==========")
-                print(f"[DEBUG] URL: {url}")
-                print(f"[DEBUG] Domain: {domain}")
+                if response.status_code == 403:
+                    log.warning('GET %s %s', status, url)
+                    log.debug('========== INÍCIO BYPASS CLOUDFLARE (403) ==========')
+                    log.debug('URL: %s', url)
+                    log.debug('Domain: %s', domain)
                 
-                if IsCloudflareBlockingUseCase().execute(response.text):
-                        print(f"[DEBUG] ✓ IsCloudflareBlockingUseCase DETECTOU bloqueio")
-                        request_data = get_request(domain)
-                        if(request_data):
-                            delete_request(domain)
-                            print(f"[DEBUG] Cookie antigo deletado")
-                        
-                        print(f"[DEBUG] → Chamando BypassCloudflareUseCase.execute()")
-                        data = BypassCloudflareUseCase().execute(f'https://{domain}')
-                        
-                        if(data.cloudflare_cookie_value):
-                            print(f"[DEBUG] ✓ Cookie cf_clearance obtido via BypassCloudflareUseCase")
-                            insert_request(RequestData(domain=domain, headers=data.user_agent, cookies=data.cloudflare_cookie_value))
-                            print(f"[DEBUG] Cookie salvo, voltando ao loop para nova tentativa")
-                        else:
-                            print(f"[DEBUG] ✗ Nenhum cookie obtido, tentando BypassCloudflareNoCapchaUseCase")
-                            print(f"[DEBUG] → Chamando BypassCloudflareNoCapchaUseCase.execute()")
-                            content = BypassCloudflareNoCapchaUseCase().execute(url)
-                            if content and not IsCloudflareBlockingBadGateway().execute(content):
-                                print(f"[DEBUG] ✓ Conteúdo obtido via BypassCloudflareNoCapchaUseCase - Retornando Response")
-                                return Response(200, 'a', content, url)
-                            else:
-                                print(f"[DEBUG] ✗ BypassCloudflareNoCapchaUseCase falhou ou retornou Bad Gateway")
-                                
-                elif IsCloudflareEnableCookies().execute(response.text):
-                    print(f"[DEBUG] ✓ IsCloudflareEnableCookies DETECTOU problema de cookies")
-                    print(f"[DEBUG] → Chamando BypassCloudflareNoCapchaFeachUseCase.execute()")
-                    content = BypassCloudflareNoCapchaFeachUseCase().execute(f'https://{domain}', url)
-                    if content:
-                        print(f"[DEBUG] ✓ Conteúdo obtido via BypassCloudflareNoCapchaFeachUseCase - Retornando Response")
-                        return Response(200, 'a', content, url)
+                    kind = ClassifyChallengeUseCase().execute(response.content)
+                    log.debug('Página classificada como %s', kind.value)
+                    for strategy in HttpService._bypass_order(domain, kind):
+                        log.debug('→ Tentando estratégia %s', strategy)
+                        started = perf_counter()
+                        if strategy == 'cloudflare':
+                            data, clearance = HttpService._solve_clearance(domain, generation)
+                            if data and data.cloudflare_cookie_value:
+                                log.debug('✓ Cookie cf_clearance obtido, voltando ao loop para nova tentativa')
+                                sample.bypass = 'cloudflare'
+                                break
+                            log.debug('✗ Nenhum cookie obtido')
+                            continue
+                        content = HttpService._browser_bypass(strategy, domain, url)
+                        record_bypass(domain, kind.value, strategy, content is not None, perf_counter() - started)
+                        if content is not None:
+                            log.debug('✓ Conteúdo obtido via %s - Retornando Response', strategy)
+                            if strategy == 'nocaptcha_fetch':
+                                browser_fetch_domains.add(domain)
+                            sample.bypass = strategy
+                            sample.done(200, content)
+                            circuit_breaker.success(domain)
+                            return Response(200, None, content, url)
+                        log.debug('✗ Estratégia %s falhou', strategy)
                     else:
-                        print(f"[DEBUG] ✗ BypassCloudflareNoCapchaFeachUseCase retornou None")
-                else:
-                    print(f"[DEBUG] ✗ Nenhum detector específico ativado, usando fallback")
-                    print(f"[DEBUG] → Chamando BypassCloudflareNoCapchaUseCase.execute() [FALLBACK]")
-                    content = BypassCloudflareNoCapchaUseCase().execute(url)
-                    if content and not IsCloudflareBlockingTimeOutUseCase().execute(content):
-                        print(f"[DEBUG] ✓ Conteúdo obtido via BypassCloudflareNoCapchaUseCase (fallback) - Retornando Response")
-                        return Response(200, content, content, url)
-                    else:
-                        print(f"[DEBUG] ✗ BypassCloudflareNoCapchaUseCase (fallback) falhou ou timeout")
-                        print(f"[DEBUG] Aguardando 30 segundos...")
-                        sleep(30)
+                        delay = backoff(count, base=2.0)
+                        log.debug('Aguardando %.1f segundos...', delay)
+                        sleep(delay)
                 
-                print(f"[DEBUG] ========== FIM BYPASS CLOUDFLARE (403) ==========")
-                print(f"[DEBUG] Voltando ao loop (tentativa {count}/10)")
-                print("")
-            elif status not in range(200, 299) and not 403 and not 429:
-                print(f"<stroke style='color:#add8e6;'>[REQUEST]:</stroke> <span style='color:#add8e6;'>GET</span> <span style='color:red;'>{status}</span> <a href='#'>{url}</a>")
-                sleep(1)
-            elif status == 429:
-                print(f"<stroke style='color:#add8e6;'>[REQUEST]:</stroke> <span style='color:#add8e6;'>GET</span> <span style='color:#FFFF00;'>{status}</span> <a href='#'>{url}</a>")
-                sleep(60)                
-            elif status == 301 and 'Location' in response.headers or status == 302 and 'Location' in response.headers:
-                print(f"<stroke style='color:#add8e6;'>[REQUEST]:</stroke> <span style='color:#add8e6;'>GET</span> <span style='color:#add8e6;'>{status}</span> <a href='#'>{url}</a>")
-                location = response.headers['Location']
-                if(location.startswith('https://')):
-                    new_url = location
-                else:
-                    new_url = f'https://{domain}{response.headers['Location']}'
-                response = scraper.get(new_url, params=params, headers=headers, cookies=cookies, timeout=None, **kwargs)
-                status = response.status_code
-            if status in range(200, 299) or status == 404:
-                print(f"<stroke style='color:#add8e6;'>[REQUEST]:</stroke> <span style='color:#add8e6;'>GET</span> <span style='color:green;'>{status}</span> <a href='#'>{url}</a>")
-                return Response(response.status_code, response.text, response.content, url)
+                    log.debug('========== FIM BYPASS CLOUDFLARE (403) ==========')
+                    log.debug('Voltando ao loop (tentativa %s/10)', count)
+                elif status == 429:
+                    log.warning('GET %s %s', status, url)
+                    rate_limiter.throttle(domain, response.headers.get('Retry-After'))
+                elif status == 301 and 'Location' in response.headers or status == 302 and 'Location' in response.headers:
+                    log.info('GET %s %s', status, url)
+                    location = response.headers['Location']
+                    if(location.startswith('https://')):
+                        new_url = location
+                    else:
+                        new_url = f'https://{domain}{response.headers['Location']}'
+                    rate_limiter.acquire(domain)
+                    started = perf_counter()
+                    with session_pool.session(new_url) as scraper:
+                        response = scraper.get(new_url, params=params, headers=headers, cookies=cookies, timeout=None, **kwargs)
+                    sample.exchange(response, perf_counter() - started)
+                    status = response.status_code
+                elif status not in range(200, 299) and status != 404:
+                    log.warning('GET %s %s', status, url)
+                    if status >= 500:
+                        circuit_breaker.failure(domain)
+                    sleep(backoff(count))
+                if status in range(200, 299) or status == 404:
+                    rate_limiter.success(domain)
+                    circuit_breaker.success(domain)
+                    sample.done(status, response.content)
+                    if cache and status in range(200, 299) and not response.headers.get('Content-Type', '').startswith('image/'):
+                        http_cache.store(cache_key, url, status, response.content, response.encoding, response.headers)
+                    log.info('GET %s %s', status, url)
+                    return Response(response.status_code, None, response.content, url, response.encoding, headers=response.headers)
 
-        raise Exception(f"Failed to fetch the URL STATUS: {status}")
+            raise Exception(f"Failed to fetch the URL STATUS: {status}")
+        finally:
+            # Cookie obtido sem nenhuma resposta depois (erro ou fim das tentativas)
+            HttpService._record_clearance(domain, clearance, None)
+            circuit_breaker.release(domain, probe)
 
     
     @staticmethod
-    def post(url, data=None, json=None, headers=None, cookies=None, timeout=None, **kwargs) -> Response:
+    def post(url, data=None, json=None, headers=None, cookies=None, timeout=None, cache=False, cache_ttl=None, **kwargs) -> Response:
+        with http_metrics.track('POST', url) as sample:
+            return HttpService._post(url, data=data, json=json, headers=headers, cookies=cookies, timeout=timeout, cache=cache, cache_ttl=cache_ttl, sample=sample, **kwargs)
+
+    @staticmethod
+    def _post(url, data=None, json=None, headers=None, cookies=None, timeout=None, cache=False, cache_ttl=None, sample: RequestSample | None = None, **kwargs) -> Response:
         status = 0
         count = 0
         extract = tldextract.extract(url)
         domain = f"{extract.domain}.{extract.suffix}"
+        sample = sample or RequestSample('POST', domain)
+        clearance_refresher.watch(domain)
 
-        scraper = cloudscraper.create_scraper(    
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            }    
-        )
-
-        while(status not in range(200, 299) and count <= 10):
-            count += 1
-
-            request_data = get_request(domain)
-            if(request_data):
-                re = request_data
-                if headers != None: headers = headers | re.headers
-                else: headers = re.headers
-                if cookies != None: cookies = cookies | re.cookies
-                else: cookies = re.cookies
-            
-            login_data = get_login(domain)
-
-            if login_data:
-                re = login_data
-                if headers is not None:
-                    headers = {**headers, **re.headers}
-                else:
-                    headers = re.headers
-                if cookies is not None:
-                    cookies = {**cookies, **re.cookies}
-                else:
-                    cookies = re.cookies
+        cache_key = http_cache.key('POST', url, data=data, json_data=json, cookies=HttpService._session_cookies(domain, cookies), headers=HttpService._session_headers(domain, headers)) if cache else None
+        cached = http_cache.lookup(cache_key) if cache else None
+        if cached and not cached.has_validators() and http_cache.is_fresh(cached, cache_ttl):
+            log.info('POST CACHE %s', url)
+            sample.cache = 'hit'
+            sample.done(cached.status)
+            return cached.response(url)
+
+        probe = None
+        # Latência do cf_clearance obtido por esta thread, registrado quando
+        # sai o status da próxima tentativa
+        clearance = None
+        try:
+            while(status not in range(200, 299) and count <= 10):
+                count += 1
+                sample.retries = count - 1
+
+                generation = bypass_coordinator.generation(domain)
+                headers, cookies = HttpService._with_credentials(domain, headers, cookies)
+                request_headers = {**(headers or {}), **cached.conditional_headers()} if cached else headers
 
-            response = scraper.post(url, data=data, json=json, headers=headers, cookies=cookies, timeout=timeout, **kwargs)
-            status = response.status_code
+                circuit_breaker.release(domain, probe)
+                probe = circuit_breaker.before_request(domain)
+                rate_limiter.acquire(domain)
+                try:
+                    started = perf_counter()
+                    with session_pool.session(url) as scraper:
+                        response = scraper.post(url, data=data, json=json, headers=request_headers, cookies=cookies, timeout=timeout, **kwargs)
+                    sample.exchange(response, perf_counter() - started)
+                except requests.exceptions.RequestException as e:
+                    circuit_breaker.failure(domain)
+                    log.warning('POST ERROR %s: %s', url, e)
+                    if count > 10:
+                        raise
+                    sleep(backoff(count))
+                    continue
+                status = response.status_code
+                HttpService._record_clearance(domain, clearance, status)
+                clearance = None
+
+                if status == 304 and cached:
+                    rate_limiter.success(domain)
+                    circuit_breaker.success(domain)
+                    http_cache.refresh(cache_key)
+                    sample.cache = 'revalidated'
+                    sample.done(status)
+                    log.info('POST %s %s', status, url)
+                    return cached.response(url)
 
-            if response.status_code == 403:
-                print(f"<stroke style='color:#add8e6;'>[REQUEST] POST:</stroke> <span style='color:#add8e6;'>POST</span> <span style='color:#FFFF00;'>{status}</span> <a href='#'>{url}</a>")
-                print(f"[DEBUG POST] ========== INÍCIO BYPASS CLOUDFLARE (403) ==========")
-                print(f"[DEBUG POST] URL: {url}")
-                print(f"[DEBUG POST] Domain: {domain}")
+                if response.status_code == 403:
+                    log.warning('POST %s %s', status, url)
+                    log.debug('POST ========== INÍCIO BYPASS CLOUDFLARE (403) ==========')
+                    log.debug('POST URL: %s', url)
+                    log.debug('POST Domain: %s', domain)
                 
-                if IsCloudflareBlockingUseCase().execute(response.text):
-                    print(f"[DEBUG POST] ✓ IsCloudflareBlockingUseCase DETECTOU bloqueio")
-                    print(f"[DEBUG POST] → Chamando BypassCloudflareUseCase.execute()")
-                    data = BypassCloudflareUseCase().execute(f'https://{domain}')
-                    if data and data.cloudflare_cookie_value:
-                        print(f"[DEBUG POST] ✓ Cookie cf_clearance obtido, salvando...")
-                        insert_request(RequestData(domain=domain, headers=data.user_agent, cookies=data.cloudflare_cookie_value))
-                        print(f"[DEBUG POST] Cookie salvo, voltando ao loop")
-                    else:
-                        print(f"[DEBUG POST] ✗ Nenhum cookie obtido via BypassCloudflareUseCase")
+                    kind = ClassifyChallengeUseCase().execute(response.content)
+                    log.debug('POST Página classificada como %s', kind.value)
+                    if kind == ChallengeKind.CHALLENGE:
+                        log.debug('POST ✓ Desafio do Cloudflare detectado')
+                        data, clearance = HttpService._solve_clearance(domain, generation)
+                        if data and data.cloudflare_cookie_value:
+                            log.debug('POST ✓ Cookie cf_clearance obtido, salvando...')
+                            sample.bypass = 'cloudflare'
+                            log.debug('POST Cookie salvo, voltando ao loop')
+                        else:
+                            log.debug('POST ✗ Nenhum cookie obtido via BypassCloudflareUseCase')
                         
-                elif IsCloudflareEnableCookies().execute(response.text) or IsCloudflareAttention().execute(response.text):
-                    print(f"[DEBUG POST] ✓ IsCloudflareEnableCookies ou IsCloudflareAttention DETECTOU problema")
-                    print(f"[DEBUG POST] → Chamando BypassCloudflareNoCapchaPostUseCase.execute()")
-                    content = BypassCloudflareNoCapchaPostUseCase().execute(f'https://{domain}', url)
-                    if content:
-                        print(f"[DEBUG POST] ✓ Conteúdo obtido via BypassCloudflareNoCapchaPostUseCase - Retornando Response")
-                        return Response(200, 'a', content, url)
+                    elif kind in (ChallengeKind.COOKIE_WALL, ChallengeKind.ATTENTION):
+                        log.debug('POST ✓ Aviso de cookies ou Attention Required do Cloudflare detectado')
+                        log.debug('POST → Chamando BypassCloudflareNoCapchaPostUseCase.execute()')
+                        content = BypassCloudflareNoCapchaPostUseCase().execute(f'https://{domain}', url)
+                        if content:
+                            log.debug('POST ✓ Conteúdo obtido via BypassCloudflareNoCapchaPostUseCase - Retornando Response')
+                            sample.bypass = 'nocaptcha_post'
+                            sample.done(200, content)
+                            circuit_breaker.success(domain)
+                            return Response(200, None, content, url)
+                        else:
+                            log.debug('POST ✗ BypassCloudflareNoCapchaPostUseCase retornou None')
                     else:
-                        print(f"[DEBUG POST] ✗ BypassCloudflareNoCapchaPostUseCase retornou None")
-                else:
-                    print(f"[DEBUG POST] ✗ Nenhum detector específico ativado")
+                        log.debug('POST ✗ Nenhum detector específico ativado')
                 
-                print(f"[DEBUG POST] ========== FIM BYPASS CLOUDFLARE (403) ==========")
-                print(f"[DEBUG POST] Voltando ao loop (tentativa {count}/10)")
-                print("")
-            elif status not in range(200, 299) and not 403 and not 429:
-                print(f"<stroke style='color:#add8e6;'>[REQUEST] POST:</stroke> <span style='color:#add8e6;'>POST</span> <span style='color:red;'>{status}</span> <a href='#'>{url}</a>")
-                sleep(1)
-            elif status == 429:
-                print(f"<stroke style='color:#add8e6;'>[REQUEST] POST:</stroke> <span style='color:#add8e6;'>POST</span> <span style='color:#FFFF00;'>{status}</span> <a href='#'>{url}</a>")
-                sleep(60)
-            else:
-                print(f"<stroke style='color:#add8e6;'>[REQUEST] POST:</stroke> <span style='color:#add8e6;'>POST</span> <span style='color:green;'>{status}</span> <a href='#'>{url}</a>")
-                return Response(response.status_code, response.text, response.content, url)
-
-        raise Exception("Failed to fetch the URL")
\ No newline at end of file
+                    log.debug('POST ========== FIM BYPASS CLOUDFLARE (403) ==========')
+                    log.debug('POST Voltando ao loop (tentativa %s/10)', count)
+                elif status == 429:
+                    log.warning('POST %s %s', status, url)
+                    rate_limiter.throttle(domain, response.headers.get('Retry-After'))
+                elif status not in range(200, 299):
+                    log.warning('POST %s %s', status, url)
+                    if status >= 500:
+                        circuit_breaker.failure(domain)
+                    sleep(backoff(count))
+                else:
+                    rate_limiter.success(domain)
+                    circuit_breaker.success(domain)
+                    sample.done(status, response.content)
+                    if cache and status in range(200, 299):
+                        http_cache.store(cache_key, url, status, response.content, response.encoding, response.headers)
+                    log.info('POST %s %s', status, url)
+                    return Response(response.status_code, None, response.content, url, response.encoding, headers=response.headers)
+
+            raise Exception("Failed to fetch the URL")
+        finally:
+            # Cookie obtido sem nenhuma resposta depois (erro ou fim das tentativas)
+            HttpService._record_clearance(domain, clearance, None)
+            circuit_breaker.release(domain, probe)
+
+    @staticmethod
+    def get_file(url: str, file: str, params=None, headers=None, cookies=None, timeout=None, chunk_size: int = 64 * 1024, **kwargs) -> Response:
+        extract = tldextract.extract(url)
+        domain = f"{extract.domain}.{extract.suffix}"
+        part = f'{file}.part'
+        clearance_refresher.watch(domain)
+
+        request_headers, request_cookies = HttpService._with_credentials(domain, headers, cookies)
+        count = 0
+        probe = None
+        try:
+            while True:
+                count += 1
+                probe = circuit_breaker.before_request(domain)
+                rate_limiter.acquire(domain)
+                try:
+                    with http_metrics.track('GET', url) as sample:
+                        sample.retries = count - 1
+                        started = perf_counter()
+                        with session_pool.session(url) as scraper:
+                            with scraper.get(url, params=params, headers=request_headers, cookies=request_cookies, timeout=timeout, stream=True, **kwargs) as response:
+                                sample.exchange(response, perf_counter() - started)
+                                if response.status_code not in range(200, 299):
+                                    break
+                                try:
+                                    with open(part, 'wb') as f:
+                                        for chunk in response.iter_content(chunk_size):
+                                            f.write(chunk)
+                                        sample.bytes = f.tell()
+                                except Exception:
+                                    if os.path.exists(part):
+                                        os.remove(part)
+                                    raise
+                                sample.exchange(response, perf_counter() - started)
+                                os.replace(part, file)
+                                rate_limiter.success(domain)
+                                circuit_breaker.success(domain)
+                                log.info('GET %s %s', response.status_code, url)
+                                return Response(response.status_code, None, None, url, response.encoding, file=file, headers=response.headers)
+                except requests.exceptions.RequestException as e:
+                    circuit_breaker.failure(domain)
+                    log.warning('GET ERROR %s: %s', url, e)
+                    if count > 10:
+                        raise
+                    sleep(backoff(count))
+        finally:
+            # Inclusive quando a resposta não é 2xx e o get assume a partir daqui
+            circuit_breaker.release(domain, probe)
+
+        # Bloqueios, 429 e erros do servidor seguem o tratamento completo do get
+        response = HttpService.get(url, params=params, headers=headers, cookies=cookies, timeout=timeout, **kwargs)
+        if response.status not in range(200, 299):
+            # O get devolve 404 sem erro; para um arquivo isso é uma falha
+            raise Exception(f"Failed to fetch the URL STATUS: {response.status}")
+        content = response.content.encode() if isinstance(response.content, str) else response.content
+        with open(part, 'wb') as f:
+            f.write(content or b'')
+        os.replace(part, file)
+        return Response(response.status, None, None, url, response.encoding, file=file, headers=response.headers)
+
+    @staticmethod
+    def needs_browser(url: str) -> bool:
+        # Páginas que não são http(s), como arquivos locais (file://), nunca passam pelo navegador
+        if not url.startswith(('http://', 'https://')):
+            return False
+        extract = tldextract.extract(url)
+        domain = f"{extract.domain}.{extract.suffix}"
+        if domain in browser_fetch_domains:
+            return True
+        # As estatísticas são lidas uma vez por domínio; um nocaptcha_fetch
+        # que funcionar depois entra direto em browser_fetch_domains
+        if domain in browser_fetch_checked:
+            return False
+        browser_fetch_checked.add(domain)
+        proven = HttpService._proven_strategies(domain, ChallengeKind.COOKIE_WALL)
+        if proven and proven[0] == 'nocaptcha_fetch':
+            browser_fetch_domains.add(domain)
+            return True
+        return False
+
+    @staticmethod
+    def get_many_browser(urls: list[str]) -> Iterator[tuple[str, bytes | None]]:
+        """
+        Busca várias URLs pelo navegador, abrindo uma única sessão para cada
+        sequência de URLs do mesmo domínio. Devolve `(url, conteúdo)` na ordem
+        pedida conforme ficam prontas; conteúdo `None` indica que a URL falhou.
+        """
+        def get_domain(url: str) -> str:
+            extract = tldextract.extract(url)
+            return f"{extract.domain}.{extract.suffix}"
+
+        for domain, group in groupby(urls, key=get_domain):
+            clearance_refresher.watch(domain)
+            probe = circuit_breaker.before_request(domain)
+            rate_limiter.acquire(domain)
+            received = False
+            try:
+                for url, content in BypassCloudflareNoCapchaFetchManyUseCase().execute(f'https://{domain}', list(group)):
+                    with http_metrics.track('GET', url) as sample:
+                        sample.bypass = 'nocaptcha_fetch_many'
+                        if content is None:
+                            sample.error = True
+                        else:
+                            received = True
+                            sample.done(200, content)
+                    yield url, content
+                if received:
+                    circuit_breaker.success(domain)
+                else:
+                    circuit_breaker.failure(domain)
+            finally:
+                # Erro no navegador ou consumidor que parou no meio
+                circuit_breaker.release(domain, probe)
+
+clearance_refresher.solve = HttpService._renew_clearance
@@ -0,0 +1,140 @@
+import os
+import json
+import hashlib
+import threading
+from time import time
+from pathlib import Path
+from dataclasses import dataclass
+from platformdirs import user_cache_dir
+from core.__seedwork.infra.http.contract.http import Response
+from core.__seedwork.infra.database import Database
+
+cache_path = Path(user_cache_dir('pyteste')) / 'http'
+
+# Cabeçalhos da requisição que mudam o corpo da resposta
+VARY_HEADERS = ('authorization', 'accept', 'referer', 'x-requested-with')
+
+@dataclass
+class CacheEntry:
+    key: str
+    status: int
+    encoding: str | None
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+    file: str
+
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def response(self, url: str) -> Response:
+        with open(self.file, 'rb') as f:
+            content = f.read()
+        return Response(self.status, None, content, url, self.encoding)
+
+class HttpCache:
+    """
+    Cache HTTP em disco para requisições de metadados (HTML/JSON).
+
+    Os corpos ficam em arquivos e o índice em SQLite, no diretório de cache do
+    usuário. Entradas com ETag/Last-Modified são revalidadas com requisições
+    condicionais; as demais valem por `ttl` segundos. Quando o total passa de
+    `max_size` bytes, as entradas acessadas há mais tempo são removidas.
+    """
+
+    def __init__(self, path: Path = cache_path, max_size: int = 256 * 1024 * 1024, ttl: float = 600.0):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.ttl = ttl
+        self.db_path = self.path / 'index.db'
+        self.db = Database(self.db_path, self.init_db)
+        self._lock = threading.Lock()
+
+    def init_db(self, conn):
+        conn.execute('''CREATE TABLE IF NOT EXISTS entries (
+                            key TEXT PRIMARY KEY,
+                            url TEXT,
+                            status INTEGER,
+                            encoding TEXT,
+                            etag TEXT,
+                            last_modified TEXT,
+                            stored_at REAL,
+                            accessed_at REAL,
+                            size INTEGER
+                          )''')
+
+    def key(self, method: str, url: str, params=None, data=None, json_data=None, cookies=None, headers=None) -> str:
+        # Os cookies e os cabeçalhos que mudam a resposta entram na chave para
+        # que uma página vista antes do login (ou pedida como HTML em vez de
+        # JSON) não continue sendo servida depois.
+        headers = {name.lower(): str(value) for name, value in (headers or {}).items() if name.lower() in VARY_HEADERS}
+        raw = json.dumps([method, url, params, data, json_data, cookies or {}, headers], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _file(self, key: str) -> str:
+        return str(self.path / f'{key}.body')
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        row = self.db.fetchone('SELECT status, encoding, etag, last_modified, stored_at FROM entries WHERE key = ?', (key,))
+        if row is not None:
+            self.db.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (time(), key))
+        if row is None or not os.path.exists(self._file(key)):
+            return None
+        return CacheEntry(key, row[0], row[1], row[2], row[3], row[4], self._file(key))
+
+    def is_fresh(self, entry: CacheEntry, ttl: float | None = None) -> bool:
+        return time() - entry.stored_at < (self.ttl if ttl is None else ttl)
+
+    def store(self, key: str, url: str, status: int, content: bytes, encoding: str | None = None, headers=None) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        headers = headers or {}
+        if isinstance(content, str):
+            content = content.encode(encoding or 'utf-8')
+        part = f'{self._file(key)}.part'
+        with open(part, 'wb') as f:
+            f.write(content)
+        os.replace(part, self._file(key))
+        now = time()
+        with self._lock, self.db.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                           (key, url, status, encoding, headers.get('ETag'), headers.get('Last-Modified'), now, now, len(content)))
+            self._evict(cursor)
+
+    def refresh(self, key: str) -> None:
+        self.db.execute('UPDATE entries SET stored_at = ? WHERE key = ?', (time(), key))
+
+    def _remove_file(self, key: str) -> None:
+        try:
+            os.remove(self._file(key))
+        except OSError:
+            pass
+
+    def _evict(self, cursor) -> None:
+        cursor.execute('SELECT COALESCE(SUM(size), 0) FROM entries')
+        total = cursor.fetchone()[0]
+        if total <= self.max_size:
+            return
+        cursor.execute('SELECT key, size FROM entries ORDER BY accessed_at ASC')
+        for key, size in cursor.fetchall():
+            if total <= self.max_size:
+                break
+            cursor.execute('DELETE FROM entries WHERE key = ?', (key,))
+            self._remove_file(key)
+            total -= size
+
+    def clear(self) -> None:
+        with self._lock, self.db.transaction() as conn:
+            for (key,) in conn.execute('SELECT key FROM entries').fetchall():
+                self._remove_file(key)
+            conn.execute('DELETE FROM entries')
+
+http_cache = HttpCache()
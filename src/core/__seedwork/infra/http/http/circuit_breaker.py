@@ -0,0 +1,118 @@
+import random
+import threading
+from time import monotonic
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class CircuitOpenError(Exception):
+    def __init__(self, domain: str):
+        super().__init__(f'Circuit open for {domain}: site is failing, request skipped')
+        self.domain = domain
+
+class _Circuit:
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.probe = None
+        self.probe_started = 0.0
+
+class CircuitBreaker:
+    """
+    Disjuntor por domínio compartilhado entre as threads.
+
+    Depois de `failure_threshold` falhas seguidas o domínio fica aberto por
+    `reset_timeout` segundos; nesse tempo as requisições esperam no máximo
+    `park_timeout` segundos e depois falham com CircuitOpenError. Passado o
+    intervalo, uma única requisição de teste (meio-aberto) decide se o circuito
+    fecha de novo ou volta a abrir.
+
+    `before_request` devolve um identificador quando a chamada virou a sonda;
+    quem chamou deve passá-lo a `release` ao fim da tentativa (num finally),
+    que conta como falha uma sonda que terminou sem `success` nem `failure`.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, park_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.park_timeout = park_timeout
+        self._condition = threading.Condition()
+        self._circuits: dict[str, _Circuit] = {}
+        self._probes = 0
+
+    def _circuit(self, domain: str) -> _Circuit:
+        circuit = self._circuits.get(domain)
+        if circuit is None:
+            circuit = _Circuit()
+            self._circuits[domain] = circuit
+        return circuit
+
+    def state(self, domain: str) -> str:
+        with self._condition:
+            return self._circuit(domain).state
+
+    def _start_probe(self, circuit: _Circuit, now: float) -> int:
+        self._probes += 1
+        circuit.state = HALF_OPEN
+        circuit.probing = True
+        circuit.probe = self._probes
+        circuit.probe_started = now
+        return circuit.probe
+
+    def before_request(self, domain: str, wait: bool = True) -> int | None:
+        deadline = monotonic() + (self.park_timeout if wait else 0)
+        with self._condition:
+            circuit = self._circuit(domain)
+            while True:
+                now = monotonic()
+                if circuit.state == CLOSED:
+                    return None
+                if circuit.state == OPEN:
+                    remaining = self.reset_timeout - (now - circuit.opened_at)
+                    if remaining <= 0:
+                        return self._start_probe(circuit, now)
+                elif not circuit.probing or now - circuit.probe_started > self.park_timeout:
+                    return self._start_probe(circuit, now)
+                else:
+                    remaining = deadline - now
+                if now >= deadline:
+                    raise CircuitOpenError(domain)
+                self._condition.wait(min(remaining, deadline - now))
+
+    def success(self, domain: str) -> None:
+        with self._condition:
+            circuit = self._circuit(domain)
+            circuit.state = CLOSED
+            circuit.failures = 0
+            circuit.probing = False
+            circuit.probe = None
+            self._condition.notify_all()
+
+    def failure(self, domain: str) -> None:
+        with self._condition:
+            self._failure(self._circuit(domain))
+
+    def release(self, domain: str, probe: int | None) -> None:
+        if probe is None:
+            return
+        with self._condition:
+            circuit = self._circuit(domain)
+            if circuit.probing and circuit.probe == probe:
+                self._failure(circuit)
+
+    def _failure(self, circuit: _Circuit) -> None:
+        circuit.failures += 1
+        if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+            circuit.state = OPEN
+            circuit.opened_at = monotonic()
+        circuit.probing = False
+        circuit.probe = None
+        self._condition.notify_all()
+
+def backoff(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+circuit_breaker = CircuitBreaker()
@@ -0,0 +1,77 @@
+import threading
+from time import monotonic, sleep, time
+from typing import Callable
+from core.config.request_data import get_request
+from core.__seedwork.infra.log import get_logger
+from core.__seedwork.infra.http.http.rate_limiter import rate_limiter
+from core.__seedwork.infra.http.http.circuit_breaker import circuit_breaker, OPEN
+from core.cloudflare.application.coordinator import bypass_coordinator
+
+log = get_logger('http')
+
+class ClearanceRefresher:
+    """
+    Renova o cf_clearance antes de expirar, em segundo plano.
+
+    O HttpService chama `watch(domain)` a cada requisição; domínios com
+    atividade nos últimos `active_window` segundos são considerados com
+    trabalho na fila. Quando o cookie de um deles vence em menos de `lead`
+    segundos, a thread do refresher resolve o desafio de novo pelo
+    BypassCoordinator (quem receber 403 no meio espera o mesmo bypass) depois
+    de pegar um token do rate limiter do domínio. O cookie atual segue em uso
+    até chegar um novo. Domínios com o circuito aberto ou sem expiração
+    conhecida são ignorados.
+    """
+
+    def __init__(self, interval: float = 30.0, lead: float = 300.0, active_window: float = 120.0, min_gap: float = 60.0):
+        self.interval = interval
+        self.lead = lead
+        self.active_window = active_window
+        self.min_gap = min_gap
+        self.solve: Callable[[str, int], object] | None = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._active: dict[str, float] = {}
+        self._refreshed: dict[str, float] = {}
+
+    def watch(self, domain: str) -> None:
+        with self._lock:
+            self._active[domain] = monotonic()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='pyteste-clearance-refresher', daemon=True)
+                self._thread.start()
+
+    def _due(self) -> list[str]:
+        now = monotonic()
+        with self._lock:
+            self._active = {d: t for d, t in self._active.items() if now - t <= self.active_window}
+            domains = [d for d in self._active if now - self._refreshed.get(d, -self.min_gap) >= self.min_gap]
+        due = []
+        for domain in domains:
+            data = get_request(domain)
+            if data and data.expires and data.expires - time() <= self.lead:
+                due.append(domain)
+        return due
+
+    def refresh(self, domain: str) -> None:
+        if self.solve is None or circuit_breaker.state(domain) == OPEN:
+            return
+        with self._lock:
+            self._refreshed[domain] = monotonic()
+        log.info('Renovando cf_clearance de %s antes de expirar', domain)
+        rate_limiter.acquire(domain)
+        try:
+            self.solve(domain, bypass_coordinator.generation(domain))
+        except Exception as e:
+            log.warning('Falha ao renovar cf_clearance de %s: %s', domain, e)
+
+    def _run(self) -> None:
+        while True:
+            sleep(self.interval)
+            try:
+                for domain in self._due():
+                    self.refresh(domain)
+            except Exception as e:
+                log.debug('Refresher de cf_clearance falhou: %s', e)
+
+clearance_refresher = ClearanceRefresher()
@@ -0,0 +1,198 @@
+import json
+import threading
+from time import perf_counter
+from bisect import bisect_left
+from contextlib import contextmanager
+from collections import Counter
+from core.__seedwork.infra.http.http.session_pool import get_domain
+
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+class Histogram:
+    def __init__(self, buckets: tuple = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.buckets[i] if i < len(self.buckets) else float('inf')
+        return float('inf')
+
+    def to_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'buckets': {str(b): n for b, n in zip(self.buckets + ('+Inf',), self.counts)},
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+        }
+
+class RequestSample:
+    """
+    Dados de uma chamada `get`/`post`, preenchidos pelo HttpService durante o
+    loop de tentativas e agregados em `HttpMetrics` ao final.
+
+    `ttfb` vem de `response.elapsed` do requests, que já inclui DNS, conexão e
+    TLS (o requests não expõe essas fases separadamente); `body` é o tempo de
+    leitura do corpo depois dos cabeçalhos.
+    """
+
+    __slots__ = ('method', 'domain', 'started', 'status', 'ttfb', 'body', 'bytes', 'retries', 'bypass', 'cache', 'error')
+
+    def __init__(self, method: str, domain: str):
+        self.method = method
+        self.domain = domain
+        self.started = perf_counter()
+        self.status = 0
+        self.ttfb = None
+        self.body = None
+        self.bytes = 0
+        self.retries = 0
+        self.bypass = None
+        self.cache = None
+        self.error = False
+
+    def exchange(self, response, duration: float) -> None:
+        self.status = response.status_code
+        self.ttfb = response.elapsed.total_seconds()
+        self.body = max(0.0, duration - self.ttfb)
+
+    def done(self, status: int, content=None) -> None:
+        self.status = status
+        if content is not None:
+            self.bytes = len(content)
+
+class DomainMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes = 0
+        self.statuses = Counter()
+        self.bypasses = Counter()
+        self.cache = Counter()
+        self.ttfb = Histogram()
+        self.body = Histogram()
+        self.total = Histogram()
+
+    def add(self, sample: RequestSample, total: float) -> None:
+        self.requests += 1
+        self.errors += sample.error
+        self.retries += sample.retries
+        self.bytes += sample.bytes
+        self.statuses[sample.status] += 1
+        if sample.bypass:
+            self.bypasses[sample.bypass] += 1
+        if sample.cache:
+            self.cache[sample.cache] += 1
+        if sample.ttfb is not None:
+            self.ttfb.observe(sample.ttfb)
+            self.body.observe(sample.body)
+        self.total.observe(total)
+
+    def to_dict(self) -> dict:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'bytes': self.bytes,
+            'statuses': {str(k): v for k, v in self.statuses.items()},
+            'bypasses': dict(self.bypasses),
+            'cache': dict(self.cache),
+            'ttfb_seconds': self.ttfb.to_dict(),
+            'body_seconds': self.body.to_dict(),
+            'total_seconds': self.total.to_dict(),
+        }
+
+class HttpMetrics:
+    """
+    Métricas de requisições HTTP agregadas por domínio registrado.
+
+    Cada chamada custa só um lock e algumas somas; os dados ficam em memória
+    até `reset` e podem ser exportados em JSON ou no formato texto do Prometheus.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._domains: dict[str, DomainMetrics] = {}
+
+    @contextmanager
+    def track(self, method: str, url: str):
+        sample = RequestSample(method, get_domain(url))
+        try:
+            yield sample
+        except BaseException:
+            sample.error = True
+            raise
+        finally:
+            self.record(sample)
+
+    def record(self, sample: RequestSample) -> None:
+        total = perf_counter() - sample.started
+        with self._lock:
+            metrics = self._domains.get(sample.domain)
+            if metrics is None:
+                metrics = DomainMetrics()
+                self._domains[sample.domain] = metrics
+            metrics.add(sample, total)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {domain: metrics.to_dict() for domain, metrics in self._domains.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._domains = {}
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        snapshot = self.snapshot()
+        lines = []
+
+        def counter(name, help_text, values):
+            lines.append(f'# HELP pyteste_http_{name} {help_text}')
+            lines.append(f'# TYPE pyteste_http_{name} counter')
+            for labels, value in values:
+                lines.append(f'pyteste_http_{name}{{{labels}}} {value}')
+
+        counter('requests_total', 'Requests by domain and final status.',
+                [(f'domain="{d}",status="{s}"', n) for d, m in snapshot.items() for s, n in m['statuses'].items()])
+        counter('errors_total', 'Requests that raised an exception.',
+                [(f'domain="{d}"', m['errors']) for d, m in snapshot.items()])
+        counter('retries_total', 'Extra attempts made inside the retry loop.',
+                [(f'domain="{d}"', m['retries']) for d, m in snapshot.items()])
+        counter('response_bytes_total', 'Response body bytes received.',
+                [(f'domain="{d}"', m['bytes']) for d, m in snapshot.items()])
+        counter('bypass_total', 'Requests resolved by a Cloudflare bypass strategy.',
+                [(f'domain="{d}",strategy="{s}"', n) for d, m in snapshot.items() for s, n in m['bypasses'].items()])
+        counter('cache_total', 'Requests answered from the disk cache.',
+                [(f'domain="{d}",result="{r}"', n) for d, m in snapshot.items() for r, n in m['cache'].items()])
+
+        for name, key in (('ttfb_seconds', 'ttfb_seconds'), ('body_seconds', 'body_seconds'), ('request_seconds', 'total_seconds')):
+            lines.append(f'# TYPE pyteste_http_{name} histogram')
+            for domain, metrics in snapshot.items():
+                histogram = metrics[key]
+                cumulative = 0
+                for le, n in histogram['buckets'].items():
+                    cumulative += n
+                    lines.append(f'pyteste_http_{name}_bucket{{domain="{domain}",le="{le}"}} {cumulative}')
+                lines.append(f'pyteste_http_{name}_sum{{domain="{domain}"}} {histogram["sum"]}')
+                lines.append(f'pyteste_http_{name}_count{{domain="{domain}"}} {histogram["count"]}')
+        return '\n'.join(lines) + '\n'
+
+http_metrics = HttpMetrics()
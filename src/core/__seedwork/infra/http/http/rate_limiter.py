@@ -0,0 +1,99 @@
+import re
+import threading
+from time import monotonic, sleep, time
+from email.utils import parsedate_to_datetime
+from core.__seedwork.infra.http.http.session_pool import get_domain
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = monotonic()
+
+    def reserve(self, now: float) -> float:
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        self.tokens -= 1
+        ready_at = self.updated + max(0.0, -self.tokens) / self.rate
+        return max(0.0, ready_at - now)
+
+class RateLimiter:
+    """
+    Limitador token-bucket compartilhado pelo processo, um balde por domínio.
+
+    `acquire` é chamado antes de cada requisição e bloqueia só a thread que
+    precisa esperar. Um 429 pausa o domínio inteiro pelo Retry-After e reduz a
+    taxa pela metade; cada sucesso devolve a taxa aos poucos até o limite
+    configurado para o domínio.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: float = 10.0, min_rate: float = 0.2,
+                 recovery: float = 0.25, default_retry_after: float = 10.0, max_retry_after: float = 300.0):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.recovery = recovery
+        self.default_retry_after = default_retry_after
+        self.max_retry_after = max_retry_after
+        self._lock = threading.Lock()
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _bucket(self, domain: str) -> TokenBucket:
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = TokenBucket(self.rate, self.burst)
+            self._buckets[domain] = bucket
+        return bucket
+
+    def configure(self, domain: str, rate: float, burst: float | None = None) -> None:
+        with self._lock:
+            bucket = self._bucket(domain)
+            bucket.max_rate = bucket.rate = rate
+            bucket.burst = burst if burst is not None else max(1.0, rate)
+            bucket.tokens = min(bucket.tokens, bucket.burst)
+
+    def configure_provider(self, domains, rate: float, burst: float | None = None) -> None:
+        if isinstance(domains, (str, re.Pattern)):
+            domains = [domains]
+        for domain in domains:
+            if isinstance(domain, str):
+                self.configure(get_domain(f'https://{domain}'), rate, burst)
+
+    def acquire(self, domain: str) -> None:
+        with self._lock:
+            wait = self._bucket(domain).reserve(monotonic())
+        if wait > 0:
+            sleep(wait)
+
+    def success(self, domain: str) -> None:
+        with self._lock:
+            bucket = self._bucket(domain)
+            if bucket.rate < bucket.max_rate:
+                bucket.rate = min(bucket.max_rate, bucket.rate + self.recovery)
+
+    def throttle(self, domain: str, retry_after: str | None = None) -> float:
+        delay = self.parse_retry_after(retry_after)
+        with self._lock:
+            bucket = self._bucket(domain)
+            bucket.rate = max(self.min_rate, bucket.rate / 2)
+            now = monotonic()
+            bucket.tokens = 0
+            bucket.updated = max(bucket.updated, now + delay)
+        return delay
+
+    def parse_retry_after(self, retry_after: str | None) -> float:
+        if not retry_after:
+            return self.default_retry_after
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time()
+            except (TypeError, ValueError):
+                return self.default_retry_after
+        return min(self.max_retry_after, max(0.0, delay))
+
+rate_limiter = RateLimiter()
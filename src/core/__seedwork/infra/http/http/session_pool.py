@@ -0,0 +1,122 @@
+import threading
+import tldextract
+import cloudscraper
+from time import monotonic
+from contextlib import contextmanager
+
+def get_domain(url: str) -> str:
+    extract = tldextract.extract(url)
+    return f"{extract.domain}.{extract.suffix}"
+
+class _DomainSessions:
+    def __init__(self):
+        self.active = 0
+        self.idle = []
+        self.generation = 0
+
+class SessionPool:
+    """
+    Pool de sessões cloudscraper de longa duração, agrupadas por domínio registrado.
+
+    Cada sessão é usada por uma thread por vez; o número de sessões simultâneas
+    por domínio é limitado por `max_connections`, que `configure` pode mudar
+    com o programa rodando (é o único limite de conexões por domínio).
+    Sessões ociosas há mais de
+    `idle_timeout` segundos são fechadas, e `invalidate` descarta todas as sessões
+    de um domínio (ex.: quando o cf_clearance deixa de valer).
+    """
+
+    def __init__(self, max_connections: int = 6, idle_timeout: float = 90.0):
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._domains: dict[str, _DomainSessions] = {}
+
+    def configure(self, max_connections: int) -> None:
+        with self._available:
+            self.max_connections = max(1, max_connections)
+            self._available.notify_all()
+
+    def _create_scraper(self):
+        scraper = cloudscraper.create_scraper(
+            browser={
+                'browser': 'chrome',
+                'platform': 'windows',
+                'mobile': False
+            }
+        )
+        for prefix in ('https://', 'http://'):
+            scraper.get_adapter(prefix).init_poolmanager(4, 1, block=True)
+        return scraper
+
+    def _get_domain(self, domain: str) -> _DomainSessions:
+        with self._lock:
+            sessions = self._domains.get(domain)
+            if sessions is None:
+                sessions = _DomainSessions()
+                self._domains[domain] = sessions
+            return sessions
+
+    def _evict_idle(self, sessions: _DomainSessions, now: float) -> list:
+        expired = [s for s in sessions.idle if now - s[1] > self.idle_timeout]
+        if expired:
+            sessions.idle = [s for s in sessions.idle if now - s[1] <= self.idle_timeout]
+        return [scraper for scraper, _ in expired]
+
+    def acquire(self, domain: str):
+        sessions = self._get_domain(domain)
+        with self._available:
+            while sessions.active >= self.max_connections:
+                self._available.wait()
+            sessions.active += 1
+            expired = self._evict_idle(sessions, monotonic())
+            scraper = sessions.idle.pop()[0] if sessions.idle else None
+            generation = sessions.generation
+        for old in expired:
+            old.close()
+        if scraper is None:
+            scraper = self._create_scraper()
+        return scraper, generation
+
+    def release(self, domain: str, scraper, generation: int) -> None:
+        sessions = self._get_domain(domain)
+        with self._available:
+            keep = generation == sessions.generation
+            if keep:
+                sessions.idle.append((scraper, monotonic()))
+            sessions.active -= 1
+            self._available.notify_all()
+        if not keep:
+            scraper.close()
+
+    @contextmanager
+    def session(self, url: str):
+        domain = get_domain(url)
+        scraper, generation = self.acquire(domain)
+        try:
+            yield scraper
+        finally:
+            self.release(domain, scraper, generation)
+
+    def invalidate(self, domain: str) -> None:
+        sessions = self._get_domain(domain)
+        with self._lock:
+            sessions.generation += 1
+            idle = sessions.idle
+            sessions.idle = []
+        for scraper, _ in idle:
+            scraper.close()
+
+    def close(self) -> None:
+        with self._lock:
+            domains = list(self._domains.values())
+            for sessions in domains:
+                sessions.generation += 1
+            idle = [s for sessions in domains for s in sessions.idle]
+            for sessions in domains:
+                sessions.idle = []
+        for scraper, _ in idle:
+            scraper.close()
+
+session_pool = SessionPool()
@@ -0,0 +1,83 @@
+import copy
+import json
+import threading
+from time import monotonic
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Junta chamadas idênticas simultâneas em uma só execução.
+
+    A primeira thread que pede uma chave executa a função; as que chegarem
+    enquanto ela está em andamento esperam e recebem o mesmo resultado. Se a
+    função falhar, cada uma delas recebe a sua própria cópia da exceção,
+    encadeada à original, para que tracebacks de threads diferentes não se
+    misturem. Só os resultados aceitos por `memo` ficam guardados por
+    `memo_ttl` segundos para chamadas logo em seguida.
+    """
+
+    def __init__(self, memo_ttl: float = 10.0):
+        self.memo_ttl = memo_ttl
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._memo: dict[str, tuple[float, object]] = {}
+
+    def key(self, *parts) -> str:
+        return json.dumps(parts, sort_keys=True, default=str)
+
+    def _prune(self, now: float) -> None:
+        expired = [key for key, (stored_at, _) in self._memo.items() if now - stored_at > self.memo_ttl]
+        for key in expired:
+            del self._memo[key]
+
+    def do(self, key: str, fn, memo=None):
+        with self._lock:
+            now = monotonic()
+            self._prune(now)
+            if key in self._memo:
+                return self._memo[key][1]
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise self._waiter_error(call.error) from call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.error is None and memo is not None and memo(call.result):
+                    self._memo[key] = (monotonic(), call.result)
+            call.event.set()
+
+    @staticmethod
+    def _waiter_error(error: BaseException) -> BaseException:
+        try:
+            waiter_error = copy.copy(error)
+        except Exception:
+            waiter_error = None
+        if not isinstance(waiter_error, BaseException) or waiter_error is error:
+            waiter_error = Exception(f'{type(error).__name__}: {error}')
+        return waiter_error.with_traceback(None)
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            self._memo.pop(key, None)
+
+single_flight = SingleFlight()
@@ -0,0 +1,55 @@
+import os
+import sys
+import html
+import logging
+
+ROOT = 'pyteste'
+
+LEVEL_COLORS = {
+    logging.DEBUG: '#808080',
+    logging.INFO: 'green',
+    logging.WARNING: '#FFFF00',
+    logging.ERROR: 'red',
+    logging.CRITICAL: 'red',
+}
+
+logging.getLogger(ROOT).addHandler(logging.NullHandler())
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Logger de um subsistema, filho de `pyteste` (ex.: `get_logger('http')`).
+
+    Use sempre formatação preguiçosa (`log.debug('GET %s', url)`): quando o
+    nível está desligado a mensagem nem chega a ser montada.
+    """
+    return logging.getLogger(f'{ROOT}.{name}')
+
+def setup_logging(level: int | None = None) -> logging.Logger:
+    """
+    Configura o logger raiz `pyteste`. Sem nível explícito usa WARNING, ou DEBUG
+    quando PYTESTEENV=dev. Pode ser chamada mais de uma vez.
+    """
+    root = logging.getLogger(ROOT)
+    if level is None:
+        level = logging.DEBUG if os.environ.get('PYTESTEENV') == 'dev' else logging.WARNING
+    root.setLevel(level)
+    root.propagate = False
+    if sys.__stderr__ is not None and not any(getattr(h, '_pyteste_console', False) for h in root.handlers):
+        console = logging.StreamHandler(sys.__stderr__)
+        console.setFormatter(logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s'))
+        console._pyteste_console = True
+        root.addHandler(console)
+    return root
+
+class HtmlFormatter(logging.Formatter):
+    """
+    Formata registros como as linhas coloridas da janela de logs.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        subsystem = record.name.removeprefix(f'{ROOT}.').upper()
+        color = LEVEL_COLORS.get(record.levelno, 'green')
+        message = html.escape(record.getMessage())
+        if record.exc_info:
+            message += '<br>' + html.escape(self.formatException(record.exc_info)).replace('\n', '<br>')
+        return f"<stroke style='color:#add8e6;'>[{subsystem}]:</stroke> <span style='color:{color};'>{record.levelname}</span> {message}"
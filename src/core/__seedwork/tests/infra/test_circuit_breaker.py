@@ -0,0 +1,71 @@
+import threading
+import pytest
+from core.__seedwork.infra.http.http.circuit_breaker import CircuitBreaker, CircuitOpenError, CLOSED, OPEN, HALF_OPEN
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60, park_timeout=0)
+        for _ in range(2):
+            breaker.failure('a.com')
+        assert breaker.state('a.com') == CLOSED
+        breaker.failure('a.com')
+        assert breaker.state('a.com') == OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request('a.com')
+        breaker.before_request('b.com')
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.failure('a.com')
+        breaker.success('a.com')
+        breaker.failure('a.com')
+        assert breaker.state('a.com') == CLOSED
+
+    def test_half_open_allows_a_single_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0, park_timeout=5)
+        breaker.failure('a.com')
+        breaker.before_request('a.com')
+        assert breaker.state('a.com') == HALF_OPEN
+        # As outras requisições esperam o resultado da sonda
+        released = threading.Event()
+
+        def other():
+            breaker.before_request('a.com')
+            released.set()
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        assert not released.wait(0.2)
+        breaker.success('a.com')
+        assert released.wait(5)
+        thread.join(5)
+
+    def test_probe_outcome(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0, park_timeout=0)
+        breaker.failure('a.com')
+        breaker.before_request('a.com')
+        breaker.failure('a.com')
+        assert breaker.state('a.com') == OPEN
+        breaker.before_request('a.com')
+        breaker.success('a.com')
+        assert breaker.state('a.com') == CLOSED
+
+    def test_release_fails_unresolved_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60, park_timeout=0)
+        breaker.failure('a.com')
+        breaker._circuit('a.com').opened_at -= 60
+        probe = breaker.before_request('a.com')
+        assert probe is not None
+        breaker.release('a.com', probe)
+        assert breaker.state('a.com') == OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request('a.com')
+
+    def test_release_after_outcome_is_a_no_op(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0, park_timeout=0)
+        assert breaker.before_request('a.com') is None
+        breaker.failure('a.com')
+        probe = breaker.before_request('a.com')
+        breaker.success('a.com')
+        breaker.release('a.com', probe)
+        assert breaker.state('a.com') == CLOSED
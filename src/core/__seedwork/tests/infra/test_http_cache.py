@@ -0,0 +1,17 @@
+from core.__seedwork.infra.http.http.cache import HttpCache
+
+class TestHttpCacheKey:
+    def test_headers_that_change_the_response(self, tmp_path):
+        cache = HttpCache(tmp_path)
+        url = 'https://example.com/api'
+        plain = cache.key('GET', url)
+        assert cache.key('GET', url, headers={'Accept': 'application/json'}) != plain
+        assert cache.key('GET', url, headers={'Authorization': 'Bearer a'}) != cache.key('GET', url, headers={'Authorization': 'Bearer b'})
+        assert cache.key('GET', url, headers={'X-Requested-With': 'XMLHttpRequest'}) != plain
+
+    def test_other_headers_are_ignored(self, tmp_path):
+        cache = HttpCache(tmp_path)
+        url = 'https://example.com/api'
+        assert cache.key('GET', url, headers={'User-Agent': 'a', 'sec-fetch-mode': 'cors'}) == cache.key('GET', url)
+        assert cache.key('GET', url, headers={'accept': 'text/html'}) == cache.key('GET', url, headers={'Accept': 'text/html'})
+
@@ -0,0 +1,144 @@
+import importlib
+from datetime import timedelta
+from contextlib import contextmanager
+import pytest
+from core.__seedwork.infra.http.http.circuit_breaker import CircuitBreaker, CLOSED, OPEN
+from core.cloudflare.domain.request_entity import Request
+
+http = importlib.import_module('core.__seedwork.infra.http.http')
+
+CHALLENGE = b'<!DOCTYPE html><html><head><title>Just a moment...</title></head></html>'
+
+class FakeResponse:
+    def __init__(self, status, content=b''):
+        self.status_code = status
+        self.headers = {}
+        self.content = content
+        self.encoding = None
+        self.url = 'https://a.com/'
+        self.elapsed = timedelta(0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+class FakeScraper:
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def get(self, url, **kwargs):
+        # A última resposta se repete quando a lista acaba
+        status, content = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        return FakeResponse(status, content)
+
+class FakeSessionPool:
+    def __init__(self, *responses):
+        self.scraper = FakeScraper(response if isinstance(response, tuple) else (response, b'') for response in responses)
+
+    @contextmanager
+    def session(self, url):
+        yield self.scraper
+
+    def invalidate(self, domain):
+        pass
+
+class FakeRateLimiter:
+    def acquire(self, domain):
+        pass
+
+    def success(self, domain):
+        pass
+
+    def throttle(self, domain, retry_after=None):
+        return 0
+
+class FakeRefresher:
+    def watch(self, domain):
+        pass
+
+@pytest.fixture
+def breaker(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0, park_timeout=60)
+    monkeypatch.setattr(http, 'circuit_breaker', breaker)
+    monkeypatch.setattr(http, 'rate_limiter', FakeRateLimiter())
+    monkeypatch.setattr(http, 'clearance_refresher', FakeRefresher())
+    monkeypatch.setattr(http, 'get_login', lambda domain: None)
+    monkeypatch.setattr(http, 'get_request', lambda domain: None)
+    monkeypatch.setattr(http, 'sleep', lambda seconds: None)
+    return breaker
+
+@pytest.fixture
+def open_breaker(breaker):
+    # Abre o circuito: a próxima requisição vira a sonda do meio-aberto
+    breaker.failure('a.com')
+    return breaker
+
+@pytest.fixture
+def bypass(breaker, monkeypatch):
+    records = []
+
+    class FakeBypass:
+        def execute(self, url):
+            return Request({'user-agent': 'x'}, {'cf_clearance': 'c'})
+
+    monkeypatch.setattr(http, 'BypassCloudflareUseCase', FakeBypass)
+    monkeypatch.setattr(http, 'insert_request', lambda data: None)
+    monkeypatch.setattr(http, 'get_bypass_stats', lambda domain, kind=None: [])
+    monkeypatch.setattr(http, 'record_bypass', lambda *args: records.append(args))
+    return records
+
+def assert_probe_resolved(breaker):
+    circuit = breaker._circuit('a.com')
+    assert not circuit.probing
+    # Sem sonda pendurada, outra requisição não fica esperando
+    breaker.before_request('a.com', wait=False)
+
+class TestProbeResolution:
+    def test_exhausted_retries(self, open_breaker, monkeypatch):
+        monkeypatch.setattr(http, 'session_pool', FakeSessionPool(429))
+        with pytest.raises(Exception, match='STATUS: 429'):
+            http.HttpService._get('https://a.com/')
+        assert open_breaker.state('a.com') == OPEN
+        assert_probe_resolved(open_breaker)
+
+    def test_unexpected_error(self, open_breaker, monkeypatch):
+        class BrokenPool:
+            @contextmanager
+            def session(self, url):
+                raise RuntimeError('boom')
+                yield
+
+        monkeypatch.setattr(http, 'session_pool', BrokenPool())
+        with pytest.raises(RuntimeError):
+            http.HttpService._get('https://a.com/')
+        assert_probe_resolved(open_breaker)
+
+    def test_get_file_non_success_before_fallback(self, open_breaker, monkeypatch, tmp_path):
+        monkeypatch.setattr(http, 'session_pool', FakeSessionPool(503))
+
+        def fallback(url, **kwargs):
+            assert_probe_resolved(open_breaker)
+            return http.Response(404, None, b'', url)
+
+        monkeypatch.setattr(http.HttpService, 'get', staticmethod(fallback))
+        with pytest.raises(Exception, match='STATUS: 404'):
+            http.HttpService.get_file('https://a.com/1.jpg', str(tmp_path / '1.jpg'))
+
+    def test_success_closes(self, open_breaker, monkeypatch):
+        monkeypatch.setattr(http, 'session_pool', FakeSessionPool(200))
+        assert http.HttpService._get('https://a.com/').status == 200
+        assert open_breaker.state('a.com') == CLOSED
+
+class TestClearanceOutcome:
+    def test_recorded_after_retry_succeeds(self, bypass, monkeypatch):
+        monkeypatch.setattr(http, 'session_pool', FakeSessionPool((403, CHALLENGE), 200))
+        assert http.HttpService._get('https://a.com/').status == 200
+        assert [(r[0], r[1], r[2], r[3]) for r in bypass] == [('a.com', 'challenge', 'cloudflare', True)]
+
+    def test_failed_retry_is_a_failure(self, bypass, monkeypatch):
+        monkeypatch.setattr(http, 'session_pool', FakeSessionPool((403, CHALLENGE), 500))
+        with pytest.raises(Exception):
+            http.HttpService._get('https://a.com/')
+        assert [(r[2], r[3]) for r in bypass] == [('cloudflare', False)]
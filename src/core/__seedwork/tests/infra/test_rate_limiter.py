@@ -0,0 +1,37 @@
+from core.__seedwork.infra.http.http.rate_limiter import RateLimiter, TokenBucket
+
+class TestRateLimiter:
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=2.0, burst=2.0)
+        now = bucket.updated
+        assert bucket.reserve(now) == 0
+        assert bucket.reserve(now) == 0
+        assert bucket.reserve(now) == 0.5
+        assert bucket.reserve(now) == 1.0
+
+    def test_refills_up_to_burst(self):
+        bucket = TokenBucket(rate=1.0, burst=2.0)
+        now = bucket.updated
+        bucket.reserve(now)
+        bucket.reserve(now)
+        assert bucket.reserve(now + 100) == 0
+        assert bucket.tokens == 1
+
+    def test_throttle_halves_rate_and_success_recovers(self):
+        limiter = RateLimiter(rate=4.0, burst=4.0, min_rate=1.0, recovery=1.0)
+        limiter.throttle('a.com', '0')
+        assert limiter._bucket('a.com').rate == 2.0
+        limiter.throttle('a.com', '0')
+        limiter.throttle('a.com', '0')
+        assert limiter._bucket('a.com').rate == 1.0
+        for _ in range(10):
+            limiter.success('a.com')
+        assert limiter._bucket('a.com').rate == 4.0
+
+    def test_parse_retry_after(self):
+        limiter = RateLimiter(default_retry_after=10.0, max_retry_after=300.0)
+        assert limiter.parse_retry_after(None) == 10.0
+        assert limiter.parse_retry_after('5') == 5.0
+        assert limiter.parse_retry_after('9999') == 300.0
+        assert limiter.parse_retry_after('invalid') == 10.0
+        assert limiter.parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
@@ -0,0 +1,50 @@
+from core.__seedwork.infra.database import Database, RecordCache
+
+def init_db(conn):
+    conn.execute('CREATE TABLE IF NOT EXISTS records (key TEXT PRIMARY KEY, value TEXT)')
+
+def value(db, key):
+    row = db.fetchone('SELECT value FROM records WHERE key = ?', (key,))
+    return row[0] if row else None
+
+class TestRecordCache:
+    def test_loads_once(self, tmp_path):
+        db = Database(tmp_path / 'test.db', init_db)
+        cache = RecordCache(db, check_interval=3600)
+        loads = []
+
+        def load():
+            loads.append(1)
+            return value(db, 'a')
+
+        db.execute('INSERT INTO records VALUES (?, ?)', ('a', '1'))
+        assert cache.get('a', load) == '1'
+        assert cache.get('a', load) == '1'
+        assert loads == [1]
+
+    def test_put_and_invalidate(self, tmp_path):
+        db = Database(tmp_path / 'test.db', init_db)
+        cache = RecordCache(db, check_interval=3600)
+        loads = []
+
+        def load():
+            loads.append(1)
+            return value(db, 'a')
+
+        assert cache.get('a', load) is None
+        db.execute('INSERT INTO records VALUES (?, ?)', ('a', '2'))
+        cache.put('a', '2')
+        assert cache.get('a', load) == '2'
+        assert loads == [1]
+        db.execute('DELETE FROM records WHERE key = ?', ('a',))
+        cache.invalidate('a')
+        assert cache.get('a', load) is None
+        assert loads == [1, 1]
+
+    def test_sees_writes_from_other_connections(self, tmp_path):
+        db = Database(tmp_path / 'test.db', init_db)
+        other = Database(tmp_path / 'test.db', init_db)
+        cache = RecordCache(db, check_interval=0)
+        assert cache.get('a', lambda: value(db, 'a')) is None
+        other.execute('INSERT INTO records VALUES (?, ?)', ('a', '3'))
+        assert cache.get('a', lambda: value(db, 'a')) == '3'
@@ -0,0 +1,56 @@
+import threading
+from core.__seedwork.infra.http.http.session_pool import SessionPool
+
+class FakeScraper:
+    def close(self):
+        pass
+
+class FakeSessionPool(SessionPool):
+    def _create_scraper(self):
+        return FakeScraper()
+
+class TestSessionPool:
+    def test_limits_connections_per_domain(self):
+        pool = FakeSessionPool(max_connections=1)
+        scraper, generation = pool.acquire('a.com')
+        acquired = threading.Event()
+
+        def other():
+            pool.release('a.com', *pool.acquire('a.com'))
+            acquired.set()
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        assert not acquired.wait(0.2)
+        # Outro domínio não espera
+        pool.release('b.com', *pool.acquire('b.com'))
+        pool.release('a.com', scraper, generation)
+        assert acquired.wait(5)
+        thread.join(5)
+
+    def test_configure_raises_limit_for_waiters(self):
+        pool = FakeSessionPool(max_connections=1)
+        held = pool.acquire('a.com')
+        acquired = threading.Event()
+
+        def other():
+            pool.release('a.com', *pool.acquire('a.com'))
+            acquired.set()
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        assert not acquired.wait(0.2)
+        pool.configure(2)
+        assert acquired.wait(5)
+        thread.join(5)
+        pool.release('a.com', *held)
+
+    def test_reuses_idle_sessions_until_invalidated(self):
+        pool = FakeSessionPool()
+        scraper, generation = pool.acquire('a.com')
+        pool.release('a.com', scraper, generation)
+        again, generation = pool.acquire('a.com')
+        assert again is scraper
+        pool.invalidate('a.com')
+        pool.release('a.com', again, generation)
+        assert pool.acquire('a.com')[0] is not scraper
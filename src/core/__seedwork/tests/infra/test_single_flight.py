@@ -0,0 +1,88 @@
+import threading
+import pytest
+from core.__seedwork.infra.http.http.single_flight import SingleFlight
+
+class TestSingleFlight:
+    def test_concurrent_calls_run_once(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 'page'
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do('k', fetch)))]
+        threads[0].start()
+        started.wait(5)
+        threads += [threading.Thread(target=lambda: results.append(flight.do('k', fetch))) for _ in range(3)]
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        assert calls == [1]
+        assert results == ['page'] * 4
+
+    def test_errors_are_not_memoized(self):
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError('boom')
+
+        with pytest.raises(ValueError):
+            flight.do('k', fail, memo=lambda result: True)
+        assert flight.do('k', lambda: 'ok', memo=lambda result: True) == 'ok'
+
+    def test_memo(self):
+        flight = SingleFlight(memo_ttl=60)
+        assert flight.do('k', lambda: 'first', memo=lambda result: True) == 'first'
+        assert flight.do('k', lambda: 'second', memo=lambda result: True) == 'first'
+        flight.forget('k')
+        assert flight.do('k', lambda: 'third') == 'third'
+        assert flight.do('k', lambda: 'fourth') == 'fourth'
+
+    def test_each_waiter_gets_its_own_error(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        class CountingEvent(threading.Event):
+            waiting = 0
+
+            def wait(self, timeout=None):
+                CountingEvent.waiting += 1
+                if CountingEvent.waiting == 2:
+                    release.set()
+                return super().wait(timeout)
+
+        def fail():
+            started.set()
+            release.wait(5)
+            raise ValueError('boom')
+
+        def call():
+            try:
+                flight.do('k', fail)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call)]
+        threads[0].start()
+        started.wait(5)
+        flight._calls['k'].event = CountingEvent()
+        threads += [threading.Thread(target=call) for _ in range(2)]
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        assert len(errors) == 3
+        assert len({id(e) for e in errors}) == 3
+        original = [e for e in errors if e.__cause__ is None]
+        assert len(original) == 1
+        assert all(e.__cause__ is original[0] for e in errors if e is not original[0])
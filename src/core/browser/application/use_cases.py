@@ -0,0 +1,15 @@
+from typing import Any, Awaitable, Callable
+from core.__seedwork.application.use_cases import UseCase
+from core.browser.infra.nodriver import NodriverBrowser
+
+class RunInBrowserUseCase(UseCase):
+    def execute(self, url: str, fn: Callable[[Any, Any], Awaitable[Any]], headless: bool = True, navigate: bool = True) -> Any:
+        return NodriverBrowser().run(url, fn, headless, navigate)
+
+class GetBrowserCookiesUseCase(UseCase):
+    def execute(self, domain: str) -> dict:
+        return NodriverBrowser().cookies(domain)
+
+class CloseBrowsersUseCase(UseCase):
+    def execute(self) -> None:
+        NodriverBrowser().close()
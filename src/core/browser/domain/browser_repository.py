@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar('T')
+
+class BrowserRepository(ABC):
+    @abstractmethod
+    def run(url: str, fn: Callable[[Any, Any], Awaitable[T]], headless: bool = True, navigate: bool = True) -> T:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def cookies(domain: str) -> dict:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def close() -> None:
+        raise NotImplementedError()
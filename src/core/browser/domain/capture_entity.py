@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+@dataclass
+class CapturedResponse:
+    url: str
+    status: int | None = None
+    mime_type: str | None = None
+    body: bytes | None = None
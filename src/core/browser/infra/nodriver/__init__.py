@@ -0,0 +1,29 @@
+from typing import Any, Awaitable, Callable, TypeVar
+from core.browser.domain.browser_repository import BrowserRepository
+from core.browser.infra.nodriver.browser_pool import browser_pool
+
+T = TypeVar('T')
+
+class NodriverBrowser(BrowserRepository):
+    """
+    Serviço de navegador dos providers sobre o pool nodriver do core.
+
+    `run` empresta uma aba já navegada para `url` (ou em branco, com
+    `navigate=False`) e executa `fn(browser, aba)` no loop do pool, devolvendo
+    o resultado para a thread que chamou. Dentro de `fn` os helpers de
+    `capture` esperam a rede em vez de sleeps fixos. A aba
+    volta para o pool no fim, com os cookies do domínio guardados para os
+    próximos empréstimos.
+    """
+
+    def run(self, url: str, fn: Callable[[Any, Any], Awaitable[T]], headless: bool = True, navigate: bool = True) -> T:
+        async def task():
+            async with browser_pool.lease(url, headless=headless, navigate=navigate) as (browser, tab):
+                return await fn(browser, tab)
+        return browser_pool.run(task())
+
+    def cookies(self, domain: str) -> dict:
+        return browser_pool.cookies(domain)
+
+    def close(self) -> None:
+        browser_pool.close()
@@ -0,0 +1,239 @@
+import asyncio
+import threading
+import tldextract
+import nodriver as uc
+from nodriver import cdp
+from time import monotonic
+from contextlib import asynccontextmanager
+from core.__seedwork.infra.log import get_logger
+from core.browser.infra.nodriver.chrome import find_chrome_executable
+
+log = get_logger('browser')
+
+class PooledBrowser:
+    def __init__(self, browser, headless: bool):
+        self.browser = browser
+        self.headless = headless
+        self.uses = 0
+        self.leased = 0
+        self.idle_tabs = [browser.main_tab] if browser.main_tab else []
+        self.retired = False
+        self.last_used = monotonic()
+        self.synced: set[str] = set()
+
+    def healthy(self) -> bool:
+        connection = getattr(self.browser, 'connection', None)
+        return not self.retired and not self.browser.stopped and connection is not None and not getattr(connection, 'closed', False)
+
+class BrowserPool:
+    """
+    Pool de navegadores nodriver de longa duração, compartilhado pelo bypass do
+    Cloudflare e pelos providers que precisam de navegador.
+
+    Os navegadores vivem num event loop próprio (thread 'pyteste-browser-loop')
+    e são emprestados por domínio: o mesmo domínio volta para o navegador que já
+    tem os cookies dele. Ao devolver uma aba os cookies do domínio são guardados
+    num pote por domínio e copiados para outro navegador antes de ele atender o
+    mesmo domínio. Cada navegador atende até `max_tabs` abas ao mesmo tempo; as
+    abas livres são reaproveitadas. `max_browsers` limita os processos do Chrome
+    no processo inteiro. Um navegador é reciclado depois de `max_uses`
+    empréstimos, quando cai, ou quando fica ocioso por mais de `idle_timeout`
+    segundos.
+    """
+
+    def __init__(self, max_browsers: int = 2, max_tabs: int = 4, max_uses: int = 50, idle_timeout: float = 300.0):
+        self.max_browsers = max_browsers
+        self.max_tabs = max_tabs
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._condition = None
+        self._starting = 0
+        self._browsers: list[PooledBrowser] = []
+        self._affinity: dict[str, PooledBrowser] = {}
+        self._jars: dict[str, list] = {}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name='pyteste-browser-loop', daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro):
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError('BrowserPool.run não pode ser chamado de dentro do loop do pool')
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def _stop(self, pooled: PooledBrowser) -> None:
+        try:
+            pooled.browser.stop()
+        except Exception as e:
+            log.debug('Falha ao fechar navegador: %s', e)
+
+    def _retire(self, pooled: PooledBrowser) -> None:
+        pooled.retired = True
+        if pooled in self._browsers:
+            self._browsers.remove(pooled)
+        self._affinity = {d: b for d, b in self._affinity.items() if b is not pooled}
+        if pooled.leased == 0:
+            self._stop(pooled)
+
+    def _reap(self) -> None:
+        now = monotonic()
+        for pooled in list(self._browsers):
+            if not pooled.healthy():
+                log.info('Navegador caiu, descartando')
+                self._retire(pooled)
+            elif pooled.leased == 0 and now - pooled.last_used > self.idle_timeout:
+                self._retire(pooled)
+
+    async def _start_browser(self, headless: bool) -> PooledBrowser:
+        browser = await uc.start(
+            browser_executable_path=find_chrome_executable(),
+            headless=headless
+        )
+        return PooledBrowser(browser, headless)
+
+    async def _acquire(self, domain: str, headless: bool) -> PooledBrowser:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            while True:
+                self._reap()
+                candidates = [b for b in self._browsers if b.headless == headless and b.leased < self.max_tabs]
+                preferred = self._affinity.get(domain)
+                if preferred in candidates:
+                    chosen = preferred
+                elif len(self._browsers) + self._starting < self.max_browsers:
+                    chosen = None
+                elif candidates:
+                    chosen = min(candidates, key=lambda b: b.leased)
+                else:
+                    idle = [b for b in self._browsers if b.leased == 0]
+                    if idle:
+                        self._retire(min(idle, key=lambda b: b.last_used))
+                        continue
+                    await self._condition.wait()
+                    continue
+                if chosen is not None:
+                    chosen.leased += 1
+                    self._affinity[domain] = chosen
+                    return chosen
+                self._starting += 1
+                break
+
+        try:
+            pooled = await self._start_browser(headless)
+        except BaseException:
+            async with self._condition:
+                self._starting -= 1
+                self._condition.notify_all()
+            raise
+        async with self._condition:
+            self._starting -= 1
+            pooled.leased += 1
+            self._browsers.append(pooled)
+            self._affinity[domain] = pooled
+            self._condition.notify_all()
+        return pooled
+
+    async def _release(self, pooled: PooledBrowser, tab) -> None:
+        keep_tab = tab is not None and pooled.healthy()
+        if keep_tab:
+            try:
+                await tab.get('about:blank')
+            except Exception:
+                keep_tab = False
+                try:
+                    await tab.close()
+                except Exception:
+                    pass
+        async with self._condition:
+            pooled.leased -= 1
+            pooled.uses += 1
+            pooled.last_used = monotonic()
+            if keep_tab:
+                pooled.idle_tabs.append(tab)
+            if not pooled.healthy() or pooled.uses >= self.max_uses:
+                self._retire(pooled)
+            self._condition.notify_all()
+
+    async def _load_jar(self, pooled: PooledBrowser, domain: str) -> None:
+        jar = self._jars.get(domain)
+        if not jar or domain in pooled.synced:
+            return
+        try:
+            await pooled.browser.cookies.set_all([
+                cdp.network.CookieParam(
+                    name=cookie.name,
+                    value=cookie.value,
+                    domain=cookie.domain,
+                    path=cookie.path,
+                    secure=cookie.secure,
+                    http_only=cookie.http_only,
+                    expires=cookie.expires if cookie.expires and cookie.expires > 0 else None
+                )
+                for cookie in jar
+            ])
+            pooled.synced.add(domain)
+        except Exception as e:
+            log.debug('Falha ao copiar cookies de %s para o navegador: %s', domain, e)
+
+    async def _save_jar(self, pooled: PooledBrowser, domain: str) -> None:
+        try:
+            cookies = await pooled.browser.cookies.get_all()
+        except Exception as e:
+            log.debug('Falha ao ler cookies de %s: %s', domain, e)
+            return
+        self._jars[domain] = [c for c in cookies if c.domain.lstrip('.').endswith(domain)]
+        for other in self._browsers:
+            other.synced.discard(domain)
+        pooled.synced.add(domain)
+
+    def cookies(self, domain: str) -> dict:
+        """Cookies conhecidos do domínio (nome -> valor), do último navegador que o atendeu."""
+        return {cookie.name: cookie.value for cookie in self._jars.get(domain, [])}
+
+    @asynccontextmanager
+    async def lease(self, url: str, headless: bool = False, navigate: bool = True):
+        """
+        Empresta (browser, aba) já navegada para `url`. Com `navigate=False` a
+        aba vem em branco e quem usa navega (ex.: depois de registrar handlers
+        de rede). Só pode ser usado dentro de `run`.
+        """
+        extract = tldextract.extract(url)
+        domain = f"{extract.domain}.{extract.suffix}"
+        pooled = await self._acquire(domain, headless)
+        tab = None
+        try:
+            await self._load_jar(pooled, domain)
+            target = url if navigate else 'about:blank'
+            if pooled.idle_tabs:
+                tab = pooled.idle_tabs.pop()
+                if navigate:
+                    tab = await tab.get(target)
+            else:
+                tab = await pooled.browser.get(target, new_tab=True)
+            yield pooled.browser, tab
+        finally:
+            if tab is not None and pooled.healthy():
+                await self._save_jar(pooled, domain)
+            await self._release(pooled, tab)
+
+    def close(self) -> None:
+        if self._loop is None:
+            return
+
+        async def close_all():
+            for pooled in list(self._browsers):
+                self._retire(pooled)
+
+        self.run(close_all())
+
+browser_pool = BrowserPool()
@@ -0,0 +1,216 @@
+import re
+import json
+import base64
+import asyncio
+from typing import Callable
+from nodriver import cdp
+from core.__seedwork.infra.log import get_logger
+from core.browser.domain.capture_entity import CapturedResponse
+
+log = get_logger('browser')
+
+CAPTURE_BUFFER_SIZE = 64 * 1024 * 1024
+SCROLL_SCRIPT = '''
+    (() => {
+        window.scrollBy(0, window.innerHeight);
+        return window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 2;
+    })()
+'''
+
+def _matcher(match) -> Callable[[str], bool]:
+    if match is None:
+        return lambda url: False
+    if isinstance(match, str):
+        return lambda url: match in url
+    if isinstance(match, re.Pattern):
+        return lambda url: match.search(url) is not None
+    if callable(match):
+        return match
+    predicates = [_matcher(m) for m in match]
+    return lambda url: any(p(url) for p in predicates)
+
+async def capture(page, match=None, url: str | None = None, expected: int | None = None, idle: float = 1.5,
+                  timeout: float = 30.0, scroll: bool = False, bodies: bool = False) -> list[CapturedResponse]:
+    """
+    Captura as respostas da aba cujas URLs casam com `match` (substring, regex,
+    função ou lista delas), na ordem em que foram pedidas.
+
+    Termina assim que `expected` respostas casadas chegaram, quando a rede fica
+    `idle` segundos sem eventos ou no `timeout`. Com `url` a aba só navega
+    depois dos handlers registrados, então nada do carregamento se perde. Com
+    `scroll` a página desce uma tela por vez até o fim para disparar o
+    carregamento preguiçoso. Com `bodies` o corpo de cada resposta casada é lido
+    do próprio navegador, sem baixar de novo.
+    """
+    loop = asyncio.get_running_loop()
+    matches = _matcher(match)
+    wake = asyncio.Event()
+    order: list = []
+    responses: dict = {}
+    finished: set = set()
+    reads: dict = {}
+    last_event = loop.time()
+
+    async def read_body(request_id) -> bytes | None:
+        try:
+            body, encoded = await page.send(cdp.network.get_response_body(request_id))
+            return base64.b64decode(body) if encoded else body.encode('utf-8')
+        except Exception as e:
+            log.debug('Falha ao ler corpo de %s: %s', responses[request_id].url, e)
+            return None
+
+    def touch():
+        nonlocal last_event
+        last_event = loop.time()
+
+    def on_request(event: cdp.network.RequestWillBeSent):
+        touch()
+        if event.request_id not in responses and matches(event.request.url):
+            responses[event.request_id] = CapturedResponse(event.request.url)
+            order.append(event.request_id)
+
+    def on_response(event: cdp.network.ResponseReceived):
+        touch()
+        response = responses.get(event.request_id)
+        if response is not None:
+            response.status = event.response.status
+            response.mime_type = event.response.mime_type
+
+    def on_finished(event: cdp.network.LoadingFinished):
+        touch()
+        if event.request_id in responses and event.request_id not in finished:
+            finished.add(event.request_id)
+            if bodies:
+                reads[event.request_id] = asyncio.ensure_future(read_body(event.request_id))
+            wake.set()
+
+    def on_failed(event: cdp.network.LoadingFailed):
+        touch()
+        if event.request_id in responses:
+            finished.add(event.request_id)
+            wake.set()
+
+    handlers = [
+        (cdp.network.RequestWillBeSent, on_request),
+        (cdp.network.ResponseReceived, on_response),
+        (cdp.network.LoadingFinished, on_finished),
+        (cdp.network.LoadingFailed, on_failed),
+    ]
+    await page.send(cdp.network.enable(max_total_buffer_size=CAPTURE_BUFFER_SIZE * 4, max_resource_buffer_size=CAPTURE_BUFFER_SIZE))
+    for event, handler in handlers:
+        page.add_handler(event, handler)
+    try:
+        if url:
+            await page.get(url)
+            touch()
+        deadline = loop.time() + timeout
+        at_bottom = not scroll
+        while True:
+            if expected is not None and len(finished) >= expected:
+                break
+            now = loop.time()
+            if now >= deadline:
+                log.debug('Captura terminou por timeout com %s respostas', len(finished))
+                break
+            if at_bottom and now - last_event >= idle:
+                break
+            if not at_bottom:
+                try:
+                    at_bottom = bool(await page.evaluate(SCROLL_SCRIPT))
+                except Exception:
+                    at_bottom = True
+                touch()
+            wake.clear()
+            wait = min(deadline, last_event + idle) - loop.time()
+            if not at_bottom:
+                wait = min(wait, idle / 2)
+            try:
+                await asyncio.wait_for(wake.wait(), max(wait, 0.05))
+            except asyncio.TimeoutError:
+                pass
+        if reads:
+            results = await asyncio.gather(*reads.values())
+            for request_id, body in zip(reads, results):
+                responses[request_id].body = body
+    finally:
+        for event, handler in handlers:
+            page.remove_handler(event, handler)
+    return [responses[request_id] for request_id in order]
+
+async def wait_idle(page, idle: float = 1.5, timeout: float = 30.0, scroll: bool = False) -> None:
+    """Espera a rede da aba ficar `idle` segundos sem eventos (ou o `timeout`)."""
+    await capture(page, idle=idle, timeout=timeout, scroll=scroll)
+
+async def wait_for(page, condition: Callable, timeout: float = 30.0, recheck: float = 1.0):
+    """
+    Espera `condition(page)` (função async ou comum) ficar verdadeira e devolve
+    o valor dela, ou None no `timeout`. A condição é reavaliada a cada evento
+    de rede ou navegação da aba, e no máximo a cada `recheck` segundos quando
+    nada acontece (ex.: desafio resolvido só com JavaScript).
+    """
+    loop = asyncio.get_running_loop()
+    wake = asyncio.Event()
+
+    def on_event(event):
+        wake.set()
+
+    handlers = [
+        (cdp.network.LoadingFinished, on_event),
+        (cdp.page.FrameNavigated, on_event),
+        (cdp.page.LoadEventFired, on_event),
+    ]
+    for event, handler in handlers:
+        page.add_handler(event, handler)
+    try:
+        deadline = loop.time() + timeout
+        while True:
+            wake.clear()
+            try:
+                result = condition(page)
+                if asyncio.iscoroutine(result):
+                    result = await result
+            except Exception as e:
+                # Página no meio de uma navegação: tenta de novo no próximo evento
+                log.debug('Condição ainda indisponível: %s', e)
+                result = None
+            if result:
+                return result
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                log.debug('Espera terminou por timeout')
+                return None
+            try:
+                await asyncio.wait_for(wake.wait(), min(remaining, recheck))
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        for event, handler in handlers:
+            page.remove_handler(event, handler)
+
+async def wait_for_selector(page, selector: str, timeout: float = 30.0) -> bool:
+    """Espera algum elemento casar com o seletor CSS `selector` na aba."""
+    script = f'document.querySelector({json.dumps(selector)}) !== null'
+    return bool(await wait_for(page, lambda tab: tab.evaluate(script), timeout))
+
+async def wait_for_login(page, logged_in: Callable | None = None, timeout: float = 300.0, idle: float = 2.0) -> dict:
+    """
+    Espera o usuário terminar o login manual na aba e devolve os cookies do
+    navegador como dict. O login termina quando `logged_in(page)` fica
+    verdadeira ou, sem ela, quando aparece um cookie que não existia depois
+    do carregamento da página; em seguida a rede precisa ficar `idle`
+    segundos parada. No `timeout` devolve os cookies que houver.
+    """
+    async def cookies() -> dict:
+        return {cookie.name: cookie.value for cookie in await page.send(cdp.network.get_cookies())}
+
+    await wait_idle(page, idle=idle, timeout=timeout)
+    if logged_in is None:
+        before = set(await cookies())
+
+        async def logged_in(tab):
+            return bool(set(await cookies()) - before)
+
+    if not await wait_for(page, logged_in, timeout):
+        log.debug('Login manual não terminou em %s segundos', timeout)
+    await wait_idle(page, idle=idle, timeout=30.0)
+    return await cookies()
@@ -0,0 +1,72 @@
+import threading
+from typing import Any, Callable
+
+class _Round:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+    def outcome(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+class _DomainBypass:
+    def __init__(self):
+        self.generation = 0
+        self.running: _Round | None = None
+        self.last: _Round | None = None
+
+class BypassCoordinator:
+    """
+    Garante um único bypass do Cloudflare por domínio ao mesmo tempo.
+
+    Antes de cada requisição o chamador guarda `generation(domain)`. Ao receber
+    o bloqueio chama `solve` com essa geração: a primeira thread executa o
+    bypass, as que chegam durante a execução esperam e recebem o mesmo
+    resultado, e quem enviou a requisição antes de um bypass já concluído
+    (geração antiga) recebe o resultado dele sem abrir outro navegador.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._domains: dict[str, _DomainBypass] = {}
+
+    def _state(self, domain: str) -> _DomainBypass:
+        state = self._domains.get(domain)
+        if state is None:
+            state = _DomainBypass()
+            self._domains[domain] = state
+        return state
+
+    def generation(self, domain: str) -> int:
+        with self._lock:
+            return self._state(domain).generation
+
+    def solve(self, domain: str, generation: int, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            state = self._state(domain)
+            if state.running is None and state.generation > generation and state.last.error is None:
+                return state.last.outcome()
+            current = state.running
+            leader = current is None
+            if leader:
+                current = state.running = _Round()
+
+        if not leader:
+            current.event.wait()
+            return current.outcome()
+
+        try:
+            current.result = fn()
+        except BaseException as e:
+            current.error = e
+        with self._lock:
+            state.generation += 1
+            state.last = current
+            state.running = None
+        current.event.set()
+        return current.outcome()
+
+bypass_coordinator = BypassCoordinator()
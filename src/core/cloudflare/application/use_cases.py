@@ -1,7 +1,12 @@
+from typing import Iterator
 from core.__seedwork.application.use_cases import UseCase
 from core.cloudflare.domain.request_entity import Request
+from core.cloudflare.domain.challenge_entity import ChallengeKind
 from core.cloudflare.infra.nodriver import Cloudflare
 
+class ClassifyChallengeUseCase(UseCase):
+    def execute(self, content: str | bytes) -> ChallengeKind:
+        return Cloudflare().classify(content)
 
 class IsCloudflareBlockingUseCase(UseCase):
     def execute(self, html: str) -> bool:
@@ -24,9 +29,13 @@ class IsCloudflareEnableCookies(UseCase):
         return Cloudflare().is_cloudflare_enable_cookies(html)
 
 class BypassCloudflareUseCase(UseCase):
-    def execute(self, url: str) -> Request:
+    def execute(self, url: str) -> Request | None:
         return Cloudflare().bypass_cloudflare(url)
 
+class RenewCloudflareUseCase(UseCase):
+    def execute(self, url: str) -> Request | None:
+        return Cloudflare().renew_cloudflare(url)
+
 class BypassCloudflareNoCapchaUseCase(UseCase):
     def execute(self, url: str) -> str:
         return Cloudflare().bypass_cloudflare_no_capcha(url)
@@ -35,6 +44,10 @@ class BypassCloudflareNoCapchaFeachUseCase(UseCase):
     def execute(self, domain: str, url: str, background = False) -> str:
         return Cloudflare().bypass_cloudflare_no_capcha_fetch(domain, url, background)
 
+class BypassCloudflareNoCapchaFetchManyUseCase(UseCase):
+    def execute(self, domain: str, urls: list[str], background = False) -> Iterator[tuple[str, bytes | None]]:
+        return Cloudflare().bypass_cloudflare_no_capcha_fetch_many(domain, urls, background)
+
 class BypassCloudflareNoCapchaPostUseCase(UseCase):
     def execute(self, domain: str, url: str, background = False) -> str:
         return Cloudflare().bypass_cloudflare_no_capcha_post(domain, url, background)
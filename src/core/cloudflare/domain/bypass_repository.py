@@ -1,13 +1,23 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 from .request_entity import Request
+from .challenge_entity import ChallengeKind
 
 class BypassRepository(ABC):
+    @abstractmethod
+    def classify(content: str | bytes) -> ChallengeKind:
+        raise NotImplementedError()
+
     @abstractmethod
     def is_cloudflare_blocking(html: str) -> bool:
         raise NotImplementedError()
 
     @abstractmethod
-    def bypass_cloudflare(url: str) -> Request:
+    def bypass_cloudflare(url: str) -> Request | None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def renew_cloudflare(url: str) -> Request | None:
         raise NotImplementedError()
 
     @abstractmethod
@@ -18,3 +28,6 @@ class BypassRepository(ABC):
     def bypass_cloudflare_no_capcha_fetch(domain: str, url: str, background: bool) -> any:
         raise NotImplementedError()
 
+    @abstractmethod
+    def bypass_cloudflare_no_capcha_fetch_many(domain: str, urls: list[str], background: bool) -> Iterator[tuple[str, bytes | None]]:
+        raise NotImplementedError()
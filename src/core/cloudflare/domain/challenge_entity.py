@@ -0,0 +1,10 @@
+from enum import Enum
+
+class ChallengeKind(Enum):
+    OK = 'ok'
+    CHALLENGE = 'challenge'
+    ATTENTION = 'attention'
+    COOKIE_WALL = 'cookie_wall'
+    BAD_GATEWAY = 'bad_gateway'
+    TIMEOUT = 'timeout'
+    EMPTY = 'empty'
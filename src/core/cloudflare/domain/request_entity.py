@@ -5,6 +5,7 @@ from core.__seedwork.domain.entities import Entity
 class Request(Entity):
     user_agent: dict
     cloudflare_cookie_value: dict
+    expires: float | None = None
 
     @classmethod
     def from_dict(user_agent: dict, cloudflare_cookie_value: dict):
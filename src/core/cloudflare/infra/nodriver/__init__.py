@@ -1,91 +1,275 @@
+import re
+import html
+import json
 import base64
+import asyncio
 import tldextract
-import nodriver as uc
-from time import sleep
-from bs4 import BeautifulSoup
+from typing import Iterator
+from nodriver import cdp
 from core.config.request_data import RequestData
 from core.cloudflare.domain.request_entity import Request
+from core.cloudflare.domain.challenge_entity import ChallengeKind
 from core.cloudflare.domain.bypass_repository import BypassRepository
-from core.cloudflare.infra.nodriver.chrome import find_chrome_executable
+from core.browser.infra.nodriver.browser_pool import browser_pool
 from core.config.request_data import get_request, delete_request, insert_request, RequestData
+from core.__seedwork.infra.log import get_logger
+
+log = get_logger('cloudflare')
+
+HEAD_LIMIT = 128 * 1024
+CHALLENGE_TIMEOUT = 60.0
+CHALLENGE_RECHECK = 5.0
+FETCH_BUFFER_SIZE = 64 * 1024 * 1024
+FETCH_EVENT_TIMEOUT = 2.0
+FETCH_BATCH_SIZE = 8
+TITLE_RE = re.compile(rb'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+COOKIE_ALERT_RE = re.compile(rb'<div\b[^>]*\bid\s*=\s*(?:"cookie-alert"|\'cookie-alert\'|cookie-alert(?=[\s/>]))', re.IGNORECASE)
+EMPTY_HEAD_RE = re.compile(rb'<head\b[^>]*>\s*</head>', re.IGNORECASE)
+
+def classify_challenge(content: str | bytes | None) -> ChallengeKind:
+    """
+    Classifica uma resposta olhando só o começo do documento (até HEAD_LIMIT
+    bytes), sem montar a árvore HTML: título, div#cookie-alert e <head> vazio.
+    """
+    if not content:
+        return ChallengeKind.OK
+    if isinstance(content, str):
+        head = content[:HEAD_LIMIT].encode('utf-8', 'ignore')
+    else:
+        head = bytes(content[:HEAD_LIMIT])
+
+    match = TITLE_RE.search(head)
+    title = html.unescape(match.group(1).decode('utf-8', 'ignore')) if match else ''
+    if 'Just a moment...' in title or 'Um momento…' in title:
+        return ChallengeKind.CHALLENGE
+    if 'Attention Required! | Cloudflare' in title:
+        return ChallengeKind.ATTENTION
+    if COOKIE_ALERT_RE.search(head):
+        return ChallengeKind.COOKIE_WALL
+    if 'Bad gateway' in title:
+        return ChallengeKind.BAD_GATEWAY
+    if 'Gateway time-out' in title:
+        return ChallengeKind.TIMEOUT
+    if EMPTY_HEAD_RE.search(head):
+        return ChallengeKind.EMPTY
+    return ChallengeKind.OK
 
 class Cloudflare(BypassRepository):
-    def is_cloudflare_blocking(self, html: str) -> bool:
-        soup = BeautifulSoup(html, 'html.parser')
+    def classify(self, content: str | bytes) -> ChallengeKind:
+        return classify_challenge(content)
 
-        title = soup.title.string if soup.title else ""
-        if "Just a moment..." in title:
-            return True
-        
-        if "Um momento…" in title:
-            return True
-        
-        return False
+    def is_cloudflare_blocking(self, html: str) -> bool:
+        return classify_challenge(html) == ChallengeKind.CHALLENGE
     
     def is_cloudflare_time_out(self, html: str) -> bool:
-        soup = BeautifulSoup(html, 'html.parser')
-
-        title = soup.title.string if soup.title else ""
-        if "Gateway time-out" in title:
-            return True
-        
-        return False
+        return classify_challenge(html) == ChallengeKind.TIMEOUT
     
     def is_cloudflare_bad_gatway(self, html: str) -> bool:
-        soup = BeautifulSoup(html, 'html.parser')
-
-        title = soup.title.string if soup.title else ""
-        if "Bad gateway" in title:
-            return True
-        
-        return False
+        return classify_challenge(html) == ChallengeKind.BAD_GATEWAY
     
     def is_cloudflare_attention(self, html: str) -> bool:
-        soup = BeautifulSoup(html, 'html.parser')
-
-        title = soup.title.string if soup.title else ""
-        if "Attention Required! | Cloudflare" in title:
-            return True
-        
-        return False
+        return classify_challenge(html) == ChallengeKind.ATTENTION
         
     def is_cloudflare_enable_cookies(self, html: str) -> bool:
-        soup = BeautifulSoup(html, 'html.parser')
+        return classify_challenge(html) == ChallengeKind.COOKIE_WALL
 
-        alert = soup.select_one('div#cookie-alert')
-        if alert:
-            return True
-        
-        return False
+    @staticmethod
+    async def _clearance_cookie(browser, domain: str):
+        for cookie in await browser.cookies.get_all():
+            if cookie.name == 'cf_clearance' and cookie.domain.lstrip('.').endswith(domain):
+                return cookie
+        return None
+
+    @staticmethod
+    async def _clearance_request(browser, page, domain: str) -> Request:
+        """cf_clearance atual do domínio com a expiração e o user-agent a que está preso."""
+        agent = await page.evaluate('navigator.userAgent')
+        cookie = await Cloudflare._clearance_cookie(browser, domain)
+        expires = getattr(cookie, 'expires', None) if cookie else None
+        return Request(
+            user_agent={ 'user-agent': agent },
+            cloudflare_cookie_value={'cf_clearance': cookie.value} if cookie else {},
+            expires=expires if expires and expires > 0 else None
+        )
+
+    @staticmethod
+    async def _drop_clearance(browser, page, domain: str) -> None:
+        """Tira o cf_clearance do domínio do navegador para que o desafio emita um novo."""
+        for cookie in await browser.cookies.get_all():
+            if cookie.name == 'cf_clearance' and cookie.domain.lstrip('.').endswith(domain):
+                await page.send(cdp.network.delete_cookies(name=cookie.name, domain=cookie.domain, path=cookie.path))
+
+    @staticmethod
+    async def _store_clearance(browser, page, domain: str) -> None:
+        if get_request(domain):
+            delete_request(domain)
+        data = await Cloudflare._clearance_request(browser, page, domain)
+        insert_request(RequestData(domain=domain, headers=data.user_agent, cookies=data.cloudflare_cookie_value, expires=data.expires))
+
+    @staticmethod
+    async def _wait_for_challenge(page, timeout: float = CHALLENGE_TIMEOUT) -> bool:
+        """
+        Espera o desafio terminar sem polling agressivo: acorda quando o
+        navegador recebe um Set-Cookie com cf_clearance ou quando um documento
+        termina de carregar, e só então confere a página. Uma conferência a cada
+        CHALLENGE_RECHECK segundos cobre eventos perdidos.
+        """
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+
+        def on_response(event: cdp.network.ResponseReceivedExtraInfo):
+            for name, value in (event.headers or {}).items():
+                if name.lower() == 'set-cookie' and 'cf_clearance=' in value:
+                    wake.set()
+
+        def on_load(event: cdp.page.LoadEventFired):
+            wake.set()
+
+        page.add_handler(cdp.network.ResponseReceivedExtraInfo, on_response)
+        page.add_handler(cdp.page.LoadEventFired, on_load)
+        deadline = loop.time() + timeout
+        try:
+            while True:
+                if classify_challenge(await page.get_content()) != ChallengeKind.CHALLENGE:
+                    return True
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                wake.clear()
+                try:
+                    await asyncio.wait_for(wake.wait(), min(remaining, CHALLENGE_RECHECK))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            page.remove_handler(cdp.network.ResponseReceivedExtraInfo, on_response)
+            page.remove_handler(cdp.page.LoadEventFired, on_load)
+
+    @staticmethod
+    async def _read_as_base64(page, url: str, method: str) -> bytes | None:
+        encoded = await page.evaluate(f"""
+            fetch({json.dumps(url)}, {{method: {json.dumps(method)}}})
+                .then(response => response.ok ? response.blob() : Promise.reject(response.status))
+                .then(blob => new Promise((resolve, reject) => {{
+                    const reader = new FileReader();
+                    reader.onload = () => resolve(reader.result.slice(reader.result.indexOf(',') + 1));
+                    reader.onerror = () => reject(reader.error);
+                    reader.readAsDataURL(blob);
+                }}))
+                .catch(() => null)
+        """, await_promise=True, return_by_value=True)
+        return base64.b64decode(encoded) if isinstance(encoded, str) else None
+
+    @staticmethod
+    async def _fetch_many(page, urls: list[str], method: str = 'GET') -> dict[str, tuple[int, bytes | None]]:
+        """
+        Busca várias URLs ao mesmo tempo no contexto da página. O JavaScript só
+        dispara os fetch e devolve o status e o tamanho de cada corpo; os bytes
+        vêm pelo CDP com Network.getResponseBody, sem laço byte a byte no
+        navegador. Corpos que o Chrome já descartou do buffer são lidos via
+        FileReader.
+
+        Devolve `{url: (status, corpo)}`. Respostas fora de 2xx e erros de rede
+        (status 0) vêm com corpo None.
+        """
+        urls = list(dict.fromkeys(urls))
+        pending = set(urls)
+        request_ids: dict[str, str] = {}
+        finished = set()
+        done = asyncio.Event()
+
+        def on_request(event: cdp.network.RequestWillBeSent):
+            url = event.request.url
+            if event.redirect_response is None and url in pending and event.request.method == method:
+                pending.discard(url)
+                request_ids[url] = event.request_id
+
+        def check():
+            if all(request_id in finished for request_id in request_ids.values()):
+                done.set()
+
+        def on_finished(event: cdp.network.LoadingFinished | cdp.network.LoadingFailed):
+            finished.add(event.request_id)
+            check()
+
+        await page.send(cdp.network.enable(max_total_buffer_size=FETCH_BUFFER_SIZE * 4, max_resource_buffer_size=FETCH_BUFFER_SIZE))
+        page.add_handler(cdp.network.RequestWillBeSent, on_request)
+        page.add_handler(cdp.network.LoadingFinished, on_finished)
+        page.add_handler(cdp.network.LoadingFailed, on_finished)
+        try:
+            results = await page.evaluate(f"""
+                Promise.all({json.dumps(urls)}.map(url =>
+                    fetch(url, {{method: {json.dumps(method)}}})
+                        .then(response => response.arrayBuffer()
+                            .then(buffer => [response.status, response.ok ? buffer.byteLength : -1]))
+                        .catch(() => [0, -1])))
+            """, await_promise=True, return_by_value=True)
+            if not isinstance(results, list):
+                results = [[0, -1]] * len(urls)
+            done.clear()
+            check()
+            try:
+                await asyncio.wait_for(done.wait(), FETCH_EVENT_TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            page.remove_handler(cdp.network.RequestWillBeSent, on_request)
+            page.remove_handler(cdp.network.LoadingFinished, on_finished)
+            page.remove_handler(cdp.network.LoadingFailed, on_finished)
+
+        async def body(url: str, status, size) -> tuple[int, bytes | None]:
+            if size == -1:
+                log.debug('Fetch pelo navegador falhou para %s: status %s', url, status)
+                return status, None
+            return status, await read(url)
+
+        async def read(url: str) -> bytes | None:
+            request_id = request_ids.get(url)
+            if request_id is not None:
+                try:
+                    data, encoded = await page.send(cdp.network.get_response_body(request_id))
+                    return base64.b64decode(data) if encoded else data.encode('utf-8')
+                except Exception as e:
+                    log.debug('getResponseBody indisponível para %s: %s', url, e)
+            return await Cloudflare._read_as_base64(page, url, method)
+
+        bodies = await asyncio.gather(*(body(url, *result) for url, result in zip(urls, results)))
+        return dict(zip(urls, bodies))
+
+    @staticmethod
+    async def _fetch(page, url: str, method: str = 'GET') -> bytes:
+        status, content = (await Cloudflare._fetch_many(page, [url], method))[url]
+        if content is None:
+            raise Exception(f'Falha ao buscar {url} pelo navegador STATUS: {status}')
+        return content
 
-    def bypass_cloudflare(self, url: str) -> Request:
-        headers={}
-        cookies={}
+    def bypass_cloudflare(self, url: str) -> Request | None:
         async def get_cloudflare_cookie():
-            nonlocal headers, cookies
-            browser = await uc.start(
-                browser_executable_path=find_chrome_executable(),
-            )
-            page = await browser.get(url)
-            agent = await page.evaluate('navigator.userAgent')
-            headers = { 'user-agent': agent }
-            temp_count = 1
-            while(True):
-                page_content = await page.get_content()
-                if self.is_cloudflare_blocking(page_content):
-                    sleep(temp_count)
-                    temp_count += 1
-                else:
-                    break
-                if temp_count > 10:
-                    break
-            cookiesB = await browser.cookies.get_all()
-            for cookie in cookiesB:
-                if(cookie.name == 'cf_clearance'):
-                    cookies = {'cf_clearance': cookie.value}
-            browser.stop()
-        uc.loop().run_until_complete(get_cloudflare_cookie())
-        return Request(user_agent=headers, cloudflare_cookie_value=cookies)
+            extract = tldextract.extract(url)
+            onlydomain = f"{extract.domain}.{extract.suffix}"
+            async with browser_pool.lease(url) as (browser, page):
+                if not await self._wait_for_challenge(page):
+                    # O cookie que estiver no navegador é o antigo, não um novo
+                    log.warning('Desafio do Cloudflare não terminou em %s', onlydomain)
+                    return None
+                return await self._clearance_request(browser, page, onlydomain)
+        return browser_pool.run(get_cloudflare_cookie())
+
+    def renew_cloudflare(self, url: str) -> Request | None:
+        async def renew_cloudflare_cookie():
+            extract = tldextract.extract(url)
+            onlydomain = f"{extract.domain}.{extract.suffix}"
+            # Renovação é proativa, em segundo plano: não abre janela na frente
+            # do usuário
+            async with browser_pool.lease(url, headless=True, navigate=False) as (browser, page):
+                # O navegador do pool ainda tem o cookie atual; sem tirá-lo o
+                # site não desafia de novo e a expiração não anda.
+                await self._drop_clearance(browser, page, onlydomain)
+                page = await page.get(url)
+                if not await self._wait_for_challenge(page):
+                    log.warning('Desafio do Cloudflare não terminou ao renovar %s', onlydomain)
+                    return None
+                return await self._clearance_request(browser, page, onlydomain)
+        return browser_pool.run(renew_cloudflare_cookie())
     
     def bypass_cloudflare_no_capcha(self, url: str) -> str:
         content={}
@@ -94,211 +278,123 @@ class Cloudflare(BypassRepository):
             cloudflare = False
             extract = tldextract.extract(url)
             onlydomain = f"{extract.domain}.{extract.suffix}"
-            browser = await uc.start(
-                browser_executable_path=None
-            )
-            page = await browser.get(url)
-            request_data = get_request(onlydomain)
-            if(request_data):
-                re = request_data
-                await page.evaluate(f'document.cookie = "cf_clearance={re.cookies['cf_clearance']}; path=/; max-age=3600; secure; samesite=strict";')
-                await page.reload()
-            while(True):
+            async with browser_pool.lease(url) as (browser, page):
+                request_data = get_request(onlydomain)
+                if(request_data):
+                    re = request_data
+                    await page.evaluate(f'document.cookie = "cf_clearance={re.cookies['cf_clearance']}; path=/; max-age=3600; secure; samesite=strict";')
+                    await page.reload()
                 page_content = await page.get_content()
-                soup = BeautifulSoup(page_content, 'html.parser')
-                head = soup.find('head')
-                if self.is_cloudflare_blocking(page_content):
+                if classify_challenge(page_content) == ChallengeKind.CHALLENGE:
                     cloudflare = True
-                    sleep(1)
-                elif head and not head.contents:
+                    await self._wait_for_challenge(page)
+                    page_content = await page.get_content()
+                kind = classify_challenge(page_content)
+                if kind in (ChallengeKind.CHALLENGE, ChallengeKind.EMPTY):
                     content = None
-                    break
                 else:
                     if cloudflare:
-                        request_data = get_request(onlydomain)
-                        if(request_data):
-                            delete_request(onlydomain)
-                        agent = await page.evaluate('navigator.userAgent')
-                        headers = { 'user-agent': agent }
-                        cookiesB = await browser.cookies.get_all()
-                        cookies={}
-                        for cookie in cookiesB:
-                            if(cookie.name == 'cf_clearance'):
-                                cookies = {'cf_clearance': cookie.value}
-                        insert_request(RequestData(domain=onlydomain, headers=headers, cookies=cookies))
+                        await self._store_clearance(browser, page, onlydomain)
                     
                     # Reload para mangalivre.tv
                     if "mangalivre.tv" in url:
                         await page.reload()
-                        sleep(7)
+                        await asyncio.sleep(7)
                         page_content = await page.get_content()
                     
                     content = page_content 
-                    break
-            browser.stop()
-        uc.loop().run_until_complete(get_cloudflare_cookie())
+        browser_pool.run(get_cloudflare_cookie())
         return content
     
-    def bypass_cloudflare_no_capcha_fetch(self, domain: str, url: str, background = False) -> any:
+    async def _prepare_session(self, browser, page, onlydomain: str) -> bool | None:
+        """
+        Deixa a aba pronta para fetch no domínio: resolve o desafio se houver e
+        grava o novo cf_clearance. Retorna None se o desafio não terminou e
+        False se a página veio vazia.
+        """
+        kind = classify_challenge(await page.get_content())
+        if kind == ChallengeKind.CHALLENGE:
+            if not await self._wait_for_challenge(page):
+                return None
+            await self._store_clearance(browser, page, onlydomain)
+            kind = classify_challenge(await page.get_content())
+        return kind != ChallengeKind.EMPTY
+
+    async def _inject_clearance(self, page, onlydomain: str) -> None:
+        request_data = get_request(onlydomain)
+        if(request_data):
+            re = request_data
+            if(re.cookies):
+                await page.evaluate(f'document.cookie = "cf_clearance={re.cookies['cf_clearance']}; path=/; max-age=3600; secure; samesite=strict";')
+                await page.reload()
+
+    def _bypass_fetch(self, domain: str, url: str, method: str, background: bool) -> any:
         content={}
         async def get_cloudflare_cookie():
             nonlocal content
-            cloudflare = False
             extract = tldextract.extract(domain)
             onlydomain = f"{extract.domain}.{extract.suffix}"
-            browser = await uc.start(
-                browser_executable_path=None,
-                headless=background
-            )
-            page = await browser.get(domain)
-            request_data = get_request(onlydomain)
-            if(request_data):
-                re = request_data
-                if(re.cookies):
-                    await page.evaluate(f'document.cookie = "cf_clearance={re.cookies['cf_clearance']}; path=/; max-age=3600; secure; samesite=strict";')
-                    await page.reload()
-                    cloudflare = False
-            count = 1
-            while(True):
-                try:
-                    page = await browser.get(domain)
-                    page_content = await page.get_content()
-                    soup = BeautifulSoup(page_content, 'html.parser')
-                    head = soup.find('head')
-                    if self.is_cloudflare_blocking(page_content):
-                        cloudflare = True
-                        sleep(count)
-                        count += 1
-                        if count > 10:
+            async with browser_pool.lease(domain, headless=background) as (browser, page):
+                await self._inject_clearance(page, onlydomain)
+                for attempt in range(3):
+                    try:
+                        if attempt:
+                            page = await page.get(domain)
+                        ready = await self._prepare_session(browser, page, onlydomain)
+                        if ready is None:
                             break
-                    elif head and not head.contents:
-                        content = None
-                        break
-                    else:
-                        fetch_content = await page.evaluate(f'''
-                            fetch("{url}")''' + '''.then(response => response.arrayBuffer()).then(buffer => {
-                                let binary = '';
-                                let bytes = new Uint8Array(buffer);
-                                let len = bytes.byteLength;
-                                for (let i = 0; i < len; i++) {
-                                    binary += String.fromCharCode(bytes[i]);
-                                }
-                                return btoa(binary);
-                            });
-                        ''', await_promise=True)
-                        if cloudflare:
-                            request_data = get_request(onlydomain)
-                            if(request_data):
-                                delete_request(onlydomain)
-                            agent = await page.evaluate('navigator.userAgent')
-                            headers = { 'user-agent': agent }
-                            cookiesB = await browser.cookies.get_all()
-                            cookies={}
-                            for cookie in cookiesB:
-                                if(cookie.name == 'cf_clearance'):
-                                    cookies = {'cf_clearance': cookie.value}
-                            insert_request(RequestData(domain=onlydomain, headers=headers, cookies=cookies))
+                        if not ready:
+                            content = None
+                            break
+                        fetch_content = await self._fetch(page, url, method)
                         
                         # Reload para mangalivre.tv
                         if "mangalivre.tv" in url:
                             await page.reload()
-                            sleep(7)
-                            fetch_content = await page.evaluate(f'''
-                                fetch("{url}")''' + '''.then(response => response.arrayBuffer()).then(buffer => {
-                                    let binary = '';
-                                    let bytes = new Uint8Array(buffer);
-                                    let len = bytes.byteLength;
-                                    for (let i = 0; i < len; i++) {
-                                        binary += String.fromCharCode(bytes[i]);
-                                    }
-                                    return btoa(binary);
-                                });
-                            ''', await_promise=True)
+                            await asyncio.sleep(7)
+                            fetch_content = await self._fetch(page, url, method)
                         
-                        content = base64.b64decode(fetch_content)
+                        content = fetch_content
                         break
-                except Exception as e:
-                    print(e)
-            browser.stop()
-        uc.loop().run_until_complete(get_cloudflare_cookie())
+                    except Exception as e:
+                        log.warning('Falha ao buscar %s pelo navegador: %s', url, e)
+        browser_pool.run(get_cloudflare_cookie())
         return content
 
+    def bypass_cloudflare_no_capcha_fetch_many(self, domain: str, urls: list[str], background = False, batch_size: int = FETCH_BATCH_SIZE) -> Iterator[tuple[str, bytes | None]]:
+        """
+        Busca várias URLs numa única sessão do navegador: o desafio é resolvido
+        uma vez e as URLs são buscadas em lotes concorrentes de `batch_size`.
+        Os resultados saem na ordem de `urls`, lote a lote, como (url, bytes);
+        bytes é None quando a URL falhou.
+        """
+        extract = tldextract.extract(domain)
+        onlydomain = f"{extract.domain}.{extract.suffix}"
+
+        async def fetch_all():
+            async with browser_pool.lease(domain, headless=background) as (browser, page):
+                await self._inject_clearance(page, onlydomain)
+                ready = await self._prepare_session(browser, page, onlydomain)
+                for i in range(0, len(urls), batch_size):
+                    chunk = urls[i:i + batch_size]
+                    bodies = await self._fetch_many(page, chunk) if ready else {}
+                    for url in chunk:
+                        _, content = bodies.get(url, (0, None))
+                        yield url, content
+
+        stream = fetch_all()
+
+        async def step():
+            return await anext(stream, None)
+
+        try:
+            while (item := browser_pool.run(step())) is not None:
+                yield item
+        finally:
+            browser_pool.run(stream.aclose())
+
+    def bypass_cloudflare_no_capcha_fetch(self, domain: str, url: str, background = False) -> any:
+        return self._bypass_fetch(domain, url, 'GET', background)
+
     def bypass_cloudflare_no_capcha_post(self, domain: str, url: str, background = False) -> any:
-        content={}
-        async def get_cloudflare_cookie():
-            nonlocal content
-            cloudflare = False
-            extract = tldextract.extract(domain)
-            onlydomain = f"{extract.domain}.{extract.suffix}"
-            browser = await uc.start(
-                browser_executable_path=None,
-                headless=background
-            )
-            page = await browser.get(domain)
-            request_data = get_request(onlydomain)
-            if(request_data):
-                re = request_data
-                if(re.cookies):
-                    await page.evaluate(f'document.cookie = "cf_clearance={re.cookies['cf_clearance']}; path=/; max-age=3600; secure; samesite=strict";')
-                    await page.reload()
-                    cloudflare = False
-            while(True):
-                try:
-                    page = await browser.get(domain)
-                    page_content = await page.get_content()
-                    soup = BeautifulSoup(page_content, 'html.parser')
-                    head = soup.find('head')
-                    if self.is_cloudflare_blocking(page_content):
-                        cloudflare = True
-                        sleep(1)
-                    elif head and not head.contents:
-                        content = None
-                        break
-                    else:
-                        fetch_content = await page.evaluate(f'''
-                            fetch("{url}", {{method: "POST"}})''' + '''.then(response => response.arrayBuffer()).then(buffer => {
-                                let binary = '';
-                                let bytes = new Uint8Array(buffer);
-                                let len = bytes.byteLength;
-                                for (let i = 0; i < len; i++) {
-                                    binary += String.fromCharCode(bytes[i]);
-                                }
-                                return btoa(binary);
-                            });
-                        ''', await_promise=True)
-                        if cloudflare:
-                            request_data = get_request(onlydomain)
-                            if(request_data):
-                                delete_request(onlydomain)
-                            agent = await page.evaluate('navigator.userAgent')
-                            headers = { 'user-agent': agent }
-                            cookiesB = await browser.cookies.get_all()
-                            cookies={}
-                            for cookie in cookiesB:
-                                if(cookie.name == 'cf_clearance'):
-                                    cookies = {'cf_clearance': cookie.value}
-                            insert_request(RequestData(domain=onlydomain, headers=headers, cookies=cookies))
-                        
-                        # Reload para mangalivre.tv
-                        if "mangalivre.tv" in url:
-                            await page.reload()
-                            sleep(7)
-                            fetch_content = await page.evaluate(f'''
-                                fetch("{url}", {{method: "POST"}})''' + '''.then(response => response.arrayBuffer()).then(buffer => {
-                                    let binary = '';
-                                    let bytes = new Uint8Array(buffer);
-                                    let len = bytes.byteLength;
-                                    for (let i = 0; i < len; i++) {
-                                        binary += String.fromCharCode(bytes[i]);
-                                    }
-                                    return btoa(binary);
-                                });
-                            ''', await_promise=True)
-                        
-                        content = base64.b64decode(fetch_content)
-                        break
-                except Exception as e:
-                    print(e)
-            browser.stop()
-        uc.loop().run_until_complete(get_cloudflare_cookie())
-        return content
\ No newline at end of file
+        return self._bypass_fetch(domain, url, 'POST', background)
@@ -0,0 +1,59 @@
+import threading
+from core.cloudflare.application.coordinator import BypassCoordinator
+
+class TestBypassCoordinator:
+    def test_concurrent_callers_share_one_bypass(self):
+        coordinator = BypassCoordinator()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def solve():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 'cookie'
+
+        generation = coordinator.generation('a.com')
+        results = []
+        leader = threading.Thread(target=lambda: results.append(coordinator.solve('a.com', generation, solve)))
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=lambda: results.append(coordinator.solve('a.com', generation, solve))) for _ in range(3)]
+        for thread in followers:
+            thread.start()
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        assert calls == [1]
+        assert results == ['cookie'] * 4
+        assert coordinator.generation('a.com') == generation + 1
+
+    def test_stale_generation_reuses_last_result(self):
+        coordinator = BypassCoordinator()
+        stale = coordinator.generation('a.com')
+        assert coordinator.solve('a.com', stale, lambda: 'first') == 'first'
+        # Requisição enviada antes do bypass terminar não abre outro navegador
+        assert coordinator.solve('a.com', stale, lambda: 'second') == 'first'
+        # Já com a geração nova, um bloqueio indica cookie vencido: roda de novo
+        assert coordinator.solve('a.com', coordinator.generation('a.com'), lambda: 'second') == 'second'
+
+    def test_stale_generation_retries_after_failure(self):
+        coordinator = BypassCoordinator()
+        stale = coordinator.generation('a.com')
+
+        def fail():
+            raise RuntimeError('browser crashed')
+
+        try:
+            coordinator.solve('a.com', stale, fail)
+        except RuntimeError:
+            pass
+        assert coordinator.solve('a.com', stale, lambda: 'cookie') == 'cookie'
+
+    def test_domains_are_independent(self):
+        coordinator = BypassCoordinator()
+        coordinator.solve('a.com', 0, lambda: 'a')
+        assert coordinator.generation('b.com') == 0
+        assert coordinator.solve('b.com', 0, lambda: 'b') == 'b'
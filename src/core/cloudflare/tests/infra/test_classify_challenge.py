@@ -0,0 +1,45 @@
+from core.cloudflare.domain.challenge_entity import ChallengeKind
+from core.cloudflare.infra.nodriver import classify_challenge, HEAD_LIMIT
+
+def page(title='', body='', head=None):
+    head = f'<title>{title}</title>' if head is None else head
+    return f'<!DOCTYPE html><html><head>{head}</head><body>{body}</body></html>'
+
+class TestClassifyChallenge:
+    def test_challenge(self):
+        assert classify_challenge(page('Just a moment...')) == ChallengeKind.CHALLENGE
+        assert classify_challenge(page('Um momento&hellip;').encode()) == ChallengeKind.CHALLENGE
+
+    def test_attention(self):
+        assert classify_challenge(page('Attention Required! | Cloudflare')) == ChallengeKind.ATTENTION
+
+    def test_cookie_wall(self):
+        assert classify_challenge(page('Manga', '<div class="x" id="cookie-alert">')) == ChallengeKind.COOKIE_WALL
+        assert classify_challenge(page('Manga', "<DIV ID='cookie-alert'>")) == ChallengeKind.COOKIE_WALL
+        assert classify_challenge(page('Manga', '<div id=cookie-alert>')) == ChallengeKind.COOKIE_WALL
+        assert classify_challenge(page('Manga', '<div id="cookie-alert-text">')) == ChallengeKind.OK
+
+    def test_bad_gateway(self):
+        assert classify_challenge(page('example.com | 502: Bad gateway')) == ChallengeKind.BAD_GATEWAY
+
+    def test_timeout(self):
+        assert classify_challenge(page('example.com | 504: Gateway time-out')) == ChallengeKind.TIMEOUT
+
+    def test_empty_head(self):
+        assert classify_challenge(page(head='\n  ')) == ChallengeKind.EMPTY
+
+    def test_ok(self):
+        assert classify_challenge(page('Capítulo 1')) == ChallengeKind.OK
+        assert classify_challenge('') == ChallengeKind.OK
+        assert classify_challenge(None) == ChallengeKind.OK
+
+    def test_precedence(self):
+        # O título do desafio vale mais que o aviso de cookies e o <head> vazio
+        assert classify_challenge(page('Just a moment...', '<div id="cookie-alert">')) == ChallengeKind.CHALLENGE
+        assert classify_challenge(page('Attention Required! | Cloudflare', '<div id="cookie-alert">')) == ChallengeKind.ATTENTION
+        assert classify_challenge('<head></head>' + page('502: Bad gateway')) == ChallengeKind.BAD_GATEWAY
+        assert classify_challenge(page(head='', body='<div id="cookie-alert">')) == ChallengeKind.COOKIE_WALL
+
+    def test_only_reads_the_beginning(self):
+        content = 'x' * HEAD_LIMIT + '<title>Just a moment...</title>'
+        assert classify_challenge(content) == ChallengeKind.OK
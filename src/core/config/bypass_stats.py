@@ -0,0 +1,71 @@
+from pathlib import Path
+from os import makedirs
+from platformdirs import user_config_dir
+from dataclasses import dataclass, asdict
+from core.__seedwork.infra.database import Database
+
+data_path = user_config_dir('pyteste')
+db_path = Path(data_path) / 'bypass.db'
+makedirs(data_path, exist_ok=True)
+
+@dataclass
+class BypassStats:
+    domain: str
+    kind: str
+    strategy: str
+    successes: int = 0
+    failures: int = 0
+    latency: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        total = self.successes + self.failures
+        return self.successes / total if total else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.latency / self.successes if self.successes else float('inf')
+
+    def as_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+def init_db(conn) -> None:
+    columns = [row[1] for row in conn.execute('PRAGMA table_info(bypass_stats)')]
+    if columns and 'kind' not in columns:
+        # A versão antiga somava todos os tipos de bloqueio juntos e não dá
+        # para separar; as estatísticas recomeçam por tipo.
+        conn.execute('DROP TABLE bypass_stats')
+    conn.execute('''CREATE TABLE IF NOT EXISTS bypass_stats (
+                        domain TEXT,
+                        kind TEXT,
+                        strategy TEXT,
+                        successes INTEGER DEFAULT 0,
+                        failures INTEGER DEFAULT 0,
+                        latency REAL DEFAULT 0,
+                        PRIMARY KEY (domain, kind, strategy)
+                      )''')
+
+db = Database(db_path, init_db)
+
+def record_bypass(domain: str, kind: str, strategy: str, success: bool, latency: float) -> None:
+    """Soma o resultado de uma tentativa contra um tipo de bloqueio; a latência só conta nos sucessos."""
+    db.execute('''INSERT INTO bypass_stats (domain, kind, strategy, successes, failures, latency) VALUES (?, ?, ?, ?, ?, ?)
+                  ON CONFLICT (domain, kind, strategy) DO UPDATE SET
+                    successes = successes + excluded.successes,
+                    failures = failures + excluded.failures,
+                    latency = latency + excluded.latency''',
+               (domain, kind, strategy, int(success), int(not success), latency if success else 0.0))
+
+def get_bypass_stats(domain: str, kind: str | None = None) -> list[BypassStats]:
+    if kind is None:
+        rows = db.fetchall('SELECT domain, kind, strategy, successes, failures, latency FROM bypass_stats WHERE domain = ?', (domain,))
+    else:
+        rows = db.fetchall('SELECT domain, kind, strategy, successes, failures, latency FROM bypass_stats WHERE domain = ? AND kind = ?', (domain, kind))
+    return [BypassStats(*row) for row in rows]
+
+def delete_bypass_stats(domain: str) -> None:
+    db.execute('DELETE FROM bypass_stats WHERE domain = ?', (domain,))
@@ -1,14 +1,15 @@
-import sqlite3
 from os import makedirs, getcwd, path
 from platformdirs import user_config_dir
 from dataclasses import dataclass, asdict
 from pathlib import Path
+from core.__seedwork.infra.database import Database, add_column
+from core.config.service import ConfigService
 
 config_path = user_config_dir('pyteste')
 db_path = Path(config_path) / 'config.db'
 makedirs(config_path, exist_ok=True)
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     img: str
     save: str = path.join(getcwd(), 'mangas')
@@ -24,6 +25,9 @@ class Config:
     scan_line_step: int = 5
     slice_replace_original_files: bool = False
     group_replace_original_files: bool = False
+    download_workers: int = 4
+    domain_workers: int = 6
+    keep_original: bool = False
 
     def as_dict(self):
         return asdict(self)
@@ -32,26 +36,8 @@ class Config:
     def from_dict(cls, data):
         return cls(**data)
 
-import sqlite3
-
-def add_field_if_not_exists(field_name: str, field_type: str = 'TEXT', default_value: str = None):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("PRAGMA table_info(config)")
-    fields = [column[1] for column in cursor.fetchall()]
-    
-    if field_name not in fields:
-        cursor.execute(f"ALTER TABLE config ADD COLUMN {field_name} {field_type}")
-        if default_value is not None:
-            cursor.execute(f"UPDATE config SET {field_name} = ? WHERE {field_name} IS NULL", (default_value,))
-        conn.commit()
-    conn.close()
-
-
-def init_db():
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('''CREATE TABLE IF NOT EXISTS config (
+def init_db(conn) -> None:
+    conn.execute('''CREATE TABLE IF NOT EXISTS config (
                         img TEXT,
                         save TEXT,
                         group_format TEXT,
@@ -65,43 +51,48 @@ def init_db():
                         ignorable_pixels INTEGER,
                         scan_line_step INTEGER
                       )''')
-    conn.commit()
-    conn.close()
 
-    add_field_if_not_exists('slice_replace_original_files', 'INTEGER', 0)
-    add_field_if_not_exists('group_replace_original_files', 'INTEGER', 0)
+    add_column(conn, 'config', 'slice_replace_original_files', 'INTEGER', 0)
+    add_column(conn, 'config', 'group_replace_original_files', 'INTEGER', 0)
+    add_column(conn, 'config', 'download_workers', 'INTEGER', 4)
+    add_column(conn, 'config', 'domain_workers', 'INTEGER', 6)
+    add_column(conn, 'config', 'keep_original', 'INTEGER', 0)
+
+db = Database(db_path, init_db)
+
+# Atributo do Config -> coluna da tabela, quando os nomes diferem
+COLUMNS = {'group': 'group_flag'}
+
+def _column_value(value):
+    return int(value) if isinstance(value, bool) else value
 
 def init() -> Config:
-    init_db()
     config = Config(img='.jpg')
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('INSERT INTO config VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
-                   (config.img, config.save, config.group_format, int(config.group), int(config.slice),
-                    config.detection_type, config.custom_width, int(config.automatic_width),
-                    config.split_height, config.detection_sensitivity, config.ignorable_pixels, config.scan_line_step, 
-                    int(config.slice_replace_original_files), int(config.group_replace_original_files)))
-    conn.commit()
-    conn.close()
+    values = config.as_dict()
+    columns = ', '.join(COLUMNS.get(field, field) for field in values)
+    db.execute(f'INSERT INTO config ({columns}) VALUES ({", ".join("?" * len(values))})',
+               tuple(_column_value(value) for value in values.values()))
     return config
 
-def get_config() -> Config:
-    init_db()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM config LIMIT 1')
-    row = cursor.fetchone()
-    conn.close()
+def _load() -> Config:
+    row = db.fetchone('SELECT * FROM config LIMIT 1')
     if row is None:
         return init()
     return Config(*row)
 
+def _save(changes: dict) -> None:
+    with db.transaction() as conn:
+        for field, value in changes.items():
+            conn.execute(f'UPDATE config SET {COLUMNS.get(field, field)} = ? WHERE rowid = 1',
+                         (_column_value(value),))
+
+config_service = ConfigService(_load, _save)
+
+def get_config() -> Config:
+    return config_service.snapshot()
+
 def update_config_field(field: str, value):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(f'UPDATE config SET {field} = ? WHERE rowid = 1', (value,))
-    conn.commit()
-    conn.close()
+    config_service.update(**{field: value})
 
 def update_img(img: str) -> None:
     update_config_field('img', img)
@@ -110,7 +101,7 @@ def update_save(save: str) -> None:
     update_config_field('save', save)
 
 def update_slice(slice: bool) -> None:
-    update_config_field('slice', int(slice))
+    update_config_field('slice', slice)
 
 def update_detection_type(detection_type: str | None) -> None:
     update_config_field('detection_type', detection_type)
@@ -131,16 +122,25 @@ def update_scan_line_step(scan_line_step: int) -> None:
     update_config_field('scan_line_step', scan_line_step)
 
 def update_automatic_width(automatic_width: bool) -> None:
-    update_config_field('automatic_width', int(automatic_width))
+    update_config_field('automatic_width', automatic_width)
 
 def update_group_format(group_format: str) -> None:
     update_config_field('group_format', group_format)
 
 def update_group(group: bool) -> None:
-    update_config_field('group_flag', int(group))
+    update_config_field('group', group)
 
 def update_group_replace_original_files(replace: bool) -> None:
-    update_config_field('group_replace_original_files', int(replace))
+    update_config_field('group_replace_original_files', replace)
 
 def update_slice_replace_original_files(replace: bool) -> None:
-    update_config_field('slice_replace_original_files', int(replace))
\ No newline at end of file
+    update_config_field('slice_replace_original_files', replace)
+
+def update_download_workers(download_workers: int) -> None:
+    update_config_field('download_workers', download_workers)
+
+def update_domain_workers(domain_workers: int) -> None:
+    update_config_field('domain_workers', domain_workers)
+
+def update_keep_original(keep_original: bool) -> None:
+    update_config_field('keep_original', keep_original)
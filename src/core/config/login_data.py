@@ -1,9 +1,9 @@
-import sqlite3
 from pathlib import Path
 from os import makedirs
 from platformdirs import user_config_dir
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import json
+from core.__seedwork.infra.database import Database, RecordCache
 
 data_path = user_config_dir('pyteste')
 db_path = Path(data_path) / 'login.db'
@@ -22,37 +22,33 @@ class LoginData:
     def from_dict(cls, data):
         return cls(**data)
 
-def init_db():
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('''CREATE TABLE IF NOT EXISTS login (
+def init_db(conn) -> None:
+    conn.execute('''CREATE TABLE IF NOT EXISTS login (
                         domain TEXT PRIMARY KEY,
                         headers TEXT,
                         cookies TEXT
                       )''')
-    conn.commit()
-    conn.close()
+
+db = Database(db_path, init_db)
+cache = RecordCache(db)
+
+def _copy(data: LoginData | None) -> LoginData | None:
+    return replace(data, headers=dict(data.headers or {}), cookies=dict(data.cookies or {})) if data else None
 
 def insert_login(data: LoginData) -> None:
-    init_db()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('INSERT OR REPLACE INTO login (domain, headers, cookies) VALUES (?, ?, ?)',
-                   (data.domain, json.dumps(data.headers), json.dumps(data.cookies)))
-    conn.commit()
-    conn.close()
+    db.execute('INSERT OR REPLACE INTO login (domain, headers, cookies) VALUES (?, ?, ?)',
+               (data.domain, json.dumps(data.headers), json.dumps(data.cookies)))
+    cache.put(data.domain, _copy(data))
 
-def get_login(domain: str) -> LoginData | None:
-    init_db()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM login WHERE domain = ?', (domain,))
-    row = cursor.fetchone()
-    conn.close()
+def _load_login(domain: str) -> LoginData | None:
+    row = db.fetchone('SELECT domain, headers, cookies FROM login WHERE domain = ?', (domain,))
     if row is None:
         return None
     return LoginData(domain=row[0], headers=json.loads(row[1]), cookies=json.loads(row[2]))
 
+def get_login(domain: str) -> LoginData | None:
+    return _copy(cache.get(domain, lambda: _load_login(domain)))
+
 def update_login(domain: str, headers: dict = None, cookies: dict = None) -> None:
     request_data = get_login(domain)
     if request_data is None:
@@ -67,9 +63,5 @@ def update_login(domain: str, headers: dict = None, cookies: dict = None) -> Non
     insert_login(updated_data)
 
 def delete_login(domain: str) -> None:
-    init_db()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('DELETE FROM login WHERE domain = ?', (domain,))
-    conn.commit()
-    conn.close()
+    db.execute('DELETE FROM login WHERE domain = ?', (domain,))
+    cache.invalidate(domain)
@@ -1,9 +1,9 @@
-import sqlite3
 from pathlib import Path
 from os import makedirs
 from platformdirs import user_config_dir
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import json
+from core.__seedwork.infra.database import Database, RecordCache, add_column
 
 data_path = user_config_dir('pyteste')
 db_path = Path(data_path) / 'requests.db'
@@ -14,6 +14,11 @@ class RequestData:
     domain: str
     headers: dict
     cookies: dict
+    expires: float | None = None
+
+    @property
+    def user_agent(self) -> str | None:
+        return (self.headers or {}).get('user-agent')
 
     def as_dict(self):
         return asdict(self)
@@ -22,36 +27,33 @@ class RequestData:
     def from_dict(cls, data):
         return cls(**data)
 
-def init_db():
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('''CREATE TABLE IF NOT EXISTS requests (
+def init_db(conn) -> None:
+    conn.execute('''CREATE TABLE IF NOT EXISTS requests (
                         domain TEXT PRIMARY KEY,
                         headers TEXT,
                         cookies TEXT
                       )''')
-    conn.commit()
-    conn.close()
+    add_column(conn, 'requests', 'expires', 'REAL')
+
+db = Database(db_path, init_db)
+cache = RecordCache(db)
+
+def _copy(data: RequestData | None) -> RequestData | None:
+    return replace(data, headers=dict(data.headers or {}), cookies=dict(data.cookies or {})) if data else None
 
 def insert_request(data: RequestData) -> None:
-    init_db()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('INSERT OR REPLACE INTO requests (domain, headers, cookies) VALUES (?, ?, ?)',
-                   (data.domain, json.dumps(data.headers), json.dumps(data.cookies)))
-    conn.commit()
-    conn.close()
+    db.execute('INSERT OR REPLACE INTO requests (domain, headers, cookies, expires) VALUES (?, ?, ?, ?)',
+               (data.domain, json.dumps(data.headers), json.dumps(data.cookies), data.expires))
+    cache.put(data.domain, _copy(data))
 
-def get_request(domain: str) -> RequestData | None:
-    init_db()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM requests WHERE domain = ?', (domain,))
-    row = cursor.fetchone()
-    conn.close()
+def _load_request(domain: str) -> RequestData | None:
+    row = db.fetchone('SELECT domain, headers, cookies, expires FROM requests WHERE domain = ?', (domain,))
     if row is None:
         return None
-    return RequestData(domain=row[0], headers=json.loads(row[1]), cookies=json.loads(row[2]))
+    return RequestData(domain=row[0], headers=json.loads(row[1]), cookies=json.loads(row[2]), expires=row[3])
+
+def get_request(domain: str) -> RequestData | None:
+    return _copy(cache.get(domain, lambda: _load_request(domain)))
 
 def update_request(domain: str, headers: dict = None, cookies: dict = None) -> None:
     request_data = get_request(domain)
@@ -63,13 +65,9 @@ def update_request(domain: str, headers: dict = None, cookies: dict = None) -> N
     if cookies is None:
         cookies = request_data.cookies
 
-    updated_data = RequestData(domain=domain, headers=headers, cookies=cookies)
+    updated_data = RequestData(domain=domain, headers=headers, cookies=cookies, expires=request_data.expires)
     insert_request(updated_data)
 
 def delete_request(domain: str) -> None:
-    init_db()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('DELETE FROM requests WHERE domain = ?', (domain,))
-    conn.commit()
-    conn.close()
+    db.execute('DELETE FROM requests WHERE domain = ?', (domain,))
+    cache.invalidate(domain)
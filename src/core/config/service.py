@@ -0,0 +1,107 @@
+import atexit
+import threading
+from dataclasses import replace
+from contextlib import contextmanager
+from typing import Callable, Generic, TypeVar
+from core.__seedwork.infra.log import get_logger
+
+log = get_logger('config')
+
+T = TypeVar('T')
+
+class ConfigService(Generic[T]):
+    """
+    Configuração carregada uma vez e entregue como snapshot imutável.
+
+    `update(**campos)` troca o snapshot na hora, avisa os inscritos com
+    `(snapshot, campos alterados)` e agenda a gravação no banco para depois de
+    `debounce` segundos sem novas alterações, juntando as rajadas da GUI (cada
+    tecla num spin box) numa única escrita. `pin()` fixa o snapshot atual para
+    a thread, de modo que um capítulo é processado do início ao fim com as
+    mesmas configurações mesmo que a GUI mude algo no meio.
+    """
+
+    def __init__(self, load: Callable[[], T | None], save: Callable[[dict], None], debounce: float = 0.5):
+        self._load = load
+        self._save = save
+        self.debounce = debounce
+        self._lock = threading.Lock()
+        self._snapshot: T | None = None
+        self._loaded = False
+        self._pending: dict = {}
+        self._timer: threading.Timer | None = None
+        self._subscribers: list[Callable[[T, set], None]] = []
+        self._pinned = threading.local()
+        atexit.register(self.flush)
+
+    def _current(self) -> T | None:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._snapshot = self._load()
+                    self._loaded = True
+        return self._snapshot
+
+    def snapshot(self) -> T | None:
+        pinned = getattr(self._pinned, 'snapshot', None)
+        return pinned if pinned is not None else self._current()
+
+    def reload(self) -> T | None:
+        self.flush()
+        with self._lock:
+            self._loaded = False
+        return self._current()
+
+    def update(self, **changes) -> T | None:
+        self._current()
+        with self._lock:
+            current = self._snapshot
+            if current is not None:
+                changes = {field: value for field, value in changes.items() if getattr(current, field) != value}
+                if not changes:
+                    return current
+                self._snapshot = replace(current, **changes)
+            snapshot = self._snapshot
+            self._pending.update(changes)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+            subscribers = list(self._subscribers)
+        for fn in subscribers:
+            try:
+                fn(snapshot, set(changes))
+            except Exception as e:
+                log.warning('Falha ao notificar mudança de configuração: %s', e)
+        return snapshot
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._pending = self._pending, {}
+        if pending:
+            self._save(pending)
+
+    def subscribe(self, fn: Callable[[T, set], None]) -> Callable[[], None]:
+        with self._lock:
+            self._subscribers.append(fn)
+
+        def unsubscribe():
+            with self._lock:
+                if fn in self._subscribers:
+                    self._subscribers.remove(fn)
+        return unsubscribe
+
+    @contextmanager
+    def pin(self):
+        """Fixa o snapshot atual para esta thread enquanto o bloco roda."""
+        previous = getattr(self._pinned, 'snapshot', None)
+        snapshot = previous or self.snapshot()
+        self._pinned.snapshot = snapshot
+        try:
+            yield snapshot
+        finally:
+            self._pinned.snapshot = previous
@@ -11,3 +11,12 @@ class Chapter(Entity):
     def from_dict(number: str, files: List[str]):
         return Chapter(number, files)
 
+
+class PageDownloadError(Exception):
+    """Páginas que não puderam ser baixadas, por número; `chapter` traz as que foram salvas."""
+
+    def __init__(self, chapter: Chapter, failures: dict[int, str]):
+        pages = ', '.join(f'{number}: {reason}' for number, reason in sorted(failures.items()))
+        super().__init__(f'{len(failures)} page(s) failed - {pages}')
+        self.chapter = chapter
+        self.failures = failures
@@ -10,6 +10,9 @@ from core.providers.domain.page_entity import Pages
 from core.download.domain.dowload_entity import Chapter
 from core.download.domain.dowload_repository import DownloadRepository
 from core.__seedwork.infra.utils.sanitize_folder import sanitize_folder_name
+from core.__seedwork.infra.log import get_logger
+
+log = get_logger('download')
 
 
 class NovelDownloadRepository(DownloadRepository):
@@ -94,10 +97,10 @@ class NovelDownloadRepository(DownloadRepository):
                     f.write(markdown_content)
                 
                 files.append(file_path)
-                print(f"<stroke style='color:green;'>[Downloading]:</stroke> <span style='color:green;'>Saved</span> {file_name}")
+                log.info('Salvo %s', file_name)
                 
             except Exception as e:
-                print(f"<stroke style='color:green;'>[Downloading]:</stroke> <span style='color:red;'>Error</span> {e}")
+                log.error('Erro ao salvar capítulo: %s', e)
                 failed_count += 1
                 
                 if failed_count > max_failures_allowed:
@@ -375,7 +378,7 @@ class NovelDownloadRepository(DownloadRepository):
             try:
                 response = Http.get(url, headers=headers, cookies=cookies, timeout=timeout)
             except Exception as e2:
-                print(f"[Download] Falha com Http para {url}: {e2}")
+                log.warning('Falha com Http para %s: %s', url, e2)
 
             # response = Http.get(url, headers=headers, cookies=cookies, timeout=timeout)
             
@@ -404,9 +407,9 @@ class NovelDownloadRepository(DownloadRepository):
             # Fallback: base64
             base64_data = base64.b64encode(response.content).decode('utf-8')
             data_uri = f"data:{mime_type};base64,{base64_data}"
-            print(f"<stroke style='color:green;'>[Downloading]:</stroke> <span style='color:blue;'>Image embedded</span> {url}")
+            log.debug('Imagem embutida %s', url)
             return data_uri
             
         except Exception as e:
-            print(f"<stroke style='color:green;'>[Downloading]:</stroke> <span style='color:red;'>Image error</span> {url}: {e}")
+            log.error('Erro na imagem %s: %s', url, e)
             return None
@@ -1,16 +1,47 @@
 import re
 import os
 import math
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+import pillow_avif
 from PIL import Image
-from io import BytesIO
 from core.config.img_conf import get_config
 from core.__seedwork.infra.http import Http
 from core.providers.domain.page_entity import Pages
-from core.download.domain.dowload_entity import Chapter
+from core.download.domain.dowload_entity import Chapter, PageDownloadError
 from core.download.domain.dowload_repository import DownloadRepository
 from core.__seedwork.infra.utils.sanitize_folder import sanitize_folder_name
+from core.__seedwork.infra.log import get_logger
+log = get_logger('download')
+
 Image.MAX_IMAGE_PIXELS = 933120000
 
+# Assinatura no início do arquivo -> extensão e formato do Pillow
+SIGNATURES = (
+    (b'\xff\xd8\xff', '.jpg', 'JPEG'),
+    (b'\x89PNG\r\n\x1a\n', '.png', 'PNG'),
+    (b'GIF87a', '.gif', 'GIF'),
+    (b'GIF89a', '.gif', 'GIF'),
+    (b'BM', '.bmp', 'BMP'),
+)
+
+# Modos que a conversão achata para RGB (transparência e paleta)
+FLATTEN_MODES = ("RGBA", "P")
+
+def sniff_format(header: bytes) -> tuple[str, str] | None:
+    """Formato real da imagem pelos primeiros bytes, sem depender da URL ou do Content-Type."""
+    for signature, extension, name in SIGNATURES:
+        if header.startswith(signature):
+            return extension, name
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return '.webp', 'WEBP'
+    if header[4:8] == b'ftyp' and header[8:12] in (b'avif', b'avis'):
+        return '.avif', 'AVIF'
+    return None
+
 class PillowDownloadRepository(DownloadRepository):
 
     def download(self, pages: Pages, fn=None, headers=None, cookies=None, timeout=None) -> Chapter:
@@ -20,27 +51,120 @@ class PillowDownloadRepository(DownloadRepository):
         path = os.path.join(img_path, str(title), str(sanitize_folder_name(pages.number)))
         os.makedirs(path, exist_ok=True)
         img_format = config.img
+        keep_original = config.keep_original
+
+        total = len(pages.pages)
+        files = [None] * total
+        failures = {}
+        lock = threading.Lock()
+        done = 0
+
+        if fn != None:
+            fn(0)
 
-        page_number = 1
-        files = []
-        for i, page in enumerate(pages.pages):
-            response = Http.get(page, headers=headers, cookies=cookies, timeout=timeout)
+        def finished(index: int, error: Exception | None = None):
+            nonlocal done
+            with lock:
+                if error is not None:
+                    failures[index + 1] = str(error)
+                done += 1
+                if fn != None:
+                    fn(math.ceil(done * 100 / total))
+
+        def process(index: int, fetch):
+            # O número do arquivo vem da posição da página, não da ordem em
+            # que os downloads terminam.
+            temp = os.path.join(path, ".%03d.download" % (index + 1))
+            error = None
             try:
-                img = Image.open(BytesIO(response.content))
-                icc = img.info.get('icc_profile')
-                if img.mode in ("RGBA", "P"):
-                    img = img.convert("RGB")
-                file = os.path.join(path, f"%03d{img_format}" % page_number)
-                img.save(file, quality=100, dpi=(72, 72), icc_profile=icc)
-                files.append(file)
+                fetch(temp)
+                files[index] = self._store(temp, path, index + 1, img_format, keep_original)
             except Exception as e:
-                print(f"<stroke style='color:green;'>[Downloading]:</stroke> <span style='color:red;'>Error</stroke> {e}")
+                log.error('Erro na página %s de %s: %s', index + 1, pages.number, e)
+                error = e
+            finally:
+                if os.path.exists(temp):
+                    os.remove(temp)
+            finished(index, error)
 
-            if fn != None:
-                fn(math.ceil(i * 100)/len(pages.pages))
-            page_number += 1
+        def fetch_http(page: str):
+            def fetch(temp: str):
+                if page.startswith('file://'):
+                    shutil.copyfile(url2pathname(urlparse(page).path), temp)
+                    return
+                Http.get_file(page, temp, headers=headers, cookies=cookies, timeout=timeout)
+            return fetch
 
-        if fn != None:
-            fn(math.ceil(len(pages.pages) * 100)/len(pages.pages))
+        def write(content: bytes):
+            def fetch(temp: str):
+                with open(temp, 'wb') as f:
+                    f.write(content)
+            return fetch
+
+        # Domínios que só respondem a fetch do navegador são baixados numa
+        # única sessão, consumida em ordem conforme as páginas chegam; o resto
+        # vai direto para o pool.
+        browser_pages = [(index, page) for index, page in enumerate(pages.pages) if Http.needs_browser(page)]
+        workers = max(1, min(config.download_workers, total))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='download') as executor:
+            browser_indexes = {index for index, _ in browser_pages}
+            for index, page in enumerate(pages.pages):
+                if index not in browser_indexes:
+                    executor.submit(process, index, fetch_http(page))
+
+            if browser_pages:
+                pending = list(browser_pages)
+                error = None
+                try:
+                    for url, content in Http.get_many_browser([page for _, page in browser_pages]):
+                        index, _ = pending.pop(0)
+                        if content is None:
+                            finished(index, Exception(f'Falha ao buscar {url} pelo navegador'))
+                        else:
+                            executor.submit(process, index, write(content))
+                except Exception as e:
+                    log.error('Erro no download pelo navegador: %s', e)
+                    error = e
+                for index, page in pending:
+                    finished(index, error or Exception(f'Falha ao buscar {page} pelo navegador'))
+
+        chapter = Chapter(pages.number, [file for file in files if file])
+        if failures:
+            raise PageDownloadError(chapter, failures)
+        return chapter
+
+    @staticmethod
+    def _store(temp: str, path: str, number: int, img_format: str, keep_original: bool) -> str:
+        """
+        Página já no formato escolhido (ou com `keep_original`) vai para o
+        destino com os bytes originais, desde que o modo de cor já seja o que
+        a conversão produziria; as outras (inclusive RGBA e paleta) são
+        decodificadas, achatadas para RGB e regravadas no formato escolhido.
+        Com `keep_original` a extensão segue a de cada página, então um mesmo
+        capítulo pode misturar formatos.
+        """
+        with open(temp, 'rb') as f:
+            source = sniff_format(f.read(16))
+        if source is not None and (keep_original or source[0] == img_format):
+            extension, name = source
+            try:
+                # Image.open lê só o cabeçalho; a imagem não é decodificada
+                with Image.open(temp) as img:
+                    valid = img.format == name and img.width > 0 and img.height > 0
+                    flatten = img.mode in FLATTEN_MODES
+            except Exception:
+                valid = flatten = False
+            if valid and not flatten:
+                file = os.path.join(path, f"%03d{extension}" % number)
+                os.replace(temp, file)
+                return file
+        return PillowDownloadRepository._convert(temp, os.path.join(path, f"%03d{img_format}" % number))
 
-        return Chapter(pages.number, files)
\ No newline at end of file
+    @staticmethod
+    def _convert(temp: str, file: str) -> str:
+        with Image.open(temp) as img:
+            icc = img.info.get('icc_profile')
+            if img.mode in FLATTEN_MODES:
+                img = img.convert("RGB")
+            img.save(file, quality=100, dpi=(72, 72), icc_profile=icc)
+        return file
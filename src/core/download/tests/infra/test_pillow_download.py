@@ -0,0 +1,131 @@
+import os
+import threading
+import pytest
+from PIL import Image, UnidentifiedImageError
+from core.config.img_conf import Config
+from core.providers.domain.page_entity import Pages
+from core.download.domain.dowload_entity import PageDownloadError
+from core.download.infra import pillow
+from core.download.infra.pillow import PillowDownloadRepository
+
+def save_image(file: str, width: int) -> None:
+    Image.new('RGB', (width, 4)).save(file, 'PNG')
+
+class FakeHttp:
+    """Escreve no arquivo temporário uma imagem com largura = número da página."""
+
+    def __init__(self, fail=(), corrupt=()):
+        self.fail = set(fail)
+        self.corrupt = set(corrupt)
+
+    def needs_browser(self, url):
+        return False
+
+    def get_file(self, url, file, **kwargs):
+        number = int(url.rsplit('/', 1)[1])
+        if number in self.corrupt:
+            with open(file, 'wb') as f:
+                f.write(b'<!DOCTYPE html>')
+            return
+        if number in self.fail:
+            # Download interrompido no meio: sobra um arquivo parcial
+            with open(file, 'wb') as f:
+                f.write(b'\x89PNG\r\n')
+            raise ConnectionError('connection reset')
+        save_image(file, number)
+
+class ReversedHttp(FakeHttp):
+    """Cada página só termina depois da seguinte, então chegam de trás para frente."""
+
+    def __init__(self, total):
+        super().__init__()
+        self.done = {number: threading.Event() for number in range(1, total + 2)}
+        self.done[total + 1].set()
+
+    def get_file(self, url, file, **kwargs):
+        number = int(url.rsplit('/', 1)[1])
+        assert self.done[number + 1].wait(5)
+        super().get_file(url, file, **kwargs)
+        self.done[number].set()
+
+@pytest.fixture
+def download(tmp_path, monkeypatch):
+    monkeypatch.setattr(pillow, 'get_config', lambda: Config(img='.png', save=str(tmp_path), download_workers=4))
+
+    def run(http, total):
+        monkeypatch.setattr(pillow, 'Http', http)
+        pages = Pages('id', '1', 'manga', [f'https://a.com/{number}' for number in range(1, total + 1)])
+        return PillowDownloadRepository().download(pages)
+    return run
+
+def chapter_dir(tmp_path):
+    return tmp_path / 'manga' / '1'
+
+class TestPillowDownload:
+    def test_files_follow_page_order(self, download):
+        chapter = download(ReversedHttp(4), 4)
+        assert [os.path.basename(file) for file in chapter.files] == ['001.png', '002.png', '003.png', '004.png']
+        for number, file in enumerate(chapter.files, 1):
+            with Image.open(file) as img:
+                assert img.width == number
+
+    def test_partial_failure(self, download):
+        with pytest.raises(PageDownloadError) as error:
+            download(FakeHttp(fail={2}, corrupt={4}), 5)
+        assert sorted(error.value.failures) == [2, 4]
+        assert 'connection reset' in error.value.failures[2]
+        assert [os.path.basename(file) for file in error.value.chapter.files] == ['001.png', '003.png', '005.png']
+
+    def test_temp_files_are_removed(self, download, tmp_path):
+        with pytest.raises(PageDownloadError):
+            download(FakeHttp(fail={1, 3}, corrupt={2}), 4)
+        assert sorted(os.listdir(chapter_dir(tmp_path))) == ['004.png']
+
+def write_temp(tmp_path, format: str, mode: str = 'RGB') -> str:
+    temp = str(tmp_path / '.001.download')
+    Image.new(mode, (4, 4)).save(temp, format)
+    return temp
+
+class TestStore:
+    def test_passthrough_keeps_bytes(self, tmp_path):
+        temp = write_temp(tmp_path, 'PNG')
+        with open(temp, 'rb') as f:
+            original = f.read()
+        file = PillowDownloadRepository._store(temp, str(tmp_path), 1, '.png', False)
+        assert os.path.basename(file) == '001.png'
+        assert not os.path.exists(temp)
+        with open(file, 'rb') as f:
+            assert f.read() == original
+
+    def test_keep_original_uses_source_extension(self, tmp_path):
+        file = PillowDownloadRepository._store(write_temp(tmp_path, 'WEBP'), str(tmp_path), 1, '.jpg', True)
+        assert os.path.basename(file) == '001.webp'
+
+    def test_other_format_is_converted(self, tmp_path):
+        file = PillowDownloadRepository._store(write_temp(tmp_path, 'WEBP'), str(tmp_path), 1, '.jpg', False)
+        assert os.path.basename(file) == '001.jpg'
+        with Image.open(file) as img:
+            assert img.format == 'JPEG'
+
+    def test_transparency_is_flattened(self, tmp_path):
+        # Mesmo já no formato escolhido, RGBA e paleta vão para RGB como na conversão
+        for mode in ('RGBA', 'P'):
+            file = PillowDownloadRepository._store(write_temp(tmp_path, 'PNG', mode), str(tmp_path), 1, '.png', True)
+            assert os.path.basename(file) == '001.png'
+            with Image.open(file) as img:
+                assert img.mode == 'RGB'
+
+    def test_corrupt_header_falls_back_to_conversion(self, tmp_path):
+        # Assinatura de PNG com o resto quebrado: não é copiado, e a conversão falha
+        temp = str(tmp_path / '.001.download')
+        with open(temp, 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n' + b'\x00' * 32)
+        with pytest.raises(UnidentifiedImageError):
+            PillowDownloadRepository._store(temp, str(tmp_path), 1, '.png', False)
+        assert not os.path.exists(tmp_path / '001.png')
+
+    def test_unknown_signature_is_converted(self, tmp_path):
+        file = PillowDownloadRepository._store(write_temp(tmp_path, 'TIFF'), str(tmp_path), 1, '.png', True)
+        assert os.path.basename(file) == '001.png'
+        with Image.open(file) as img:
+            assert img.format == 'PNG'
@@ -0,0 +1,26 @@
+from io import BytesIO
+from PIL import Image
+from core.download.infra.pillow import sniff_format
+
+def encode(format: str, mode: str = 'RGB') -> bytes:
+    buffer = BytesIO()
+    Image.new(mode, (4, 4)).save(buffer, format)
+    return buffer.getvalue()
+
+class TestSniffFormat:
+    def test_known_formats(self):
+        assert sniff_format(encode('JPEG')[:16]) == ('.jpg', 'JPEG')
+        assert sniff_format(encode('PNG')[:16]) == ('.png', 'PNG')
+        assert sniff_format(encode('GIF', 'P')[:16]) == ('.gif', 'GIF')
+        assert sniff_format(encode('BMP')[:16]) == ('.bmp', 'BMP')
+        assert sniff_format(encode('WEBP')[:16]) == ('.webp', 'WEBP')
+
+    def test_avif(self):
+        assert sniff_format(b'\x00\x00\x00\x1cftypavif\x00\x00\x00\x00') == ('.avif', 'AVIF')
+        assert sniff_format(b'\x00\x00\x00\x1cftypavis\x00\x00\x00\x00') == ('.avif', 'AVIF')
+        assert sniff_format(b'\x00\x00\x00\x1cftypheic\x00\x00\x00\x00') is None
+
+    def test_unknown(self):
+        assert sniff_format(b'<!DOCTYPE html>') is None
+        assert sniff_format(b'RIFF\x00\x00\x00\x00WAVE') is None
+        assert sniff_format(b'') is None
@@ -7,6 +7,9 @@ class ProviderRepository(ABC):
     lang: str
     domain: str
     has_login: bool = False
+    # Requisições por segundo aceitas pelo site; lido pelo carregamento dos
+    # providers, que configura o rate limiter do domínio
+    rate_limit: float | None = None
 
     @abstractmethod
     def login() -> None:
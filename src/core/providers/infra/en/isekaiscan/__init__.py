@@ -4,6 +4,8 @@ from core.__seedwork.infra.http import Http
 from core.providers.domain.entities import Chapter, Pages
 from core.providers.infra.template.wordpress_madara import WordPressMadara
 from urllib.parse import urljoin, urlencode, urlparse, urlunparse, parse_qs
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.isekaiscan')
 
 class IsekaiScanProvider(WordPressMadara):
     name = 'Isekai Scans'
@@ -44,4 +46,4 @@ class IsekaiScanProvider(WordPressMadara):
             list = get_pages.get_text(strip=True).split(',')
             return Pages(ch.id, ch.number, ch.name, list)
         except Exception as e:
-            print(e)
\ No newline at end of file
+            log.error('%s', e)
\ No newline at end of file
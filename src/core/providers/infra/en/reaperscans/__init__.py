@@ -4,6 +4,8 @@ from core.__seedwork.infra.http import Http
 from bs4 import BeautifulSoup
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.reaperscans')
 
 class ReaperScansProvider(Base):
     name = 'Reaper Scans'
@@ -50,5 +52,5 @@ class ReaperScansProvider(Base):
         for pg in get_page:
             src = pg.get('srcset')
             list.append(self.link_formatter(src))
-        print(list)
+        log.debug('%s', list)
         return Pages(ch.id, ch.number, ch.name, list)
\ No newline at end of file
@@ -1,7 +1,6 @@
 import re
 import tldextract
-import nodriver as uc
-from time import sleep
+import asyncio
 from typing import List
 from bs4 import BeautifulSoup
 from tldextract import extract
@@ -10,7 +9,11 @@ from core.providers.infra.template.base import Base
 from core.download.application.use_cases import DownloadUseCase
 from core.providers.domain.entities import Chapter, Pages, Manga
 from core.cloudflare.application.use_cases import IsCloudflareBlockingUseCase
+from core.browser.application.use_cases import RunInBrowserUseCase
+from core.browser.infra.nodriver.capture import wait_idle
 from core.config.request_data import get_request, delete_request, insert_request, RequestData
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.newtoki')
 
 class NewTokiProvider(Base):
     name = 'New Toki'
@@ -69,25 +72,13 @@ class NewTokiProvider(Base):
         return False
     
     def bypass_capcha(self, url: str) -> str:
-        content={}
-        async def get_cloudflare_cookie():
-            nonlocal content
+        async def solve(browser, page):
             cloudflare = False
             extract = tldextract.extract(url)
             onlydomain = f"{extract.domain}.{extract.suffix}"
-            browser = await uc.start(
-                browser_args=[
-                    '--window-size=600,600', 
-                    f'--app={url}',
-                    '--disable-extensions', 
-                    '--disable-popup-blocking'
-                ],
-                browser_executable_path=None
-            )
-            page = await browser.get(url)
             scroll = True
             request_data = get_request(onlydomain)
-            if(request_data):
+            if(request_data and request_data.cookies):
                 re = request_data
                 await page.evaluate(f'document.cookie = "cf_clearance={re.cookies['cf_clearance']}; path=/; max-age=3600; secure; samesite=strict";')
                 await page.reload()
@@ -97,9 +88,9 @@ class NewTokiProvider(Base):
                 head = soup.find('head')
                 if IsCloudflareBlockingUseCase().execute(page_content):
                     cloudflare = True
-                    sleep(1)
+                    await asyncio.sleep(1)
                 if self._is_capcha(page_content):
-                    sleep(2)
+                    await asyncio.sleep(2)
                     if scroll:
                         scroll = False
                         await page.evaluate('''
@@ -111,10 +102,9 @@ class NewTokiProvider(Base):
                             }
                         ''', await_promise=True)
                 elif head and not head.contents:
-                    content = None
-                    break
+                    return None
                 else:
-                    sleep(5)
+                    await wait_idle(page, idle=1.0, timeout=5)
                     page_content = await page.get_content()
                     if cloudflare:
                         request_data = get_request(onlydomain)
@@ -124,15 +114,15 @@ class NewTokiProvider(Base):
                         headers = { 'user-agent': agent }
                         cookiesB = await browser.cookies.get_all()
                         cookies={}
+                        expires=None
+                        # O navegador é compartilhado: só vale o cf_clearance deste domínio
                         for cookie in cookiesB:
-                            if(cookie.name == 'cf_clearance'):
+                            if(cookie.name == 'cf_clearance' and cookie.domain.lstrip('.').endswith(onlydomain)):
                                 cookies = {'cf_clearance': cookie.value}
-                        insert_request(RequestData(domain=onlydomain, headers=headers, cookies=cookies))
-                    content = page_content 
-                    break
-            browser.stop()
-        uc.loop().run_until_complete(get_cloudflare_cookie())
-        return content
+                                expires = cookie.expires if cookie.expires and cookie.expires > 0 else None
+                        insert_request(RequestData(domain=onlydomain, headers=headers, cookies=cookies, expires=expires))
+                    return page_content
+        return RunInBrowserUseCase().execute(url, solve, headless=False)
 
     def getPages(self, ch: Chapter) -> Pages:
         list = []
@@ -154,7 +144,7 @@ class NewTokiProvider(Base):
             for img in unique_urls:
                 list.append(img)
         except Exception as e:
-            print(e)
+            log.error('%s', e)
         return Pages(ch.id, ch.number, ch.name, list)
 
     def download(self, pages: Pages, fn: any, headers=None, cookies=None):
@@ -3,11 +3,14 @@ from core.__seedwork.infra.http import Http
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
 from core.download.application.use_cases import DownloadUseCase
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.mangadex')
 
 class MangaDexProvider(Base):
     name = 'MangaDex'
     lang = 'mult-lang'
     domain = ['mangadex.org']
+    rate_limit = 5
 
     def __init__(self) -> None:
         self.Api = 'https://api.mangadex.org'
@@ -30,7 +33,8 @@ class MangaDexProvider(Base):
         }
         response = Http.get(
             f'{self.Api}/manga/{manga_id}?includes[]=artist&includes[]=author&includes[]=cover_art',
-            headers=headers
+            headers=headers,
+            cache=True
         ).json()
         titles = response['data']['attributes']['title']
         title = (
@@ -51,7 +55,8 @@ class MangaDexProvider(Base):
 
         manga_response = Http.get(
             f'{self.Api}/manga/{manga_id}?includes[]=artist&includes[]=author&includes[]=cover_art',
-            headers=headers
+            headers=headers,
+            cache=True
         ).json()
 
         titles = manga_response['data']['attributes']['title']
@@ -79,7 +84,7 @@ class MangaDexProvider(Base):
                 'includeUnavailable=0&excludeExternalUrl=blinktoon.com'
             )
 
-            feed_response = Http.get(feed_url, headers=headers).json()
+            feed_response = Http.get(feed_url, headers=headers, cache=True).json()
             page_data = feed_response.get('data', [])
 
             if not page_data:
@@ -111,7 +116,7 @@ class MangaDexProvider(Base):
                 list.append(f'{self.CDN}/{hash_code}/{pgs}')
             return Pages(ch.id, ch.number, ch.name, list)
         except Exception as e:
-            print(e)
+            log.error('%s', e)
 
     def download(self, pages: Pages, fn: any, headers=None, cookies=None):
         fetch_headers = {
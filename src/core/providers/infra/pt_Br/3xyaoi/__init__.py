@@ -5,6 +5,8 @@ from core.providers.domain.entities import Chapter, Pages
 from core.__seedwork.infra.http import Http
 from bs4 import BeautifulSoup
 import re
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.3xyaoi')
 
 class XXXYaoiProvider(WordPressMadara):
     name = '3xyaoi'
@@ -24,7 +26,7 @@ class XXXYaoiProvider(WordPressMadara):
         self.query_placeholder = '[id^="manga-chapters-holder"][data-id]'
 
     def getManga(self, link: str) -> Manga:
-        print("teste")
+        log.info('teste')
         response = Http.get(link, timeout=10)
         soup = BeautifulSoup(response.content, 'html.parser')
         data = soup.select(self.query_title_for_uri)
@@ -52,4 +54,4 @@ class XXXYaoiProvider(WordPressMadara):
             
             return Pages(ch.id, ch.number, ch.name, list)
         except Exception as e:
-            print(e)
\ No newline at end of file
+            log.error('%s', e)
\ No newline at end of file
@@ -8,6 +8,8 @@ from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 import re
 import json
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.apecomics')
 
 class ApeComicsProvider(WordpressEtoshoreMangaTheme):
     name = 'Ape Comics'
@@ -68,7 +70,7 @@ class ApeComicsProvider(WordpressEtoshoreMangaTheme):
                                     all_images.append(img)
                     
                     if all_images:
-                        print(f"[APECOMICS] ✓ {len(all_images)} imagens extraídas")
+                        log.info('[APECOMICS] ✓ %s imagens extraídas', len(all_images))
                         return Pages(ch.id, ch.number, ch.name, all_images)
                 except json.JSONDecodeError:
                     pass
@@ -105,7 +107,7 @@ class ApeComicsProvider(WordpressEtoshoreMangaTheme):
                     unique_urls.append(url_decoded)
 
             if unique_urls:
-                print(f"[APECOMICS] ✓ {len(unique_urls)} imagens extraídas (fallback)")
+                log.info('[APECOMICS] ✓ %s imagens extraídas (fallback)', len(unique_urls))
                 return Pages(ch.id, ch.number, ch.name, unique_urls)
 
             # Método 3: Último recurso - busca no div readerarea
@@ -121,12 +123,12 @@ class ApeComicsProvider(WordpressEtoshoreMangaTheme):
                         img_list.append(src)
 
                 if img_list:
-                    print(f"[APECOMICS] ✓ {len(img_list)} imagens extraídas (div)")
+                    log.info('[APECOMICS] ✓ %s imagens extraídas (div)', len(img_list))
                     return Pages(ch.id, ch.number, ch.name, img_list)
 
-            print("[APECOMICS] ✗ Nenhuma imagem encontrada")
+            log.error('[APECOMICS] ✗ Nenhuma imagem encontrada')
             return Pages(ch.id, ch.number, ch.name, [])
 
         except Exception as e:
-            print(f"[APECOMICS] ✗ Erro: {e}")
+            log.error('[APECOMICS] ✗ Erro: %s', e)
             return Pages(ch.id, ch.number, ch.name, [])
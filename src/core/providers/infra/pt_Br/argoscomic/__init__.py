@@ -1,14 +1,16 @@
 import json
 import re
-from time import sleep
 from pathlib import Path
 from urllib.parse import quote, urlparse
 from bs4 import BeautifulSoup
-from DrissionPage import ChromiumPage, ChromiumOptions
 from core.__seedwork.infra.http import Http
+from core.browser.application.use_cases import RunInBrowserUseCase
+from core.browser.infra.nodriver.capture import wait_idle, wait_for_login
 from core.config.login_data import insert_login, LoginData, get_login
 from core.providers.domain.entities import Chapter, Pages, Manga
 from core.providers.infra.template.wordpress_etoshore_manga_theme import WordpressEtoshoreMangaTheme
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.argoscomic')
 
 
 class ArgosComicProvider(WordpressEtoshoreMangaTheme):
@@ -27,20 +29,6 @@ class ArgosComicProvider(WordpressEtoshoreMangaTheme):
         self._project_payload_cache = {}
         self._action_hashes_cache = None
 
-    def _extract_cookies(self, cookies) -> dict:
-        cookies_dict = {}
-
-        for cookie in cookies:
-            if hasattr(cookie, 'name') and hasattr(cookie, 'value'):
-                cookies_dict[cookie.name] = cookie.value
-            elif isinstance(cookie, dict):
-                name = cookie.get('name')
-                value = cookie.get('value')
-                if name and value:
-                    cookies_dict[name] = value
-
-        return cookies_dict
-
     def _ensure_login_alias_for_domain(self, domain_name: str):
         normalized = (domain_name or '').strip().lower()
         if not normalized:
@@ -67,39 +55,30 @@ class ArgosComicProvider(WordpressEtoshoreMangaTheme):
     def login(self):
         login_info = get_login(self.domain_name) or get_login('argoscomic.com')
         if login_info:
-            print(f'[ArgosComic] Login encontrado em cache ({self.domain_name})')
+            log.info('[ArgosComic] Login encontrado em cache (%s)', self.domain_name)
             return True
 
-        print('[ArgosComic] Iniciando navegador para login...')
-        print('[ArgosComic] Voce tem 45 segundos para concluir o login manual')
+        log.info('[ArgosComic] Iniciando navegador para login...')
+        log.info('[ArgosComic] Conclua o login manual na janela aberta')
 
-        try:
-            co = ChromiumOptions()
-            co.headless(False)
-
-            page = ChromiumPage(addr_or_opts=co)
-            page.get(self.login_url)
-            print(f'[ArgosComic] Aguardando em: {self.login_url}')
-            sleep(45)
+        async def wait_login(browser, page):
+            return await wait_for_login(page)
 
-            cookies_dict = self._extract_cookies(page.cookies())
-            if page.states.is_alive:
-                page.quit()
+        try:
+            log.info('[ArgosComic] Aguardando em: %s', self.login_url)
+            cookies_dict = RunInBrowserUseCase().execute(self.login_url, wait_login, headless=False)
 
             if not cookies_dict:
-                print('[ArgosComic] Nenhum cookie foi capturado')
+                log.info('[ArgosComic] Nenhum cookie foi capturado')
                 return False
 
             insert_login(LoginData(self.domain_name, {}, cookies_dict))
             insert_login(LoginData('argoscomic.com', {}, cookies_dict))
             insert_login(LoginData('aniargos.com', {}, cookies_dict))
-            print(f'[ArgosComic] Login salvo com sucesso ({len(cookies_dict)} cookies)')
+            log.info('[ArgosComic] Login salvo com sucesso (%s cookies)', len(cookies_dict))
             return True
-        except ImportError:
-            print('[ArgosComic] DrissionPage nao esta instalado. Execute: pip install DrissionPage')
-            return False
         except (AttributeError, RuntimeError, TimeoutError, TypeError, ValueError) as e:
-            print(f'[ArgosComic] Erro durante login: {e}')
+            log.error('[ArgosComic] Erro durante login: %s', e)
             return False
 
     def _extract_project_and_link(self, link: str):
@@ -267,33 +246,30 @@ class ArgosComicProvider(WordpressEtoshoreMangaTheme):
         return sorted(found_numbers, key=self._chapter_number_sort_key)
 
     def _fetch_chapter_numbers_via_rendered_dom(self, route_url: str, project_id: str, link_id: str):
-        page = None
-        try:
-            co = ChromiumOptions()
-            co.headless(True)
-
-            page = ChromiumPage(addr_or_opts=co)
-            page.get(route_url)
-            sleep(6)
+        async def render(browser, page):
+            await wait_idle(page, idle=1.5, timeout=10)
 
             try:
-                chapters_tab = page.ele('xpath://button[contains(.,"Cap") or contains(.,"chap")]', timeout=4)
-                if chapters_tab:
-                    chapters_tab.click()
-                    sleep(3)
+                clicked = await page.evaluate('''
+                    (() => {
+                        const tab = [...document.querySelectorAll('button')]
+                            .find(button => /Cap|chap/.test(button.textContent));
+                        if (tab) tab.click();
+                        return Boolean(tab);
+                    })()
+                ''')
+                if clicked:
+                    await wait_idle(page, idle=1.0, timeout=5)
             except (AttributeError, RuntimeError, TimeoutError, TypeError, ValueError):
                 pass
 
-            html = page.html or ''
+            return await page.get_content() or ''
+
+        try:
+            html = RunInBrowserUseCase().execute(route_url, render, headless=True)
             return self._extract_chapter_numbers_from_text_for_project(html, project_id, link_id)
         except (AttributeError, RuntimeError, TimeoutError, TypeError, ValueError):
             return []
-        finally:
-            if page:
-                try:
-                    page.quit()
-                except (AttributeError, RuntimeError, TimeoutError, TypeError, ValueError):
-                    pass
 
     def _coerce_project_payload(self, payload: dict, link_id: str) -> dict:
         items = payload.get('items')
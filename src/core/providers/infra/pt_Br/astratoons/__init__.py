@@ -1,23 +1,30 @@
 from core.providers.infra.template.wordpress_etoshore_manga_theme import WordpressEtoshoreMangaTheme
 from typing import List
 import os
-import math
-import requests
 import re
-from PIL import Image
-from io import BytesIO
 from core.__seedwork.infra.http import Http
+from core.download.application.use_cases import DownloadUseCase
 from bs4 import BeautifulSoup
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
-from core.download.domain.dowload_entity import Chapter as DownloadedChapter
-from core.config.img_conf import get_config
-from core.__seedwork.infra.utils.sanitize_folder import sanitize_folder_name
 
-import nodriver as uc
-import asyncio
-import concurrent.futures
+import atexit
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+from core.browser.application.use_cases import RunInBrowserUseCase
+from core.browser.infra.nodriver.capture import capture
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.astratoons')
 
+# Corpos capturados no getPages, uma pasta por capítulo. A pasta sai quando o
+# download do capítulo termina bem; o que sobrar sai ao fechar o programa.
+CAPTURE_ROOT = os.path.join(tempfile.gettempdir(), 'pyteste', f'astratoons-{os.getpid()}')
+atexit.register(shutil.rmtree, CAPTURE_ROOT, ignore_errors=True)
+
+def _capture_dir(chapter_id: str) -> str:
+    return os.path.join(CAPTURE_ROOT, hashlib.sha1(chapter_id.encode()).hexdigest())
 
 class AstraToonsProvider(WordpressEtoshoreMangaTheme):
     name = 'Astra Toons'
@@ -48,7 +55,9 @@ class AstraToonsProvider(WordpressEtoshoreMangaTheme):
         list = []
        
         # Obter o título do mangá e o comic_id da página principal
-        response = Http.get(id)
+        response = Http.get(id, cache=True)
+        if response.status not in range(200, 299):
+            raise Exception(f"Failed to fetch the URL STATUS: {response.status}")
         soup = BeautifulSoup(response.content, 'html.parser')
        
         # Buscar título do mangá
@@ -64,7 +73,7 @@ class AstraToonsProvider(WordpressEtoshoreMangaTheme):
             match = re.search(r'comicId:\s*(\d+)', x_data)
             if match:
                 comic_id = match.group(1)
-                print(f"[AstraToons] 🔍 Comic ID encontrado via x-data: {comic_id}")
+                log.info('[AstraToons] 🔍 Comic ID encontrado via x-data: %s', comic_id)
                 break
         
         # Fallback: Procurar em scripts por comicId
@@ -74,14 +83,14 @@ class AstraToonsProvider(WordpressEtoshoreMangaTheme):
                     match = re.search(r'comicId:\s*(\d+)', script.string)
                     if match:
                         comic_id = match.group(1)
-                        print(f"[AstraToons] 🔍 Comic ID encontrado em script: {comic_id}")
+                        log.info('[AstraToons] 🔍 Comic ID encontrado em script: %s', comic_id)
                         break
         
         if not comic_id:
-            print(f"[AstraToons] ⚠️ Não foi possível encontrar comic_id")
+            log.warning('[AstraToons] ⚠️ Não foi possível encontrar comic_id')
             return list
        
-        print(f"[AstraToons] 🔍 Comic ID: {comic_id}")
+        log.info('[AstraToons] 🔍 Comic ID: %s', comic_id)
        
         # Fazer requisições paginadas para a API
         page = 1
@@ -91,7 +100,7 @@ class AstraToonsProvider(WordpressEtoshoreMangaTheme):
             try:
                 api_url = f"{self.url}/api/comics/{comic_id}/chapters?search=&order=desc&page={page}"
                 
-                api_response = requests.get(api_url, headers={
+                api_response = Http.get(api_url, headers={
                     'accept': '*/*',
                     'accept-language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
                     'referer': id,
@@ -99,9 +108,10 @@ class AstraToonsProvider(WordpressEtoshoreMangaTheme):
                     'sec-fetch-mode': 'cors',
                     'sec-fetch-site': 'same-origin',
                     'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                })
-                
-                api_response.raise_for_status()
+                }, cache=True)
+                # O Http devolve 404 sem erro; não é uma página válida da API
+                if api_response.status not in range(200, 299):
+                    raise Exception(f"Failed to fetch the URL STATUS: {api_response.status}")
                 data = api_response.json()
                 
                 html_content = data.get('html', '')
@@ -111,7 +121,7 @@ class AstraToonsProvider(WordpressEtoshoreMangaTheme):
                 chapter_soup = BeautifulSoup(html_content, 'html.parser')
                 chapter_links = chapter_soup.select('a[href*="/capitulo/"]')
                 
-                print(f"[AstraToons] 📄 Página {page}: {len(chapter_links)} capítulos")
+                log.info('[AstraToons] 📄 Página %s: %s capítulos', page, len(chapter_links))
                 
                 for ch_link in chapter_links:
                     chapter_url = ch_link.get('href')
@@ -140,14 +150,14 @@ class AstraToonsProvider(WordpressEtoshoreMangaTheme):
                 
                 # Proteção contra loop infinito
                 if page > 100:
-                    print(f"[AstraToons] ⚠️ Limite de 100 páginas atingido")
+                    log.warning('[AstraToons] ⚠️ Limite de 100 páginas atingido')
                     break
                     
             except Exception as e:
-                print(f"[AstraToons] ❌ Erro na página {page}: {e}")
+                log.error('[AstraToons] ❌ Erro na página %s: %s', page, e)
                 break
        
-        print(f"[AstraToons] ✅ Total: {len(list)} capítulos")
+        log.info('[AstraToons] ✅ Total: %s capítulos', len(list))
         return list
 
 
@@ -156,123 +166,53 @@ class AstraToonsProvider(WordpressEtoshoreMangaTheme):
         Obtém páginas interceptando requisições de rede via CDP.
         
         O site faz fetch de URLs como /proxy/image/?expires=...&signature=...
-        antes de converter para blob. Interceptamos essas requisições para
-        capturar as URLs reais.
+        antes de converter para blob. Interceptamos essas requisições e já
+        guardamos o corpo de cada uma em arquivos temporários (file://), assim
+        o download não busca as imagens de novo. Respostas sem corpo ficam com
+        a URL do proxy. Os arquivos ficam até o download do capítulo dar certo,
+        para que uma nova tentativa encontre as páginas.
         """
-        async def _get_pages_async():
-            intercepted_urls = []
-            
-            try:
-                # Configura nodriver para VPS/root
-                config = uc.Config(
-                    headless=True,
-                    sandbox=False,
-                    browser_args=[
-                        "--no-sandbox",
-                        "--disable-setuid-sandbox",
-                        "--disable-dev-shm-usage",
-                        "--disable-gpu"
-                    ]
-                )
-                
-                browser = await uc.start(config)
-                page = await browser.get(ch.id)
-                
-                # Habilita interceptação de rede via CDP
-                await page.send(uc.cdp.network.enable())
-                
-                # Handler para capturar requisições
-                def request_handler(event):
-                    if isinstance(event, uc.cdp.network.RequestWillBeSent):
-                        url = event.request.url
-                        # Captura URLs de imagens do proxy
-                        if '/proxy/image/' in url:
-                            intercepted_urls.append(url)
-                
-                # Registra handler
-                page.add_handler(uc.cdp.network.RequestWillBeSent, request_handler)
-                
-                # Aguarda carregamento das imagens
-                await asyncio.sleep(5)
-                
-                # Remove handler
-                page.remove_handler(uc.cdp.network.RequestWillBeSent, request_handler)
-                
-                print(f"[AstraToons] ✅ Encontradas {len(intercepted_urls)} imagens")
-                
-                # Fecha browser
-                try:
-                    await browser.stop()
-                except:
-                    pass
-                
-                return intercepted_urls
-            
-            except Exception as e:
-                print(f"[AstraToons] ❌ Erro ao obter páginas: {e}")
-                import traceback
-                traceback.print_exc()
-                try:
-                    if 'browser' in locals() and browser:
-                        await browser.stop()
-                except:
-                    pass
-                return []
-        
-        img_urls = asyncio.run(_get_pages_async())
+        async def _capture(browser, page):
+            return await capture(page, '/proxy/image/', url=ch.id, idle=2.0, scroll=True, bodies=True)
+
+        try:
+            captured = RunInBrowserUseCase().execute(ch.id, _capture, headless=True, navigate=False)
+        except Exception as e:
+            log.error('[AstraToons] ❌ Erro ao obter páginas: %s', e)
+            captured = []
+
+        temp_dir = _capture_dir(ch.id)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        if captured:
+            os.makedirs(temp_dir)
+        img_urls = []
+        for idx, response in enumerate(captured):
+            if response.body and response.status in range(200, 299):
+                file_path = os.path.join(temp_dir, '%03d.img' % (idx + 1))
+                with open(file_path, 'wb') as f:
+                    f.write(response.body)
+                img_urls.append(Path(file_path).as_uri())
+            else:
+                img_urls.append(response.url)
+        log.info('[AstraToons] ✅ Encontradas %s imagens', len(img_urls))
         return Pages(ch.id, ch.number, ch.name, img_urls)
 
     def download(self, pages: Pages, fn: any, headers=None, cookies=None):
         """
-        Download das URLs interceptadas de /proxy/image/ em paralelo.
+        Download das URLs interceptadas de /proxy/image/ pelo repositório
+        padrão, que já baixa as páginas em paralelo.
         """
-        
-        title = sanitize_folder_name(pages.name)
-        config = get_config()
-        img_path = config.save
-        path = os.path.join(img_path, str(title), str(sanitize_folder_name(pages.number)))
-        os.makedirs(path, exist_ok=True)
-        img_format = config.img
-
-        files = [None] * len(pages.pages)
-        total_pages = len(pages.pages)
-
-        def baixar_img(idx_img_url):
-            idx, img_url = idx_img_url
-            try:
-                download_headers = {
-                    'accept': '*/*',
-                    'accept-language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                    'referer': pages.id,
-                    'sec-fetch-dest': 'empty',
-                    'sec-fetch-mode': 'cors',
-                    'sec-fetch-site': 'same-origin',
-                    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-                print(f"[AstraToons] ↓ Baixando imagem {idx+1}/{total_pages}: {img_url}")
-                response = requests.get(img_url, headers=download_headers, timeout=30)
-                response.raise_for_status()
-                img = Image.open(BytesIO(response.content))
-                if img.mode in ("RGBA", "P"):
-                    img = img.convert("RGB")
-                file_path = os.path.join(path, f"%03d{img_format}" % (idx+1))
-                img.save(file_path, quality=100, dpi=(72, 72))
-                if fn is not None:
-                    fn(math.ceil((idx+1) * 100) / total_pages)
-                return idx, file_path
-            except Exception as e:
-                print(f"[AstraToons] ✗ Erro na imagem {idx+1}: {str(e)[:60]}")
-                return idx, None
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-            results = list(executor.map(baixar_img, enumerate(pages.pages)))
-        falhas = 0
-        for idx, file_path in results:
-            if file_path:
-                files[idx] = file_path
-            else:
-                falhas += 1
-        files = [f for f in files if f]
-        if falhas > 0:
-            raise Exception(f"Falha ao baixar {falhas} de {total_pages} páginas do capítulo")
-        return DownloadedChapter(pages.number, files)
\ No newline at end of file
+        download_headers = {
+            'accept': '*/*',
+            'accept-language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+            'referer': pages.id,
+            'sec-fetch-dest': 'empty',
+            'sec-fetch-mode': 'cors',
+            'sec-fetch-site': 'same-origin',
+            'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        if headers:
+            download_headers = download_headers | headers
+        chapter = DownloadUseCase().execute(pages=pages, fn=fn, headers=download_headers, cookies=cookies)
+        shutil.rmtree(_capture_dir(pages.id), ignore_errors=True)
+        return chapter
@@ -6,6 +6,8 @@ from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
 import re
 import json
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.atemporal')
 
 class AtemporalProvider(WordpressEtoshoreMangaTheme):
     name = 'Atemporal'
@@ -66,7 +68,7 @@ class AtemporalProvider(WordpressEtoshoreMangaTheme):
                                     all_images.append(img)
                     
                     if all_images:
-                        print(f"[ATEMPORAL] ✓ {len(all_images)} imagens extraídas")
+                        log.info('[ATEMPORAL] ✓ %s imagens extraídas', len(all_images))
                         return Pages(ch.id, ch.number, ch.name, all_images)
                 except json.JSONDecodeError:
                     pass
@@ -103,7 +105,7 @@ class AtemporalProvider(WordpressEtoshoreMangaTheme):
                     unique_urls.append(url_decoded)
 
             if unique_urls:
-                print(f"[ATEMPORAL] ✓ {len(unique_urls)} imagens extraídas (fallback)")
+                log.info('[ATEMPORAL] ✓ %s imagens extraídas (fallback)', len(unique_urls))
                 return Pages(ch.id, ch.number, ch.name, unique_urls)
 
             # Método 3: Último recurso - busca no div readerarea
@@ -119,12 +121,12 @@ class AtemporalProvider(WordpressEtoshoreMangaTheme):
                         img_list.append(src)
 
                 if img_list:
-                    print(f"[ATEMPORAL] ✓ {len(img_list)} imagens extraídas (div)")
+                    log.info('[ATEMPORAL] ✓ %s imagens extraídas (div)', len(img_list))
                     return Pages(ch.id, ch.number, ch.name, img_list)
 
-            print("[ATEMPORAL] ✗ Nenhuma imagem encontrada")
+            log.error('[ATEMPORAL] ✗ Nenhuma imagem encontrada')
             return Pages(ch.id, ch.number, ch.name, [])
 
         except Exception as e:
-            print(f"[ATEMPORAL] ✗ Erro: {e}")
+            log.error('[ATEMPORAL] ✗ Erro: %s', e)
             return Pages(ch.id, ch.number, ch.name, [])
\ No newline at end of file
@@ -1,12 +1,14 @@
-﻿from time import sleep
-from typing import List
-from DrissionPage import ChromiumPage, ChromiumOptions
+﻿from typing import List
 from bs4 import BeautifulSoup
 from core.__seedwork.infra.http import Http
 from core.providers.domain.entities import Chapter, Pages, Manga
 from urllib.parse import urljoin, urlencode, urlparse, urlunparse, parse_qs
 from core.providers.infra.template.wordpress_madara import WordPressMadara
 from core.config.login_data import insert_login, LoginData, get_login
+from core.browser.application.use_cases import RunInBrowserUseCase
+from core.browser.infra.nodriver.capture import wait_for_login
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.corujatoons')
 
 
 class CorujaToonsProvider(WordPressMadara):
@@ -30,55 +32,29 @@ class CorujaToonsProvider(WordPressMadara):
     def login(self):
         login_info = get_login(self.domain_name)
         if login_info:
-            print('[CorujaToons] Login encontrado em cache')
+            log.info('[CorujaToons] Login encontrado em cache')
             return True
 
-        print('[CorujaToons] Iniciando navegador para login...')
-        print('[CorujaToons] Voce tem 30 segundos para fazer login')
+        log.info('[CorujaToons] Iniciando navegador para login...')
+        log.info('[CorujaToons] Conclua o login na janela aberta')
 
-        page = None
-        try:
-            co = ChromiumOptions()
-            co.headless(False)
-
-            page = ChromiumPage(addr_or_opts=co)
-            page.get(self.login_url)
-
-            print('[CorujaToons] Aguardando 30 segundos...')
-            sleep(30)
-
-            cookies = page.cookies()
-            cookies_dict = {}
+        async def wait_login(browser, page):
+            return await wait_for_login(page)
 
-            for cookie in cookies:
-                if hasattr(cookie, 'name') and hasattr(cookie, 'value'):
-                    cookies_dict[cookie.name] = cookie.value
-                elif isinstance(cookie, dict):
-                    name = cookie.get('name')
-                    value = cookie.get('value')
-                    if name and value:
-                        cookies_dict[name] = value
+        try:
+            cookies_dict = RunInBrowserUseCase().execute(self.login_url, wait_login, headless=False)
 
             if not cookies_dict:
-                print('[CorujaToons] Nenhum cookie capturado')
+                log.info('[CorujaToons] Nenhum cookie capturado')
                 return False
 
             insert_login(LoginData(self.domain_name, {}, cookies_dict))
-            print(f'[CorujaToons] Login salvo com sucesso ({len(cookies_dict)} cookies)')
+            log.info('[CorujaToons] Login salvo com sucesso (%s cookies)', len(cookies_dict))
             return True
 
-        except ImportError:
-            print('[CorujaToons] DrissionPage nao esta instalado. Execute: pip install DrissionPage')
-            return False
         except (AttributeError, RuntimeError, TimeoutError, TypeError, ValueError) as e:
-            print(f'[CorujaToons] Erro durante login: {e}')
+            log.error('[CorujaToons] Erro durante login: %s', e)
             return False
-        finally:
-            if page:
-                try:
-                    page.quit()
-                except (AttributeError, RuntimeError, TimeoutError, TypeError, ValueError):
-                    pass
 
     def getChapters(self, id: str) -> List[Chapter]:
         uri = urljoin(self.url, id)
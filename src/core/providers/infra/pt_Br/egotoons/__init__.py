@@ -13,6 +13,8 @@ from html import unescape
 import json
 import re
 import time
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.egotoons')
 
 class EgoToonsProvider(YushukeTheme):
     name = 'Ego Toons'
@@ -118,8 +120,8 @@ class EgoToonsProvider(YushukeTheme):
                 return Manga(link, title.strip())
                 
             except json.JSONDecodeError as e:
-                print(f"❌ Erro JSON: {e}")
-                print(f"Char {e.pos}: '{fixed_json[e.pos-5:e.pos+5]}'")
+                log.error('❌ Erro JSON: %s', e)
+                log.info("Char %s: '%s'", e.pos, fixed_json[e.pos-5:e.pos+5])
                 
                 # FALLBACK: extração manual do título
                 title_match = re.search(r'"title":\s*"([^"]+)"', json_str)
@@ -180,17 +182,17 @@ class EgoToonsProvider(YushukeTheme):
                     ))
                     
             except json.JSONDecodeError as e:
-                print(f"❌ Erro JSON no getChapters: {e}")
-                print(f"Char {e.pos}: '{fixed_json[e.pos-5:e.pos+5] if e.pos < len(fixed_json) else 'EOF'}'")
+                log.error('❌ Erro JSON no getChapters: %s', e)
+                log.info("Char %s: '%s'", e.pos, fixed_json[e.pos-5:e.pos+5] if e.pos < len(fixed_json) else 'EOF')
                 
                 # FALLBACK: Tenta extrair capítulos manualmente usando regex
                 try:
                     chapters_match = re.search(r'"chapters":\s*\[(.*?)\]', json_str, re.DOTALL)
                     if chapters_match:
-                        print("Tentando extrair capítulos com fallback...")
+                        log.info('Tentando extrair capítulos com fallback...')
                         # Implementar fallback se necessário
                 except Exception as fallback_error:
-                    print(f"Fallback também falhou: {fallback_error}")
+                    log.error('Fallback também falhou: %s', fallback_error)
                 
                 return []
         
@@ -8,6 +8,8 @@ from core.__seedwork.infra.http import Http
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
 from core.config.login_data import insert_login, LoginData, get_login, delete_login
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.empreguetes')
 
 class EmpreguetesProvider(Base):
     name = 'Empreguetes'
@@ -48,7 +50,7 @@ class EmpreguetesProvider(Base):
         if login_info and login_info.headers.get('authorization'):
             self.access_token = login_info.headers.get('authorization').replace('Bearer ', '')
             self.headers['authorization'] = f'Bearer {self.access_token}'
-            print("[Empreguetes] ✅ Token de acesso carregado")
+            log.info('[Empreguetes] ✅ Token de acesso carregado')
     
     def _save_token(self, token: str):
         """Salva o token de acesso no banco de dados"""
@@ -59,18 +61,18 @@ class EmpreguetesProvider(Base):
             {'authorization': f'Bearer {token}'},
             {}
         ))
-        print("[Empreguetes] ✅ Token de acesso salvo")
+        log.info('[Empreguetes] ✅ Token de acesso salvo')
     
     def login(self):
         """Realiza login na API do Empreguetes"""
         # Verifica se já tem token válido
         login_info = get_login(self.domain_name)
         if login_info and login_info.headers.get('authorization'):
-            print("[Empreguetes] ✅ Login encontrado em cache")
+            log.info('[Empreguetes] ✅ Login encontrado em cache')
             self._load_token()
             return True
         
-        print("[Empreguetes] 🔐 Realizando login...")
+        log.info('[Empreguetes] 🔐 Realizando login...')
         
         try:
             login_url = f'{self.base}/auth/login'
@@ -112,18 +114,18 @@ class EmpreguetesProvider(Base):
                 
                 if access_token:
                     self._save_token(access_token)
-                    print(f"[Empreguetes] ✅ Login bem-sucedido! Usuário: {user.get('nome', 'Desconhecido')}")
+                    log.info('[Empreguetes] ✅ Login bem-sucedido! Usuário: %s', user.get('nome', 'Desconhecido'))
                     return True
                 else:
-                    print("[Empreguetes] ❌ Token não encontrado na resposta")
+                    log.error('[Empreguetes] ❌ Token não encontrado na resposta')
                     return False
             else:
-                print(f"[Empreguetes] ❌ Falha no login - Status: {response.status}")
-                print(f"[Empreguetes] Resposta: {response.content}")
+                log.error('[Empreguetes] ❌ Falha no login - Status: %s', response.status)
+                log.info('[Empreguetes] Resposta: %s', response.content)
                 return False
                 
         except Exception as e:
-            print(f"[Empreguetes] ❌ Erro ao fazer login: {e}")
+            log.error('[Empreguetes] ❌ Erro ao fazer login: %s', e)
             return False
     
     def getManga(self, link: str) -> Manga:
@@ -140,13 +142,13 @@ class EmpreguetesProvider(Base):
             
             # Nova API usa slug ao invés de ID
             api_url = f'{self.base}/obras/{slug}'
-            print(f"[Empreguetes] Chamando API: {api_url}")
+            log.info('[Empreguetes] Chamando API: %s', api_url)
             
             # Usar requests diretamente para evitar bypass do Cloudflare
             response = requests.get(api_url, headers=self.headers, timeout=15)
             
-            print(f"[DEBUG] Response status: {response.status_code}")
-            print(f"[DEBUG] Response content length: {len(response.content) if response.content else 0}")
+            log.info('[DEBUG] Response status: %s', response.status_code)
+            log.info('[DEBUG] Response content length: %s', len(response.content) if response.content else 0)
             
             if response.status_code == 200:
                 data = response.json()
@@ -156,7 +158,7 @@ class EmpreguetesProvider(Base):
                 raise Exception(f"API retornou status {response.status_code}")
             
         except Exception as e:
-            print(f"[Empreguetes] Erro em getManga: {e}")
+            log.error('[Empreguetes] Erro em getManga: %s', e)
             raise
 
     def getChapters(self, manga_id: str) -> List[Chapter]:
@@ -173,7 +175,7 @@ class EmpreguetesProvider(Base):
             
             # Nova API usa slug ao invés de ID
             api_url = f'{self.base}/obras/{slug}'
-            print(f"[Empreguetes] Chamando API: {api_url}")
+            log.info('[Empreguetes] Chamando API: %s', api_url)
             
             response = requests.get(api_url, headers=self.headers, timeout=15)
             data = response.json()
@@ -185,7 +187,7 @@ class EmpreguetesProvider(Base):
                 chapters_list.append(Chapter([slug, ch['cap_id']], ch['cap_nome'], title))
             return chapters_list
         except Exception as e:
-            print(f"[Empreguetes] Erro em getChapters: {e}")
+            log.error('[Empreguetes] Erro em getChapters: %s', e)
             return []
 
     def getPages(self, ch: Chapter) -> Pages:
@@ -196,20 +198,20 @@ class EmpreguetesProvider(Base):
         
         images = []
         
-        print(f"[Empreguetes] Obtendo páginas para: {ch.name}")
+        log.info('[Empreguetes] Obtendo páginas para: %s', ch.name)
         
         time.sleep(random.uniform(0.3, 1))  # Pequena espera para evitar bloqueios
         try:
             # Usar API com requests
             api_url = f"{self.base}/capitulos/{ch.id[1]}"
-            print(f"[Empreguetes] Chamando API: {api_url}")
+            log.info('[Empreguetes] Chamando API: %s', api_url)
             
             response = requests.get(api_url, headers=self.headers, timeout=15)
             data = response.json()
-            print(data)
+            log.debug('%s', data)
             obra_id = data.get('obr_id', 'Desconhecido')
             cap_numero = data.get('cap_numero', 'Desconhecido')
-            print(f"[Empreguetes] API retornou {len(data.get('cap_paginas', []))} páginas")
+            log.info('[Empreguetes] API retornou %s páginas', len(data.get('cap_paginas', [])))
 
             def clean_path(p):
                 return p.strip('/') if p else ''
@@ -233,21 +235,21 @@ class EmpreguetesProvider(Base):
                     
                     if full_url and full_url.startswith('http'):
                         images.append(full_url)
-                        print(f"[Empreguetes] Página {i+1}: {full_url}")
+                        log.info('[Empreguetes] Página %s: %s', i+1, full_url)
                     
                 except Exception as e:
-                    print(f"[Empreguetes] Erro ao processar página {i+1}: {e}")
+                    log.error('[Empreguetes] Erro ao processar página %s: %s', i+1, e)
                     continue
             
             if images:
-                print(f"[Empreguetes] ✅ Sucesso: {len(images)} páginas encontradas")
+                log.info('[Empreguetes] ✅ Sucesso: %s páginas encontradas', len(images))
                 return Pages(ch.id, ch.number, ch.name, images)
             else:
-                print("[Empreguetes] ⚠️ Nenhuma página válida encontrada")
+                log.warning('[Empreguetes] ⚠️ Nenhuma página válida encontrada')
                 
         except Exception as e:
-            print(f"[Empreguetes] ❌ Erro na API: {e}")
+            log.error('[Empreguetes] ❌ Erro na API: %s', e)
 
         # Se chegou aqui, API falhou - retornar páginas vazias
-        print("[Empreguetes] ❌ Falha na API - retornando lista vazia")
+        log.error('[Empreguetes] ❌ Falha na API - retornando lista vazia')
         return Pages(ch.id, ch.number, ch.name, [])
\ No newline at end of file
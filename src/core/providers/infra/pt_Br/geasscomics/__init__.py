@@ -10,6 +10,8 @@ from core.__seedwork.infra.utils.sanitize_folder import sanitize_folder_name
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
 from core.__seedwork.infra.http import Http
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.geasscomics')
 
 
 class GeassComicsProvider(Base):
@@ -34,7 +36,7 @@ class GeassComicsProvider(Base):
             
             slug = match.group(1)
             
-            print(f"[GeassComics] Acessando API da obra: {slug}")
+            log.info('[GeassComics] Acessando API da obra: %s', slug)
             
             # Busca informações via API
             api_url = f"{self.api_url}/mangas/{slug}"
@@ -49,14 +51,14 @@ class GeassComicsProvider(Base):
             title = data.get('title', slug)
             manga_id = data.get('id')
             
-            print(f"[GeassComics] Título: {title}")
-            print(f"[GeassComics] ID: {manga_id}")
+            log.info('[GeassComics] Título: %s', title)
+            log.info('[GeassComics] ID: %s', manga_id)
             
             # Retorna link com slug para manter compatibilidade
             return Manga(link, title)
                 
         except Exception as e:
-            print(f"[GeassComics] Erro em getManga: {e}")
+            log.error('[GeassComics] Erro em getManga: %s', e)
             raise
 
     def getChapters(self, manga_id: str) -> List[Chapter]:
@@ -81,7 +83,7 @@ class GeassComicsProvider(Base):
             manga_uuid = manga_data.get('id')
             manga_title = manga_data.get('title', slug)
             
-            print(f"[GeassComics] Extraindo capítulos da obra: {manga_title}")  
+            log.info('[GeassComics] Extraindo capítulos da obra: %s', manga_title)  
             # Busca capítulos com paginação
             chapters_list = []
             page = 1
@@ -127,9 +129,7 @@ class GeassComicsProvider(Base):
             return chapters_list
                 
         except Exception as e:
-            print(f"[GeassComics] Erro em getChapters: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception('[GeassComics] Erro em getChapters: %s', e)
             return []
 
     def getPages(self, ch: Chapter) -> Pages:
@@ -143,7 +143,7 @@ class GeassComicsProvider(Base):
             
             chapter_id = match.group(1)
             
-            print(f"[GeassComics] Chapter ID: {chapter_id}")
+            log.info('[GeassComics] Chapter ID: %s', chapter_id)
             
             # Busca páginas via API
             # Formato: https://api.skkyscan.fun/api/chapters/{chapter_id}
@@ -176,7 +176,5 @@ class GeassComicsProvider(Base):
             return Pages(ch.id, ch.number, ch.name, images)
                 
         except Exception as e:
-            print(f"[GeassComics] Erro em getPages: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception('[GeassComics] Erro em getPages: %s', e)
             return Pages(ch.id, ch.number, ch.name, [])
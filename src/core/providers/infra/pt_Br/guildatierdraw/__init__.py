@@ -1,9 +1,10 @@
-import nodriver as uc
 from typing import List
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from core.providers.domain.entities import Chapter
 from core.providers.infra.template.manga_reader_cms import MangaReaderCms
+from core.browser.application.use_cases import RunInBrowserUseCase
+from core.browser.infra.nodriver.capture import wait_for_selector
 
 class GuildaTierDrawProvider(MangaReaderCms):
     name = 'Guilda Tier draw'
@@ -21,30 +22,10 @@ class GuildaTierDrawProvider(MangaReaderCms):
         self.query_title_for_uri = 'h1.mt-0'
     
     def getPageContent(self, domain: str, background = False) -> any:
-        content= ''
-        async def get_script_result():
-            nonlocal content
-            browser = await uc.start(
-                browser_args=[
-                    '--window-size=600,600', 
-                    f'--app={domain}',
-                    '--disable-extensions', 
-                    '--disable-popup-blocking'
-                ],
-                browser_executable_path=None,
-                headless=background
-            )
-            page = await browser.get(domain)
-            data = []
-            while len(data) == 0:
-                page_content = await page.evaluate('document.documentElement.outerHTML')
-                soup = BeautifulSoup(page_content, 'html.parser')
-                data = soup.select(self.query_chapters)
-
-            content = page_content
-            browser.stop()
-        uc.loop().run_until_complete(get_script_result())
-        return content
+        async def render(browser, page):
+            await wait_for_selector(page, self.query_chapters, timeout=60)
+            return await page.evaluate('document.documentElement.outerHTML')
+        return RunInBrowserUseCase().execute(domain, render, headless=background)
     
     def getChapters(self, id: str) -> List[Chapter]:
         response = self.getPageContent(urljoin(self.url, id), True)
@@ -1,15 +1,40 @@
 import re
-from time import sleep
+import json
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from typing import List
-from DrissionPage import ChromiumPage, ChromiumOptions
 from core.__seedwork.infra.http import Http
 from core.providers.domain.entities import Pages
 from core.download.application.use_cases import DownloadUseCase
 from core.providers.domain.entities import Chapter, Pages, Manga
 from core.providers.infra.template.wordpress_madara import WordPressMadara
 from core.config.login_data import insert_login, LoginData, get_login, delete_login
+from core.browser.application.use_cases import RunInBrowserUseCase
+from core.browser.infra.nodriver.capture import wait_for, wait_idle, wait_for_login
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.huntersscan')
+
+# URLs das imagens depois da descriptografia, na ordem de preferência: divs
+# com data-src, window._HuntersOpts.imgs, imagens do leitor e, por fim,
+# qualquer imagem de wp-content/uploads
+EXTRACT_IMAGES_SCRIPT = '''
+    (() => {
+        const attr = (selector, name) => [...document.querySelectorAll(selector)]
+            .map(el => (el.getAttribute(name) || '').trim())
+            .filter(Boolean);
+        let urls = attr('div.js-canvas-wrap[data-src]', 'data-src');
+        if (!urls.length && window._HuntersOpts && Array.isArray(window._HuntersOpts.imgs)) {
+            urls = window._HuntersOpts.imgs.filter(Boolean);
+        }
+        if (!urls.length) {
+            urls = attr('.reading-content img[src]', 'src').filter(src => !src.includes('data:'));
+        }
+        if (!urls.length) {
+            urls = attr('img[src*="wp-content/uploads"]', 'src');
+        }
+        return JSON.stringify(urls);
+    })()
+'''
 
 class HuntersScanProvider(WordPressMadara):
     name = 'Hunters scan'
@@ -54,54 +79,35 @@ class HuntersScanProvider(WordPressMadara):
         return False
     
     def login(self):
-        """Realiza login usando DrissionPage para capturar cookies do navegador real"""
+        """Realiza login no navegador real e captura os cookies"""
         login_info = get_login(self.domain_name)
         if login_info:
-            print("[HuntersScan] ✅ Login encontrado em cache")
+            log.info('[HuntersScan] ✅ Login encontrado em cache')
             return True
         
-        print("[HuntersScan] 🔐 Iniciando navegador para login...")
-        print("[HuntersScan] 📝 Você tem 30 segundos para fazer login")
+        log.info('[HuntersScan] 🔐 Iniciando navegador para login...')
+        log.info('[HuntersScan] 📝 Faça login na janela aberta')
+
+        async def logged_in(page):
+            return self._is_logged_in(await page.get_content())
+
+        async def wait_login(browser, page):
+            return await wait_for_login(page, logged_in)
         
         try:
-            co = ChromiumOptions()
-            co.headless(False)
-            
-            page = ChromiumPage(addr_or_opts=co)
-            page.get(f'{self.url}/')
-            
-            print("[HuntersScan] ⏳ Aguardando 30 segundos...")
-            sleep(30)
-            
-            print("[HuntersScan] ✅ Capturando cookies...")
-            
-            cookies = page.cookies()
-            cookies_dict = {}
-            
-            for cookie in cookies:
-                if hasattr(cookie, 'name') and hasattr(cookie, 'value'):
-                    cookies_dict[cookie.name] = cookie.value
-                elif isinstance(cookie, dict):
-                    cookies_dict[cookie.get('name')] = cookie.get('value')
-            
-            print(f"[HuntersScan] 🍪 {len(cookies_dict)} cookies capturados")
-            
-            page.quit()
+            cookies_dict = RunInBrowserUseCase().execute(f'{self.url}/', wait_login, headless=False)
+            log.info('[HuntersScan] 🍪 %s cookies capturados', len(cookies_dict))
             
             if cookies_dict:
                 insert_login(LoginData(self.domain_name, {}, cookies_dict))
-                print("[HuntersScan] ✅ Login salvo com sucesso!")
+                log.info('[HuntersScan] ✅ Login salvo com sucesso!')
                 return True
             else:
-                print("[HuntersScan] ❌ Nenhum cookie capturado")
+                log.error('[HuntersScan] ❌ Nenhum cookie capturado')
                 return False
                 
-        except ImportError:
-            print("[HuntersScan] ❌ DrissionPage não está instalado")
-            print("[HuntersScan] Execute: pip install DrissionPage")
-            return False
         except Exception as e:
-            print(f"[HuntersScan] ❌ Erro durante login: {e}")
+            log.error('[HuntersScan] ❌ Erro durante login: %s', e)
             return False
     
     def getManga(self, link: str) -> Manga:
@@ -143,79 +149,40 @@ class HuntersScanProvider(WordPressMadara):
         """
         Extrai URLs das imagens do capítulo.
         O site usa proteção WASM - as imagens são criptografadas no payload JS.
-        Usamos DrissionPage para renderizar a página e capturar as URLs após descriptografia.
+        O navegador renderiza a página e as URLs são lidas depois da descriptografia.
         """
         uri = urljoin(self.url, ch.id)
         
-        print(f"[HuntersScan] 🔄 Carregando capítulo com navegador (proteção WASM)...")
+        log.info('[HuntersScan] 🔄 Carregando capítulo com navegador (proteção WASM)...')
         
         urls_imagens = []
         
+        async def extract(page):
+            return json.loads(await page.evaluate(EXTRACT_IMAGES_SCRIPT) or '[]')
+
+        async def render(browser, page):
+            # Espera o WASM descriptografar as primeiras imagens e a rede parar
+            await wait_for(page, extract, timeout=60)
+            await wait_idle(page, idle=2.0)
+            return await extract(page)
+
         try:
-            co = ChromiumOptions()
-            #co.headless(True)
-            co.set_argument('--no-sandbox')
-            co.set_argument('--disable-dev-shm-usage')
-            co.set_argument('--disable-javascript')
-            page = ChromiumPage(addr_or_opts=co)
-            page.get(uri)
-            
-            # Aguardar o JavaScript carregar e descriptografar as imagens
-            print(f"[HuntersScan] ⏳ Aguardando renderização das imagens...")
-            sleep(60)  # Aguardar WASM processar
-            
-            # Método 1: Buscar divs com data-src após renderização
-            canvas_wraps = page.eles('css:div.js-canvas-wrap[data-src]')
-            for div in canvas_wraps:
-                data_src = div.attr('data-src')
-                if data_src and data_src.strip():
-                    urls_imagens.append(data_src.strip())
-            
-            # Método 2: Se não encontrou, tentar extrair do JavaScript _HuntersOpts
-            if not urls_imagens:
-                try:
-                    # Executar JS para pegar as URLs já processadas
-                    result = page.run_js('return window._HuntersOpts ? window._HuntersOpts.imgs : []')
-                    if result and isinstance(result, list):
-                        urls_imagens = [url for url in result if url]
-                except Exception as e:
-                    print(f"[HuntersScan] ⚠️ Erro ao extrair imgs do JS: {e}")
-            
-            # Método 3: Buscar imagens renderizadas no container
-            if not urls_imagens:
-                imgs = page.eles('css:.reading-content img[src]')
-                for img in imgs:
-                    src = img.attr('src')
-                    if src and 'data:' not in src:
-                        urls_imagens.append(src)
-            
-            # Método 4: Buscar qualquer img com src de imagem
-            if not urls_imagens:
-                imgs = page.eles('css:img[src*="wp-content/uploads"]')
-                for img in imgs:
-                    src = img.attr('src')
-                    if src:
-                        urls_imagens.append(src)
-            
-            page.quit()
+            urls_imagens = RunInBrowserUseCase().execute(uri, render, headless=False)
             
         except Exception as e:
-            print(f"[HuntersScan] ❌ Erro ao usar navegador: {e}")
-            print(f"[HuntersScan] 🔄 Tentando fallback com HTTP...")
+            log.error('[HuntersScan] ❌ Erro ao usar navegador: %s', e)
+            log.info('[HuntersScan] 🔄 Tentando fallback com HTTP...')
             
             # Fallback: tentar método HTTP tradicional
             response = Http.get(uri, timeout=self.timeout)
             soup = BeautifulSoup(response.content, 'html.parser')
             
             # Tentar extrair URLs do payload JS (base64)
-            import base64
-            import json
-            
             script_text = soup.find('script', string=re.compile(r'_HuntersOpts'))
             if script_text:
                 match = re.search(r'payload:\s*"([^"]+)"', script_text.string)
                 if match:
-                    print(f"[HuntersScan] 📦 Payload encontrado (criptografado)")
+                    log.info('[HuntersScan] 📦 Payload encontrado (criptografado)')
             
             # Buscar método padrão
             data = soup.select(self.query_pages)
@@ -227,7 +194,7 @@ class HuntersScanProvider(WordPressMadara):
         if not urls_imagens:
             raise Exception(f"Não foi possível extrair as URLs das imagens do capítulo: {ch.id}. O site usa proteção WASM.")
         
-        print(f"[HuntersScan] ✅ {len(urls_imagens)} imagens encontradas")
+        log.info('[HuntersScan] ✅ %s imagens encontradas', len(urls_imagens))
         
         number = re.findall(r'\d+\.?\d*', str(ch.number))[0]
         return Pages(ch.id, number, ch.name, urls_imagens)
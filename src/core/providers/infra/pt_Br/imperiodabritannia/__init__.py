@@ -8,7 +8,6 @@
 # from core.providers.domain.entities import Chapter, Pages, Manga
 # from core.download.application.use_cases import DownloadUseCase
 # from core.providers.infra.template.wordpress_madara import WordPressMadara
-# from DrissionPage import ChromiumPage
 # 
 # # Variáveis globais para manter a sessão viva
 # _GLOBAL_BROWSER = None
@@ -9,6 +9,8 @@ from core.__seedwork.infra.http import Http
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
 from core.config.login_data import insert_login, LoginData, get_login
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.kuromangas')
 
 
 class RabbitCipher:
@@ -351,13 +353,13 @@ class KuromangasProvider(Base):
                     else:
                         decrypted_json = json.loads(decrypted_str)
 
-                    print(f"[Kuromangas] 🔑 Decrypt OK com identificador: {identificador}")
+                    log.info('[Kuromangas] 🔑 Decrypt OK com identificador: %s', identificador)
                     break
                 except Exception:
                     continue
 
             if not decrypted_json:
-                print("[Kuromangas] ⚠️ Não foi possível descriptografar com os identificadores conhecidos")
+                log.warning('[Kuromangas] ⚠️ Não foi possível descriptografar com os identificadores conhecidos')
                 return {}
             
             if '_wrapped' in decrypted_json:
@@ -372,14 +374,12 @@ class KuromangasProvider(Base):
             return decrypted_json
             
         except json.JSONDecodeError as e:
-            print(f"[Kuromangas] ❌ Erro JSON: {e}")
+            log.error('[Kuromangas] ❌ Erro JSON: %s', e)
             if decrypted_str:
-                print(f"[Kuromangas] 📝 Output: {repr(decrypted_str[:300])}")
+                log.info('[Kuromangas] 📝 Output: %s', repr(decrypted_str[:300]))
             return {}
         except Exception as e:
-            print(f"[Kuromangas] ❌ Erro: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception('[Kuromangas] ❌ Erro: %s', e)
             return {}
 
     def _processar_resposta_api(self, response) -> dict:
@@ -388,12 +388,9 @@ class KuromangasProvider(Base):
             crypto_version = response.headers.get('x-crypto-version')
             if crypto_version and self.expected_crypto_version and crypto_version != self.expected_crypto_version:
                 self._crypto_retry_count += 1
-                print(
-                    f"[Kuromangas] ⚠️ Versão de criptografia mudou: {crypto_version} "
-                    f"(esperada: {self.expected_crypto_version})"
-                )
+                log.warning('[Kuromangas] ⚠️ Versão de criptografia mudou: %s (esperada: %s)', crypto_version, self.expected_crypto_version)
                 if self._crypto_retry_count <= self._crypto_retry_limit:
-                    print("[Kuromangas] 🔄 Tentando renovar sessão por mudança de versão...")
+                    log.info('[Kuromangas] 🔄 Tentando renovar sessão por mudança de versão...')
                     self.login(force=True)
             else:
                 self._crypto_retry_count = 0
@@ -404,21 +401,21 @@ class KuromangasProvider(Base):
             if '_v_secure' in data:
                 encrypted_data = data.get('_v_secure', '')
                 if encrypted_data:
-                    print("[Kuromangas] 🔐 Formato _v_secure detectado")
+                    log.info('[Kuromangas] 🔐 Formato _v_secure detectado')
                     return self._descriptografar_rabbit(encrypted_data, data_key=data_key)
                 return {}
             
             elif '_r_data' in data and '_auth' in data:
                 encrypted_data = data.get('_r_data', '')
                 if encrypted_data:
-                    print("[Kuromangas] 🔐 Formato _r_data detectado")
+                    log.info('[Kuromangas] 🔐 Formato _r_data detectado')
                     return self._descriptografar_rabbit(encrypted_data, data_key=data_key)
                 return {}
             
             return data
                 
         except Exception as e:
-            print(f"[Kuromangas] ❌ Erro: {e}")
+            log.error('[Kuromangas] ❌ Erro: %s', e)
             return {}
 
     def _load_token(self):
@@ -426,23 +423,23 @@ class KuromangasProvider(Base):
         if login_info and login_info.headers.get('authorization'):
             self.access_token = login_info.headers.get('authorization').replace('Bearer ', '')
             self.headers['authorization'] = f'Bearer {self.access_token}'
-            print("[Kuromangas] ✅ Token carregado")
+            log.info('[Kuromangas] ✅ Token carregado')
 
     def _save_token(self, token: str):
         self.access_token = token
         self.headers['authorization'] = f'Bearer {token}'
         insert_login(LoginData(self.domain_name, {'authorization': f'Bearer {token}'}, {}))
-        print("[Kuromangas] ✅ Token salvo")
+        log.info('[Kuromangas] ✅ Token salvo')
 
     def login(self, force=False):
         if not force:
             login_info = get_login(self.domain_name)
             if login_info and login_info.headers.get('authorization'):
-                print("[Kuromangas] ✅ Login em cache")
+                log.info('[Kuromangas] ✅ Login em cache')
                 self._load_token()
                 return True
         
-        print("[Kuromangas] 🔐 Fazendo login...")
+        log.info('[Kuromangas] 🔐 Fazendo login...')
         
         try:
             response = requests.post(
@@ -457,11 +454,11 @@ class KuromangasProvider(Base):
                 token = data.get('token')
                 if token:
                     self._save_token(token)
-                    print(f"[Kuromangas] ✅ Login OK!")
+                    log.info('[Kuromangas] ✅ Login OK!')
                     return True
             return False
         except Exception as e:
-            print(f"[Kuromangas] ❌ Erro: {e}")
+            log.error('[Kuromangas] ❌ Erro: %s', e)
             return False
 
     def getManga(self, link: str) -> Manga:
@@ -486,7 +483,7 @@ class KuromangasProvider(Base):
         
         data = self._processar_resposta_api(response)
         title = data.get('manga', {}).get('title', 'Desconhecido')
-        print(f"[Kuromangas] ✅ Mangá: {title}")
+        log.info('[Kuromangas] ✅ Mangá: %s', title)
         return Manga(link, title)
 
     def getChapters(self, manga_id: str) -> List[Chapter]:
@@ -517,7 +514,7 @@ class KuromangasProvider(Base):
             num = str(ch.get('chapter_number', '?')).replace('.00', '')
             chapters.append(Chapter(ch['id'], num, title))
         
-        print(f"[Kuromangas] ✅ {len(chapters)} capítulos")
+        log.info('[Kuromangas] ✅ %s capítulos', len(chapters))
         return chapters
 
     def getPages(self, ch: Chapter) -> Pages:
@@ -539,5 +536,5 @@ class KuromangasProvider(Base):
         data = self._processar_resposta_api(response)
         urls = [f"{self.cdn}{p}" for p in data.get('pages', [])]
         
-        print(f"[Kuromangas] ✅ {len(urls)} páginas")
+        log.info('[Kuromangas] ✅ %s páginas', len(urls))
         return Pages(ch.id, ch.number, ch.name, urls)
\ No newline at end of file
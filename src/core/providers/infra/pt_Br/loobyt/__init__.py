@@ -1,12 +1,13 @@
 import re
 import asyncio
-import nodriver as uc
 from typing import List
 from bs4 import BeautifulSoup
 from core.__seedwork.infra.http import Http
 from urllib.parse import urlparse, parse_qs
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.loobyt')
 
 class LoobytProvider(Base):
     name = 'Loobyt'
@@ -38,42 +39,10 @@ class LoobytProvider(Base):
                 list.append(Chapter(f'{self.base}{ch['id']}', f'Capítulo {ch['number']}', title.get_text(strip=True)))
             return list
         except Exception as e:
-            print(e)
-
-    # def get_Pages(self, id, sleep, background=False):
-    #     async def get_Pages_driver():
-    #         browser = await uc.start(
-    #             browser_args=[
-    #                 '--window-size=600,600',
-    #                 f'--app={id}',
-    #                 '--disable-extensions',
-    #                 '--disable-popup-blocking'
-    #             ],
-    #             browser_executable_path=None,
-    #             headless=background
-    #         )
-    #         page = await browser.get(id)
-    #         await asyncio.sleep(sleep)
-    #         html = await page.get_content()
-            
-    #         # Parse do HTML para extrair scripts
-    #         soup = BeautifulSoup(html, 'html.parser')
-    #         scripts = soup.find_all('script')
-    #         scripts_text = '\n'.join(script.text for script in scripts)
-            
-    #         # Regex para encontrar URLs de imagens (igual ao Kotlin)
-    #         IMAGE_URL_REGEX = re.compile(r'url\\\":\\\"([^\\\\\"]+)')
-    #         matches = IMAGE_URL_REGEX.findall(scripts_text)
-            
-    #         browser.stop()
-    #         return [match for match in matches]  # Retorna lista de URLs
-
-    #     resultado = uc.loop().run_until_complete(get_Pages_driver())
-    #     return resultado
+            log.error('%s', e)
 
     def getPages(self, ch: Chapter) -> Pages:
         try:
-            # response = self.get_Pages(ch.id, 10)
             response = Http.get(ch.id)
             soup = BeautifulSoup(response.content, 'html.parser')
             scripts = soup.find_all('script')
@@ -90,4 +59,4 @@ class LoobytProvider(Base):
             # urls = [url.rstrip("\\") for url in list]
             return Pages(ch.id, ch.number, ch.name, list)
         except Exception as e:
-            print(e)
+            log.error('%s', e)
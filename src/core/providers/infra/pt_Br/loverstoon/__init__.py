@@ -5,6 +5,8 @@ from bs4 import BeautifulSoup
 import re
 from core.__seedwork.infra.http import Http
 from urllib.parse import urljoin
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.loverstoon')
 
 class LoversToonProvider(WordPressMadara):
     name = 'Lovers toon'
@@ -71,7 +73,7 @@ class LoversToonProvider(WordPressMadara):
             return int(diferenca.total_seconds())
             
         except Exception as e:
-            print(f"[LoversToon] Erro ao converter data '{data_texto}': {e}")
+            log.error("[LoversToon] Erro ao converter data '%s': %s", data_texto, e)
             return 86400 * 7  # Padrão 7 dias
 
     def getPages(self, ch: Chapter) -> Pages:
@@ -101,9 +103,9 @@ class LoversToonProvider(WordPressMadara):
                 
                 if urls:
                     list = urls
-                    print(f"✅ Encontradas {len(urls)} imagens no script JavaScript")
+                    log.info('✅ Encontradas %s imagens no script JavaScript', len(urls))
                     for url in urls:
-                        print(url)
+                        log.debug('%s', url)
                     break
         
         # Validar se encontrou páginas
@@ -7,6 +7,8 @@ from core.__seedwork.infra.http import Http
 from core.providers.domain.entities import Chapter, Pages, Manga
 from urllib.parse import urljoin, urlencode, urlparse, urlunparse, parse_qs
 import os
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.lyncantoons')
 
 class LycanToonsProvider(WordPressMadara):
     name = 'Lycan Toons'
@@ -26,9 +28,9 @@ class LycanToonsProvider(WordPressMadara):
         self.query_placeholder = '[id^="manga-chapters-holder"][data-id]' 
     
     def getManga(self, link: str) -> Manga:
-        print(f"\n{'='*60}")
-        print(f"[LycanToons getManga] Iniciando para: {link}")
-        print(f"{'='*60}")
+        log.info('\n%s', '='*60)
+        log.info('[LycanToons getManga] Iniciando para: %s', link)
+        log.info('%s', '='*60)
         
         response = Http.get(link, timeout=getattr(self, 'timeout', None))
         
@@ -42,20 +44,20 @@ class LycanToonsProvider(WordPressMadara):
             with open(log_file, 'w', encoding='utf-8') as f:
                 f.write(content)
         except Exception as e:
-            print(f"[LycanToons getManga] ✗ Erro ao salvar log: {e}")
+            log.error('[LycanToons getManga] ✗ Erro ao salvar log: %s', e)
         
         if 'self.__next_f' in content:
             # Mostra contexto onde aparece
             idx = content.find('self.__next_f')
         else:
-            print(f"[LycanToons getManga] ✗ 'self.__next_f' NÃO encontrado")
+            log.error("[LycanToons getManga] ✗ 'self.__next_f' NÃO encontrado")
         
             
         if 'Book' in content:
             # Mostra contexto
             idx = content.find('Book')
             sample = content[max(0, idx-200):idx+300]
-            print(sample)
+            log.debug('%s', sample)
             
             # Extrai e salva a região completa do JSON
             try:
@@ -69,10 +71,10 @@ class LycanToonsProvider(WordPressMadara):
                     f.write("=== REGIÃO COMPLETA DO BOOK ===\n")
                     f.write(json_region)
             except Exception as e:
-                print(f"[LycanToons getManga] ✗ Erro ao salvar região: {e}")
+                log.error('[LycanToons getManga] ✗ Erro ao salvar região: %s', e)
                 
         else:
-            print(f"[LycanToons getManga] ✗ 'Book' NÃO encontrado")
+            log.error("[LycanToons getManga] ✗ 'Book' NÃO encontrado")
         
         title = None
         
@@ -111,13 +113,13 @@ class LycanToonsProvider(WordPressMadara):
                             data = json.loads(json_str_clean)
                             title = data.get('name')
                         except Exception as e2:
-                            print(f"[LycanToons getManga] ✗ Erro no método alternativo: {e2}")
+                            log.error('[LycanToons getManga] ✗ Erro no método alternativo: %s', e2)
                 else:
-                    print(f"[LycanToons getManga] ✗ Marcador de fim não encontrado")
+                    log.error('[LycanToons getManga] ✗ Marcador de fim não encontrado')
             else:
-                print(f"[LycanToons getManga] ✗ Book não encontrado no conteúdo após push")
+                log.error('[LycanToons getManga] ✗ Book não encontrado no conteúdo após push')
         else:
-            print(f"[LycanToons getManga] ✗ Marcador self.__next_f.push não encontrado")
+            log.error('[LycanToons getManga] ✗ Marcador self.__next_f.push não encontrado')
         
         # Fallback: busca direta por padrão simples
         if not title:
@@ -139,7 +141,7 @@ class LycanToonsProvider(WordPressMadara):
             if meta_title:
                 title = meta_title.get('content', '').strip()
             else:
-                print(f"[LycanToons getManga] ✗ Meta tag og:title não encontrada")
+                log.error('[LycanToons getManga] ✗ Meta tag og:title não encontrada')
         
         return Manga(id=link, name=title or "Título Desconhecido")
 
@@ -174,7 +176,7 @@ class LycanToonsProvider(WordPressMadara):
                             'number': str(numero)
                         })
             except Exception as e:
-                print(f"[LycanToons] Erro ao parsear capitulos: {e}")
+                log.error('[LycanToons] Erro ao parsear capitulos: %s', e)
         
         # Busca o título
         if not title:
@@ -294,7 +296,7 @@ class LycanToonsProvider(WordPressMadara):
             ch_number = re.findall(r'\d+\.?\d*', str(ch.number))
             number = ch_number[0] if ch_number else ch.number
             
-            print(f"\n[LycanToons getPages] Buscando imagens do capítulo: {ch.id}")
+            log.info('\n[LycanToons getPages] Buscando imagens do capítulo: %s', ch.id)
             
             # Headers seguindo o padrão do fetch
             headers = {
@@ -324,22 +326,22 @@ class LycanToonsProvider(WordPressMadara):
                 log_file = os.path.join(log_dir, f"getPages_chapter_{number}.html")
                 with open(log_file, 'w', encoding='utf-8') as f:
                     f.write(content)
-                print(f"[LycanToons getPages] ✓ HTML salvo em: {log_file}")
+                log.info('[LycanToons getPages] ✓ HTML salvo em: %s', log_file)
             except Exception as e:
-                print(f"[LycanToons getPages] ✗ Erro ao salvar log: {e}")
+                log.error('[LycanToons getPages] ✗ Erro ao salvar log: %s', e)
             
             img_urls = []
             
             # Debug: verifica se o padrão existe
             if 'self.__next_f.push' in content:
-                print(f"[LycanToons getPages] ✓ Encontrado 'self.__next_f.push' no HTML")
+                log.info("[LycanToons getPages] ✓ Encontrado 'self.__next_f.push' no HTML")
             else:
-                print(f"[LycanToons getPages] ✗ 'self.__next_f.push' NÃO encontrado")
+                log.error("[LycanToons getPages] ✗ 'self.__next_f.push' NÃO encontrado")
             
             if 'imageUrls' in content:
-                print(f"[LycanToons getPages] ✓ Encontrado 'imageUrls' no HTML")
+                log.info("[LycanToons getPages] ✓ Encontrado 'imageUrls' no HTML")
             else:
-                print(f"[LycanToons getPages] ✗ 'imageUrls' NÃO encontrado")
+                log.error("[LycanToons getPages] ✗ 'imageUrls' NÃO encontrado")
             
             # Busca diretamente pelo array imageUrls no HTML
             # O padrão está em: self.__next_f.push([1,"7:...{\\"imageUrls\\":[\\"url1\\",\\"url2\\"]..."])
@@ -363,8 +365,8 @@ class LycanToonsProvider(WordPressMadara):
                     break
             
             if urls_section:
-                print(f"[LycanToons getPages] ✓ Seção imageUrls encontrada com padrão: {matched_pattern[:50]}")
-                print(f"[LycanToons getPages] Primeiros 200 chars: {urls_section[:200]}")
+                log.info('[LycanToons getPages] ✓ Seção imageUrls encontrada com padrão: %s', matched_pattern[:50])
+                log.info('[LycanToons getPages] Primeiros 200 chars: %s', urls_section[:200])
                 
                 # Extrai todas as URLs - tenta diferentes padrões de escape
                 url_patterns = [
@@ -376,31 +378,29 @@ class LycanToonsProvider(WordPressMadara):
                 for url_pattern in url_patterns:
                     img_urls = re.findall(url_pattern, urls_section)
                     if img_urls:
-                        print(f"[LycanToons getPages] ✓ Encontradas {len(img_urls)} imagens com padrão: {url_pattern[:60]}")
-                        print(f"[LycanToons getPages] Primeira: {img_urls[0]}")
-                        print(f"[LycanToons getPages] Última: {img_urls[-1]}")
+                        log.info('[LycanToons getPages] ✓ Encontradas %s imagens com padrão: %s', len(img_urls), url_pattern[:60])
+                        log.info('[LycanToons getPages] Primeira: %s', img_urls[0])
+                        log.info('[LycanToons getPages] Última: %s', img_urls[-1])
                         break
                 
                 if not img_urls:
-                    print(f"[LycanToons getPages] ✗ Nenhuma URL extraída")
-                    print(f"[LycanToons getPages] Conteúdo da seção: {urls_section[:300]}")
+                    log.error('[LycanToons getPages] ✗ Nenhuma URL extraída')
+                    log.info('[LycanToons getPages] Conteúdo da seção: %s', urls_section[:300])
             else:
-                print(f"[LycanToons getPages] ✗ Pattern 'imageUrls' não encontrado no HTML")
+                log.error("[LycanToons getPages] ✗ Pattern 'imageUrls' não encontrado no HTML")
                 # Debug: mostra um trecho do HTML ao redor de "imageUrls"
                 idx = content.find('imageUrls')
                 if idx != -1:
-                    print(f"[LycanToons getPages] Debug - Contexto ao redor de 'imageUrls':")
-                    print(f"{content[max(0, idx-100):idx+200]}")
+                    log.info("[LycanToons getPages] Debug - Contexto ao redor de 'imageUrls':")
+                    log.info('%s', content[max(0, idx-100):idx+200])
             
             if not img_urls:
-                print(f"[LycanToons getPages] ✗ Nenhuma imagem encontrada")
+                log.error('[LycanToons getPages] ✗ Nenhuma imagem encontrada')
             
             return Pages(ch.id, number, ch.name, img_urls if img_urls else [])
                 
         except Exception as e:
-            print(f"[LycanToons getPages] ✗ Erro ao buscar imagens: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception('[LycanToons getPages] ✗ Erro ao buscar imagens: %s', e)
             number = re.findall(r'\d+\.?\d*', str(ch.number))[0] if re.findall(r'\d+\.?\d*', str(ch.number)) else ch.number
             return Pages(ch.id, number, ch.name, [])
     
@@ -421,7 +421,7 @@ class LycanToonsProvider(WordPressMadara):
             chapter_links = soup.select('a')
             
             if not chapter_links:
-                print(f"[NEXUSSCAN] Nenhum capítulo encontrado na página {page}")
+                log.info('[NEXUSSCAN] Nenhum capítulo encontrado na página %s', page)
                 break
             
             # Detecta repetições para parar o loop
@@ -455,14 +455,14 @@ class LycanToonsProvider(WordPressMadara):
             
             # Se mais de 80% são repetições ou nenhum novo, para o loop
             if len(chapter_links) > 0 and (repeated_count >= len(chapter_links) * 0.8 or new_chapters_count == 0):
-                print("[NEXUSSCAN] Parando: muitas repetições detectadas")
+                log.info('[NEXUSSCAN] Parando: muitas repetições detectadas')
                 break
             
             page += 1
             
             # Proteção contra loop infinito
             if page > 100:
-                print("[NEXUSSCAN] Limite de páginas atingido (100)")
+                log.info('[NEXUSSCAN] Limite de páginas atingido (100)')
                 break
         
         if all_chapters:
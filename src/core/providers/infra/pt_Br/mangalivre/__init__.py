@@ -4,8 +4,10 @@ from bs4 import BeautifulSoup
 from core.__seedwork.infra.http import Http
 from core.providers.domain.entities import Chapter, Pages, Manga
 from urllib.parse import urljoin, urlencode, urlparse, urlunparse, parse_qs
-import nodriver as uc
-from time import sleep
+from core.browser.application.use_cases import RunInBrowserUseCase
+from core.browser.infra.nodriver.capture import wait_for, wait_idle
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.mangalivre')
 
 class MangaLivreProvider(WordPressMadara):
     name = 'Manga Livre'
@@ -45,7 +47,7 @@ class MangaLivreProvider(WordPressMadara):
         
         # Se não encontrou imagens, usa nodriver para bypass do bloqueio
         if not pages_list:
-            print("[MangaLivre] Nenhuma imagem encontrada com HTTP, usando nodriver...")
+            log.info('[MangaLivre] Nenhuma imagem encontrada com HTTP, usando nodriver...')
             content = self._get_page_with_nodriver(uri)
             if content:
                 soup = BeautifulSoup(content, 'html.parser')
@@ -57,29 +59,17 @@ class MangaLivreProvider(WordPressMadara):
         return Pages(ch.id, number, ch.name, pages_list)
     
     def _get_page_with_nodriver(self, url: str) -> str:
-        """Usa nodriver em modo headless para burlar bloqueios"""
-        content = None
-        async def get_page():
-            nonlocal content
-            browser = await uc.start()
-            page = await browser.get(url)
-            sleep(10)
-            
-            # Aguarda até que "por favor" suma da página (indica carregamento completo)
-            max_attempts = 30  # máximo 30 tentativas (30 segundos)
-            for _ in range(max_attempts):
-                page_content = await page.get_content()
-                if "por favor" not in page_content.lower():
-                    content = page_content
-                    break
-                sleep(1)
-            else:
-                # Se timeout, retorna o que tiver
-                content = await page.get_content()
-            sleep(15)
-            browser.stop()
-        uc.loop().run_until_complete(get_page())
-        return content
+        """Usa o navegador para burlar bloqueios"""
+        async def ready(page):
+            # "por favor" some da página quando o carregamento termina
+            return "por favor" not in (await page.get_content()).lower()
+
+        async def get_page(browser, page):
+            # Se der timeout, retorna o que tiver
+            await wait_for(page, ready, timeout=40)
+            await wait_idle(page)
+            return await page.get_content()
+        return RunInBrowserUseCase().execute(url, get_page, headless=False)
     
     def _process_page_element(self, element, referer):
         element = element.find('img') or element.find('image')
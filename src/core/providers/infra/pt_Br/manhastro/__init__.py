@@ -12,6 +12,8 @@ from core.providers.domain.entities import Chapter, Pages, Manga
 from core.download.application.use_cases import DownloadUseCase
 from core.config.login_data import LoginData, get_login, insert_login
 from core.providers.infra.template.wordpress_madara import WordPressMadara
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.manhastro')
 
 class ManhastroProvider(WordPressMadara):
     name = 'Manhastro'
@@ -146,7 +148,7 @@ class ManhastroProvider(WordPressMadara):
         if found is not None:
             return found
 
-        print(f"[Manhastro] manga_id {manga_id} não encontrado em /dados")
+        log.info('[Manhastro] manga_id %s não encontrado em /dados', manga_id)
         return None
 
     def _get_manga_title_by_id(self, manga_id: str) -> str | None:
@@ -209,10 +211,10 @@ class ManhastroProvider(WordPressMadara):
             if response.status_code in [200, 201] and token:
                 self._save_token(token)
                 return True
-            print(f"[Manhastro] Falha no login: {response.status_code} - {payload}")
+            log.error('[Manhastro] Falha no login: %s - %s', response.status_code, payload)
             return False
         except Exception as e:
-            print(f"[Manhastro] Erro no login: {e}")
+            log.error('[Manhastro] Erro no login: %s', e)
             return False
 
     def getManga(self, link: str) -> Manga:
@@ -271,7 +273,7 @@ class ManhastroProvider(WordPressMadara):
                 chs.append(Chapter(str(capitulo_id), capitulo_nome, title))
             return chs
         except Exception as e:
-            print(f"Erro ao obter capítulos: {e}")
+            log.error('Erro ao obter capítulos: %s', e)
             return []
 
     def getPages(self, ch: Chapter) -> Pages:
@@ -339,7 +341,7 @@ class ManhastroProvider(WordPressMadara):
             number = number_match[0] if number_match else str(ch.number)
             return Pages(ch.id, number, ch.name, pages_list)
         except Exception as e:
-            print(f"Erro ao obter páginas: {e}")
+            log.error('Erro ao obter páginas: %s', e)
             return Pages(ch.id, ch.number, ch.name, [])
     
     def adjust_template_size(self, template, img):
@@ -369,17 +371,17 @@ class ManhastroProvider(WordPressMadara):
             return template
         
         except Exception as e:
-            print(f"❌ Erro ao ajustar tamanho do template: {e}")
+            log.error('❌ Erro ao ajustar tamanho do template: %s', e)
             return None
     
     def removeMark(self, img_path, template_path, output_path) -> bool:
         try:
             if not os.path.exists(img_path):
-                print(f"❌ Imagem não encontrada: {img_path}")
+                log.error('❌ Imagem não encontrada: %s', img_path)
                 return False
                 
             if not os.path.exists(template_path):
-                print(f"❌ Template não encontrado: {template_path}")
+                log.error('❌ Template não encontrado: %s', template_path)
                 return False
             
             try:
@@ -388,11 +390,11 @@ class ManhastroProvider(WordPressMadara):
                     file_bytes = np.asarray(bytearray(f.read()), dtype=np.uint8)
                 img = cv2.imdecode(file_bytes, cv2.IMREAD_COLOR)
             except Exception as e:
-                print(f"❌ Erro ao carregar imagem com numpy: {e}")
+                log.error('❌ Erro ao carregar imagem com numpy: %s', e)
                 img = cv2.imread(img_path)
             
             if img is None:
-                print(f"❌ Erro ao carregar imagem: {img_path}")
+                log.error('❌ Erro ao carregar imagem: %s', img_path)
                 return False
             
             try:
@@ -401,31 +403,31 @@ class ManhastroProvider(WordPressMadara):
                     template_bytes = np.asarray(bytearray(f.read()), dtype=np.uint8)
                 template = cv2.imdecode(template_bytes, cv2.IMREAD_COLOR)
             except Exception as e:
-                print(f"❌ Erro ao carregar template com numpy: {e}")
+                log.error('❌ Erro ao carregar template com numpy: %s', e)
                 template = cv2.imread(template_path)
             
             if template is None:
-                print(f"❌ Erro ao carregar template: {template_path}")
+                log.error('❌ Erro ao carregar template: %s', template_path)
                 return False
             
             if img.shape[0] == 0 or img.shape[1] == 0:
-                print(f"❌ Imagem com dimensões inválidas: {img_path}")
+                log.error('❌ Imagem com dimensões inválidas: %s', img_path)
                 return False
                 
             if template.shape[0] == 0 or template.shape[1] == 0:
-                print(f"❌ Template com dimensões inválidas: {template_path}")
+                log.error('❌ Template com dimensões inválidas: %s', template_path)
                 return False
             
             template = self.adjust_template_size(template, img)
             
             if template is None or template.shape[0] == 0 or template.shape[1] == 0:
-                print(f"❌ Template inválido após redimensionamento")
+                log.error('❌ Template inválido após redimensionamento')
                 return False
 
             h, w = template.shape[:2]
             
             if img.shape[0] < h or img.shape[1] < w:
-                print(f"❌ Imagem muito pequena para o template. Img: {img.shape[:2]}, Template: {h}x{w}")
+                log.error('❌ Imagem muito pequena para o template. Img: %s, Template: %sx%s', img.shape[:2], h, w)
                 return False
 
             img_cropped = img[-h:, :]
@@ -442,13 +444,13 @@ class ManhastroProvider(WordPressMadara):
                     if is_success:
                         with open(output_path, 'wb') as f:
                             f.write(buffer)
-                        print(f"✅ Marca d'água removida: {os.path.basename(output_path)}")
+                        log.info("✅ Marca d'água removida: %s", os.path.basename(output_path))
                         return True
                     else:
-                        print(f"❌ Erro ao codificar imagem processada")
+                        log.error('❌ Erro ao codificar imagem processada')
                         return False
                 except Exception as e:
-                    print(f"❌ Erro ao salvar imagem processada: {e}")
+                    log.error('❌ Erro ao salvar imagem processada: %s', e)
                     return False
             # else:
             #    print(f"⚠️ Marca d'água não detectada (confiança: {max_val:.2%})")
@@ -456,19 +458,19 @@ class ManhastroProvider(WordPressMadara):
             return False
             
         except Exception as e:
-            print(f"❌ Erro no processamento de marca d'água: {e}")
-            print(f"   Imagem: {img_path}")
-            print(f"   Template: {template_path}")
+            log.error("❌ Erro no processamento de marca d'água: %s", e)
+            log.info('   Imagem: %s', img_path)
+            log.info('   Template: %s', template_path)
             return False
     
     def download(self, pages: Pages, fn: any, headers=None, cookies=None):
-        print(f"tipo:{type(fn)}")
-        print(f"fn:{fn}")
+        log.info('tipo:%s', type(fn))
+        log.info('fn:%s', fn)
         pages = DownloadUseCase().execute(pages=pages, fn=fn, headers=headers, cookies=cookies)
         marks = ['mark.jpg', 'mark2.jpg', 'mark3.jpg', 'mark4.jpg', 'mark5.jpg', 'mark6.jpg', 'mark7.jpg', 'mark8.jpg', 'mark9.jpg', 'mark10.jpg', 'mark11.jpg', 'mark12.jpg', 'mark13.jpg', 'mark14.jpg', 'mark15.jpg']
         temp_page = sorted(pages.files)
         for page in temp_page[-2:]:
-            print(f'Removendo marca d\'água de: {page}')
+            log.info("Removendo marca d'água de: %s", page)
             for mark in marks:
                 if self.removeMark(page, os.path.join(Path(__file__).parent, mark), page):
                     break
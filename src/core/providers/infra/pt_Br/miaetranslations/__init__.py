@@ -7,6 +7,8 @@ from core.__seedwork.infra.http.contract.http import Response
 from core.providers.domain.entities import Chapter, Pages, Manga
 from core.providers.infra.template.wordpress_madara import WordPressMadara
 from urllib.parse import urljoin, urlencode, urlparse, urlunparse, parse_qs
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.miaetranslations')
 
 class MiaeTranslationsProvider(WordPressMadara):
     name = 'Miae Translations'
@@ -41,4 +43,4 @@ class MiaeTranslationsProvider(WordPressMadara):
             number = re.findall(r'\d+\.?\d*', str(ch.number))[0]
             return Pages(ch.id, number, ch.name, list)
         except Exception as e:
-            print(e)
\ No newline at end of file
+            log.error('%s', e)
\ No newline at end of file
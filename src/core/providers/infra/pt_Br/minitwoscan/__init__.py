@@ -1,12 +1,12 @@
-import nodriver as uc
 from typing import List
-from time import sleep
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from core.__seedwork.infra.http import Http
 from core.providers.domain.entities import Chapter
 from core.providers.infra.template.wordpress_madara import WordPressMadara
 from core.cloudflare.application.use_cases import IsCloudflareBlockingUseCase
+from core.browser.application.use_cases import RunInBrowserUseCase
+from core.browser.infra.nodriver.capture import wait_for
 
 class MiniTwoScanProvider(WordPressMadara):
     name = 'MiniTwo Scan'
@@ -26,27 +26,12 @@ class MiniTwoScanProvider(WordPressMadara):
         self.query_placeholder = '[id^="manga-chapters-holder"][data-id]'
     
     def _get_chapters_ajax_old(self, data_id, id, background):
-        content= ''
-        async def get_script_result():
-            nonlocal content
-            browser = await uc.start(
-                browser_args=[
-                    '--window-size=600,600', 
-                    f'--app={id}',
-                    '--disable-extensions', 
-                    '--disable-popup-blocking'
-                ],
-                browser_executable_path=None,
-                headless=background
-            )
-            page = await browser.get(id)
-            while(True):
-                page_content = await page.get_content()
-                if IsCloudflareBlockingUseCase().execute(page_content):
-                    sleep(1)
-                else:
-                    break
-            fetch_content = await page.evaluate('''fetch("https://minitwoscan.com/wp-admin/admin-ajax.php", {
+        async def ready(page):
+            return not IsCloudflareBlockingUseCase().execute(await page.get_content())
+
+        async def fetch_chapters(browser, page):
+            await wait_for(page, ready, timeout=60)
+            return await page.evaluate('''fetch("https://minitwoscan.com/wp-admin/admin-ajax.php", {
                 "credentials": "include",
                 "headers": {
                     "Accept": "*/*",
@@ -65,16 +50,8 @@ class MiniTwoScanProvider(WordPressMadara):
                 "method": "POST",
                 "mode": "cors"
             }).then(response => response.text());''', await_promise=True)
-            soup = BeautifulSoup(fetch_content, 'html.parser')
-            data = soup.select(self.query_chapters)
-            if data:
-                content = data
-            else:
-                browser.stop()
-
-            browser.stop()
-        uc.loop().run_until_complete(get_script_result())
-        return content
+        fetch_content = RunInBrowserUseCase().execute(id, fetch_chapters, headless=background)
+        return BeautifulSoup(fetch_content, 'html.parser').select(self.query_chapters)
     
     def getChapters(self, id: str) -> List[Chapter]:
         uri = urljoin(self.url, id)
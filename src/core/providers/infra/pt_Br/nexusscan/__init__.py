@@ -10,6 +10,8 @@ from core.__seedwork.infra.http import Http
 from core.__seedwork.infra.http.contract.http import Response
 from core.providers.domain.entities import Chapter, Pages, Manga
 from urllib.parse import urljoin, urlencode, urlparse, urlunparse, parse_qs
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.nexusscan')
 
 
 class NexusToonsDecryptor:
@@ -92,7 +94,7 @@ class NexusToonsDecryptor:
             # Decodifica base64
             encrypted = base64.b64decode(encrypted_b64)
         except Exception as e:
-            print(f"[NexusScan] Erro ao decodificar base64: {e}")
+            log.error('[NexusScan] Erro ao decodificar base64: %s', e)
             raise
         
         # Desencripta
@@ -123,8 +125,8 @@ class NexusToonsDecryptor:
         try:
             return decrypted.decode('utf-8')
         except UnicodeDecodeError as e:
-            print(f"[NexusScan] Erro ao decodificar UTF-8: {e}")
-            print(f"[NexusScan] Primeiros 50 bytes: {decrypted[:50]}")
+            log.error('[NexusScan] Erro ao decodificar UTF-8: %s', e)
+            log.info('[NexusScan] Primeiros 50 bytes: %s', decrypted[:50])
             raise
     
     def is_encrypted_response(self, data: Any) -> bool:
@@ -158,7 +160,7 @@ class NexusToonsDecryptor:
             return json.loads(decrypted_str)
         
         except Exception as e:
-            print(f"[NexusScan] Erro ao desencriptar (chave {key_index}): {e}")
+            log.error('[NexusScan] Erro ao desencriptar (chave %s): %s', key_index, e)
             return response_data
 
 
@@ -192,7 +194,7 @@ class NexusScanProvider(WordPressMadara):
         
         # Chama a API
         api_url = f"https://nexustoons.com/api/manga/{slug}"
-        print(f"[NexusScan] getManga API: {api_url}")
+        log.info('[NexusScan] getManga API: %s', api_url)
         
         try:
             response = Http.get(api_url, timeout=getattr(self, 'timeout', None))
@@ -202,11 +204,11 @@ class NexusScanProvider(WordPressMadara):
             data = self.decryptor.process_response(response_data)
             
             title = data.get('title', 'Título Desconhecido')
-            print(f"[NexusScan] ✓ Obra encontrada: {title}")
+            log.info('[NexusScan] ✓ Obra encontrada: %s', title)
             
             return Manga(id=link, name=title)
         except Exception as e:
-            print(f"[NexusScan] ✗ Erro ao obter manga: {e}")
+            log.error('[NexusScan] ✗ Erro ao obter manga: %s', e)
             raise ValueError(f"Erro ao obter informações da obra: {e}")
 
     def getChapters(self, id: str) -> List[Chapter]:
@@ -220,7 +222,7 @@ class NexusScanProvider(WordPressMadara):
         
         # Chama a API
         api_url = f"https://nexustoons.com/api/manga/{slug}"
-        print(f"[NexusScan] getChapters API: {api_url}")
+        log.info('[NexusScan] getChapters API: %s', api_url)
         
         try:
             response = Http.get(api_url, timeout=getattr(self, 'timeout', None))
@@ -233,10 +235,10 @@ class NexusScanProvider(WordPressMadara):
             chapters_data = data.get('chapters', [])
             
             if not chapters_data:
-                print(f"[NexusScan] ⚠️  Nenhum capítulo encontrado para {title}")
+                log.warning('[NexusScan] ⚠️  Nenhum capítulo encontrado para %s', title)
                 return []
             
-            print(f"[NexusScan] ✓ {len(chapters_data)} capítulos encontrados para {title}")
+            log.info('[NexusScan] ✓ %s capítulos encontrados para %s', len(chapters_data), title)
             
             chs = []
             for chapter in chapters_data:
@@ -256,7 +258,7 @@ class NexusScanProvider(WordPressMadara):
             return chs
             
         except Exception as e:
-            print(f"[NexusScan] ✗ Erro ao obter capítulos: {e}")
+            log.error('[NexusScan] ✗ Erro ao obter capítulos: %s', e)
             raise ValueError(f"Erro ao buscar capítulos: {e}")
     
     def getPages(self, ch: Chapter) -> Pages:
@@ -272,7 +274,7 @@ class NexusScanProvider(WordPressMadara):
             
             # Chama a API
             api_url = f"https://nexustoons.com/api/chapter/{chapter_id}"
-            print(f"[NexusScan] getPages API: {api_url}")
+            log.info('[NexusScan] getPages API: %s', api_url)
             
             response = Http.get(api_url, timeout=getattr(self, 'timeout', None))
             response_data = json.loads(response.content)
@@ -284,7 +286,7 @@ class NexusScanProvider(WordPressMadara):
             pages_data = data.get('pages', [])
             
             if not pages_data:
-                print(f"[NexusScan] ⚠️  Nenhuma página encontrada")
+                log.warning('[NexusScan] ⚠️  Nenhuma página encontrada')
                 number = re.findall(r'\d+\.?\d*', str(ch.number))[0] if re.findall(r'\d+\.?\d*', str(ch.number)) else ch.number
                 return Pages(ch.id, number, ch.name, [])
             
@@ -292,13 +294,11 @@ class NexusScanProvider(WordPressMadara):
             img_urls = [page['imageUrl'] for page in sorted(pages_data, key=lambda x: x['pageNumber'])]
             
             number = re.findall(r'\d+\.?\d*', str(ch.number))[0] if re.findall(r'\d+\.?\d*', str(ch.number)) else ch.number
-            print(f"[NexusScan] ✓ {len(img_urls)} páginas obtidas")
+            log.info('[NexusScan] ✓ %s páginas obtidas', len(img_urls))
             
             return Pages(ch.id, number, ch.name, img_urls)
             
         except Exception as e:
-            print(f"[NexusScan] ✗ Erro ao obter páginas: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception('[NexusScan] ✗ Erro ao obter páginas: %s', e)
             number = re.findall(r'\d+\.?\d*', str(ch.number))[0] if re.findall(r'\d+\.?\d*', str(ch.number)) else ch.number
             return Pages(ch.id, number, ch.name, [])
@@ -1,11 +1,13 @@
 import re
 import json
-from time import sleep
 from urllib.parse import urlencode
 from bs4 import BeautifulSoup
-from DrissionPage import ChromiumPage, ChromiumOptions
 from core.providers.infra.template.wordpress_madara import WordPressMadara
 from core.config.login_data import insert_login, LoginData, get_login, delete_login
+from core.browser.application.use_cases import RunInBrowserUseCase
+from core.browser.infra.nodriver.capture import wait_for_login
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.ninjacomics')
 
 class NinjaComicsProvider(WordPressMadara):
     name = 'Ninja Comics'
@@ -44,58 +46,31 @@ class NinjaComicsProvider(WordPressMadara):
         return False
     
     def login(self):
-        """Realiza login usando DrissionPage para capturar cookies do navegador real"""
+        """Realiza login no navegador real e captura os cookies"""
         login_info = get_login(self.domain_name)
         if login_info:
-            print("[NinjaComics] ✅ Login encontrado em cache")
+            log.info('[NinjaComics] ✅ Login encontrado em cache')
             return True
         
-        print("[NinjaComics] 🔐 Iniciando navegador para login...")
-        print("[NinjaComics] 📝 Você tem 30 segundos para fazer login")
+        log.info('[NinjaComics] 🔐 Iniciando navegador para login...')
+        log.info('[NinjaComics] 📝 Faça login na janela aberta')
+
+        async def wait_login(browser, page):
+            return await wait_for_login(page)
         
         try:
-            # Configurar opções do navegador
-            co = ChromiumOptions()
-            co.headless(False)
-            
-            # Criar página
-            page = ChromiumPage(addr_or_opts=co)
-            page.get(f'{self.url}/home-dark/')
-            
-            print("[NinjaComics] ⏳ Aguardando 30 segundos...")
-            sleep(30)
-            
-            print("[NinjaComics] ✅ Capturando cookies...")
-            
-            # Captura todos os cookies
-            cookies = page.cookies()
-            cookies_dict = {}
-            
-            # DrissionPage retorna um objeto CookiesList, não um dict
-            for cookie in cookies:
-                if hasattr(cookie, 'name') and hasattr(cookie, 'value'):
-                    cookies_dict[cookie.name] = cookie.value
-                elif isinstance(cookie, dict):
-                    cookies_dict[cookie.get('name')] = cookie.get('value')
-            
-            print(f"[NinjaComics] 🍪 {len(cookies_dict)} cookies capturados")
-            
-            # Fecha o navegador
-            page.quit()
+            cookies_dict = RunInBrowserUseCase().execute(f'{self.url}/home-dark/', wait_login, headless=False)
+            log.info('[NinjaComics] 🍪 %s cookies capturados', len(cookies_dict))
             
             # Salva no banco de dados
             if cookies_dict:
                 insert_login(LoginData(self.domain_name, {}, cookies_dict))
-                print("[NinjaComics] ✅ Login salvo com sucesso!")
+                log.info('[NinjaComics] ✅ Login salvo com sucesso!')
                 return True
             else:
-                print("[NinjaComics] ❌ Nenhum cookie capturado")
+                log.error('[NinjaComics] ❌ Nenhum cookie capturado')
                 return False
                 
-        except ImportError:
-            print("[NinjaComics] ❌ DrissionPage não está instalado")
-            print("[NinjaComics] Execute: pip install DrissionPage")
-            return False
         except Exception as e:
-            print(f"[NinjaComics] ❌ Erro durante login: {e}")
+            log.error('[NinjaComics] ❌ Erro durante login: %s', e)
             return False
\ No newline at end of file
@@ -3,6 +3,8 @@ from core.__seedwork.infra.http import Http
 from bs4 import BeautifulSoup
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.norus')
 
 class NorusProvider(Base):
     name = 'Norus'
@@ -34,7 +36,7 @@ class NorusProvider(Base):
             meta_title = soup.find('meta', property='og:title')
             title = meta_title['content'] if meta_title else 'Título Desconhecido'
         
-        print(f"[Norus] Mangá encontrado: {title}")
+        log.info('[Norus] Mangá encontrado: %s', title)
         return Manga(link, title)
 
     def getChapters(self, id: str) -> List[Chapter]:
@@ -52,12 +54,12 @@ class NorusProvider(Base):
         chapters_container = soup.select_one(self.get_chapters_list)
         
         if not chapters_container:
-            print(f"[Norus] Container {self.get_chapters_list} não encontrado")
+            log.info('[Norus] Container %s não encontrado', self.get_chapters_list)
             # Tentar seletor alternativo
             chapters_container = soup.select_one('ul.chapter-list, div.chapters-list, div.page-content-listing')
             
             if not chapters_container:
-                print("[Norus] Nenhum container de capítulos encontrado")
+                log.info('[Norus] Nenhum container de capítulos encontrado')
                 return list
         
         # Buscar todos os links de capítulos
@@ -67,7 +69,7 @@ class NorusProvider(Base):
             # Tentar seletores alternativos
             chapter_links = chapters_container.select('a[href*="capitulo"], a[href*="chapter"], li a')
         
-        print(f"[Norus] Encontrados {len(chapter_links)} capítulos")
+        log.info('[Norus] Encontrados %s capítulos', len(chapter_links))
         
         for ch_link in chapter_links:
             chapter_url = ch_link.get('href')
@@ -114,12 +116,12 @@ class NorusProvider(Base):
                 # Extrair URLs ordenadas por página
                 image_urls = [img['url'] for img in sorted(images, key=lambda x: x['page'])]
                 
-                print(f"[Norus] Encontradas {len(image_urls)} páginas via API")
+                log.info('[Norus] Encontradas %s páginas via API', len(image_urls))
                 return Pages(ch.id, ch.number, ch.name, image_urls)
             else:
-                print(f"[Norus] API retornou resposta inválida: {data}")
+                log.info('[Norus] API retornou resposta inválida: %s', data)
                 return Pages(ch.id, ch.number, ch.name, [])
                 
         except Exception as e:
-            print(f"[Norus] Erro ao buscar imagens da API: {e}")
+            log.error('[Norus] Erro ao buscar imagens da API: %s', e)
             return Pages(ch.id, ch.number, ch.name, [])
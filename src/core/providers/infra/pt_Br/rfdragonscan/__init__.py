@@ -13,7 +13,10 @@ from core.download.domain.dowload_entity import Chapter as DChapter
 from core.__seedwork.infra.utils.sanitize_folder import sanitize_folder_name
 from core.providers.infra.template.scan_madara_clone import ScanMadaraClone
 from core.config.login_data import insert_login, LoginData, get_login
-from time import sleep
+from core.browser.application.use_cases import RunInBrowserUseCase
+from core.browser.infra.nodriver.capture import wait_for_login
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.rfdragonscan')
 
 class RfDragonScanProvider(ScanMadaraClone):
     name = 'Rf Dragon Scan'
@@ -26,20 +29,6 @@ class RfDragonScanProvider(ScanMadaraClone):
         self.domain_name = 'rfdragonscan.com'
         self.login_url = f'{self.url}/accounts/login/'
 
-    def _extract_cookies(self, cookies) -> dict:
-        cookies_dict = {}
-
-        for cookie in cookies:
-            if hasattr(cookie, 'name') and hasattr(cookie, 'value'):
-                cookies_dict[cookie.name] = cookie.value
-            elif isinstance(cookie, dict):
-                name = cookie.get('name')
-                value = cookie.get('value')
-                if name and value:
-                    cookies_dict[name] = value
-
-        return cookies_dict
-
     def _is_svg_content(self, content: bytes) -> bool:
         head = content[:512].lstrip()
         if not head:
@@ -51,7 +40,7 @@ class RfDragonScanProvider(ScanMadaraClone):
             decoded = content.decode('utf-8', errors='ignore')
             match = re.search(r'(?:xlink:href|href)\s*=\s*"data:image\/[^;]+;base64,([^"]+)"', decoded)
             if not match:
-                print('[RfDragonScan] SVG sem imagem embutida em base64')
+                log.info('[RfDragonScan] SVG sem imagem embutida em base64')
                 return False
 
             image_bytes = base64.b64decode(match.group(1))
@@ -80,45 +69,34 @@ class RfDragonScanProvider(ScanMadaraClone):
             img.save(file_path, quality=90, dpi=(72, 72))
             return True
         except (UnidentifiedImageError, OSError, ValueError, TypeError, RuntimeError) as e:
-            print(f'[RfDragonScan] Falha ao converter SVG para JPG: {e}')
+            log.error('[RfDragonScan] Falha ao converter SVG para JPG: %s', e)
             return False
 
     def login(self):
         login_info = get_login(self.domain_name)
         if login_info:
-            print('[RfDragonScan] Login encontrado em cache')
+            log.info('[RfDragonScan] Login encontrado em cache')
             return True
 
-        print('[RfDragonScan] Iniciando navegador para login...')
-        print('[RfDragonScan] Voce tem 45 segundos para concluir o login manual')
-
-        try:
-            from DrissionPage import ChromiumPage, ChromiumOptions
+        log.info('[RfDragonScan] Iniciando navegador para login...')
+        log.info('[RfDragonScan] Conclua o login manual na janela aberta')
 
-            co = ChromiumOptions()
-            co.headless(False)
+        async def wait_login(browser, page):
+            return await wait_for_login(page)
 
-            page = ChromiumPage(addr_or_opts=co)
-            page.get(self.login_url)
-
-            print(f'[RfDragonScan] Aguardando em: {self.login_url}')
-            sleep(45)
-
-            cookies_dict = self._extract_cookies(page.cookies())
-            page.quit()
+        try:
+            log.info('[RfDragonScan] Aguardando em: %s', self.login_url)
+            cookies_dict = RunInBrowserUseCase().execute(self.login_url, wait_login, headless=False)
 
             if not cookies_dict:
-                print('[RfDragonScan] Nenhum cookie foi capturado')
+                log.info('[RfDragonScan] Nenhum cookie foi capturado')
                 return False
 
             insert_login(LoginData(self.domain_name, {}, cookies_dict))
-            print(f'[RfDragonScan] Login salvo com sucesso ({len(cookies_dict)} cookies)')
+            log.info('[RfDragonScan] Login salvo com sucesso (%s cookies)', len(cookies_dict))
             return True
-        except ImportError:
-            print('[RfDragonScan] DrissionPage nao esta instalado. Execute: pip install DrissionPage')
-            return False
         except (AttributeError, RuntimeError, TimeoutError, TypeError, ValueError) as e:
-            print(f'[RfDragonScan] Erro durante login: {e}')
+            log.error('[RfDragonScan] Erro durante login: %s', e)
             return False
 
     def download(self, pages, fn: any, headers=None, cookies=None):
@@ -143,7 +121,7 @@ class RfDragonScanProvider(ScanMadaraClone):
 
             with ZipFile(zip_content) as zip_file:
                 for file_name in zip_file.namelist():
-                    print(f'[RfDragonScan] Processando arquivo: {file_name}')
+                    log.info('[RfDragonScan] Processando arquivo: %s', file_name)
                     base_name = os.path.basename(file_name)
                     if not base_name:
                         continue
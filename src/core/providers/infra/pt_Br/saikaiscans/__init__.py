@@ -1,10 +1,10 @@
 import json
-import nodriver as uc
 from typing import List
 from bs4 import BeautifulSoup
 from core.__seedwork.infra.http import Http
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
+from core.browser.application.use_cases import RunInBrowserUseCase
 
 class SaikaiScansProvider(Base):
     name = 'Saikai Scans'
@@ -23,25 +23,11 @@ class SaikaiScansProvider(Base):
         return Manga(link, title.get_text(strip=True))
     
     def _exec_js(self, script, background):
-        content= ''
-        async def get_script_result():
-            nonlocal content
-            browser = await uc.start(
-                browser_args=[
-                    '--window-size=600,600', 
-                    f'--app=https://google.com',
-                    '--disable-extensions', 
-                    '--disable-popup-blocking'
-                ],
-                browser_executable_path=None,
-                headless=background
-            )
-            page = await browser.get('https://google.com')
+        # O script só define o payload do Nuxt; a aba não precisa navegar
+        async def run(browser, page):
             await page.evaluate(f'{script}')
-            content = await page.evaluate('JSON.stringify(__NUXT__.data[0].story.valueOf().data)')
-            browser.stop()
-        uc.loop().run_until_complete(get_script_result())
-        return content
+            return await page.evaluate('JSON.stringify(__NUXT__.data[0].story.valueOf().data)')
+        return RunInBrowserUseCase().execute(self.url, run, headless=background, navigate=False)
 
     def getChapters(self, id: str) -> List[Chapter]:
         response = Http.get(id)
@@ -5,6 +5,8 @@ from urllib.parse import urlparse, parse_qs
 from core.__seedwork.infra.http import Http
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.sakuramangas')
 
 # Construído com base no código disponível em https://github.com/etoshy/Sakura-Mangas-Downloader por etoshy
 
@@ -32,21 +34,21 @@ class SakuraMangasProvider(Base):
                     path_parts = parsed_url.path.strip('/').split('/')
                     if len(path_parts) >= 2:
                         obra_name = path_parts[-2]
-                        print(f"Não encontrou tags de metadados, mas encontrou nome da obra: {obra_name}")
+                        log.info('Não encontrou tags de metadados, mas encontrou nome da obra: %s', obra_name)
                     
-                    print("Não foi possível extrair manga_id e token da página")
+                    log.info('Não foi possível extrair manga_id e token da página')
                     return None
             else:
-                print(f"Falha ao acessar URL: {response.status}")
+                log.error('Falha ao acessar URL: %s', response.status)
                 return None
         except Exception as e:
-            print(f"Erro ao extrair informações do mangá: {e}")
+            log.error('Erro ao extrair informações do mangá: %s', e)
             return None
     
     def getManga(self, link: str) -> Manga:
         infos = self.extract_manga_info(link)
         if infos == None:
-            print("Não foi possível extrair informações do mangá.")
+            log.info('Não foi possível extrair informações do mangá.')
             return None
         url = f'{self.base_url}/dist/sakura/models/manga/manga_info.php'
 
@@ -65,10 +67,10 @@ class SakuraMangasProvider(Base):
             if response.status == 200:
                 return Manga(f'{infos["manga_id"]}|{infos["token"]}|{response.json().get("ultimo_capitulo", 1)}|{response.json().get("titulo", "Desconhecido")}', response.json().get("titulo", "Desconhecido"))
             else:
-                print(f"Falha ao obter detalhes do mangá: {response.status}")
+                log.error('Falha ao obter detalhes do mangá: %s', response.status)
                 return None
         except Exception as e:
-            print(f"Erro ao obter detalhes do mangá: {e}")
+            log.error('Erro ao obter detalhes do mangá: %s', e)
             return None
 
     def getChapters(self, id: str) -> List[Chapter]:
@@ -123,7 +125,7 @@ class SakuraMangasProvider(Base):
                             
                             all_chapters_data.append(Chapter(chapter_link, chapter_num, title))
                         except Exception as e:
-                            print(f"Erro ao analisar capítulo: {e}")
+                            log.error('Erro ao analisar capítulo: %s', e)
                             continue
                     
                     # Se recebemos menos itens que o limite, podemos parar
@@ -131,10 +133,10 @@ class SakuraMangasProvider(Base):
                         break
                         
                 else:
-                    print(f"Falha ao obter capítulos no offset {offset}: {response.status}")
+                    log.error('Falha ao obter capítulos no offset %s: %s', offset, response.status)
                     break
             except Exception as e:
-                print(f"Erro ao obter capítulos do mangá: {e}")
+                log.error('Erro ao obter capítulos do mangá: %s', e)
                 break
     
         return all_chapters_data
@@ -144,7 +146,7 @@ class SakuraMangasProvider(Base):
             # Tenta buscar o conteúdo da página primeiro
             response = Http.get(url)
             if response.status != 200:
-                print(f"Falha ao acessar URL: {url}")
+                log.error('Falha ao acessar URL: %s', url)
                 return None, None
                 
             content = response.text()
@@ -158,11 +160,11 @@ class SakuraMangasProvider(Base):
                 token = token_match.group(1)
                 return chapter_id, token
             else:
-                print("Não foi possível encontrar chapter_id e token no conteúdo da página")
+                log.info('Não foi possível encontrar chapter_id e token no conteúdo da página')
                 return None, None
                 
         except Exception as e:
-            print(f"Erro ao acessar URL: {e}")
+            log.error('Erro ao acessar URL: %s', e)
             return None, None
 
     def getPages(self, ch: Chapter) -> Pages:
@@ -177,11 +179,11 @@ class SakuraMangasProvider(Base):
         try:
             response = Http.post(url, headers=headers, data=data)
             if response.status != 200:
-                print(f"Falha ao obter páginas do capítulo: Código de status {response.status}")
+                log.error('Falha ao obter páginas do capítulo: Código de status %s', response.status)
                 return None
             pages_data = [self.base_url + path if path.startswith('/') else self.base_url + '/' + path for path in response.json().get('imageUrls', [])]
             return Pages(chapter_id, ch.number, ch.name, pages_data)
         except Exception as e:
-            print(f"Erro ao obter páginas do capítulo: {e}")
+            log.error('Erro ao obter páginas do capítulo: %s', e)
             return None
 
@@ -2,13 +2,14 @@ import re
 import math
 import asyncio
 from urllib import request
-import nodriver as uc
 from typing import List
 from bs4 import BeautifulSoup
 from core.__seedwork.infra.http import Http
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
 import json
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.serenitytoons')
 
 
 class SerenityToonsProvider(Base):
@@ -55,8 +56,8 @@ class SerenityToonsProvider(Base):
         try:
             return json.loads(json_str)
         except json.JSONDecodeError as e:
-            print("Erro ao decodificar JSON:", e)
-            print("JSON bruto:", json_str)
+            log.error('Erro ao decodificar JSON: %s', e)
+            log.info('JSON bruto: %s', json_str)
             return None
     
     def getChapters(self, id: str) -> List[Chapter]:
@@ -70,13 +71,13 @@ class SerenityToonsProvider(Base):
             target_script = None
             for script in scripts:
                 if script.string and 'cap_id' in script.string:
-                    print(f"Script encontrado")
+                    log.info('Script encontrado')
                     target_script = script.string
                     break
             match = re.search(r'self\.__next_f\.push\(\[1,"(5:.*?)"\]\)', target_script, re.DOTALL)
             list = []
             if not match:
-                print("Não foi possível extrair a string JSON embutida.")
+                log.info('Não foi possível extrair a string JSON embutida.')
             else:
                 json_raw = match.group(1)
 
@@ -88,10 +89,10 @@ class SerenityToonsProvider(Base):
                     for cap in result['capitulos']:
                         list.append(Chapter([id_value, cap['cap_id']], cap['cap_nome'].encode('latin1').decode('utf-8'), title.get_text()))
                 else:
-                    print("Não foi possível extrair o JSON de capítulos.")
+                    log.info('Não foi possível extrair o JSON de capítulos.')
             return list
         except Exception as e:
-            print(e)
+            log.error('%s', e)
         
     def getPages(self, ch: Chapter) -> Pages:
         try:
@@ -147,7 +148,7 @@ class SerenityToonsProvider(Base):
                                 found_first = True
                                 break
                         except Exception as e:
-                            print(f"Falha na requisição para {url}: {e}")
+                            log.error('Falha na requisição para %s: %s', url, e)
                     if found_first:
                         break
                 if found_first:
@@ -172,7 +173,7 @@ class SerenityToonsProvider(Base):
                     else:
                         break
                 except Exception as e:
-                    print(f"Falha na requisição para {url}: {e}")
+                    log.error('Falha na requisição para %s: %s', url, e)
                     break
 
             if not image_urls:
@@ -180,5 +181,5 @@ class SerenityToonsProvider(Base):
             return Pages(ch.id, ch.number, ch.name, image_urls)
 
         except Exception as e:
-            print(f"Erro em getPages: {str(e)}")
+            log.error('Erro em getPages: %s', str(e))
             raise
@@ -1,7 +1,6 @@
 import os
 import cv2
 import json
-import nodriver as uc
 from time import sleep
 from typing import List
 from pathlib import Path
@@ -11,6 +10,10 @@ from core.__seedwork.infra.http import Http
 from core.providers.infra.template.base import Base
 from core.download.application.use_cases import DownloadUseCase
 from core.providers.domain.entities import Chapter, Pages, Manga
+from core.browser.application.use_cases import RunInBrowserUseCase
+from core.browser.infra.nodriver.capture import wait_for_selector
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.slimeread')
 
 class SlimeReadProvider(Base):
     name = 'Slime Read'
@@ -40,31 +43,10 @@ class SlimeReadProvider(Base):
             return False
     
     def getPageContent(self, domain: str, background = False) -> any:
-        content= ''
-        async def get_script_result():
-            nonlocal content
-            browser = await uc.start(
-                browser_args=[
-                    '--window-size=600,600', 
-                    f'--app={domain}',
-                    '--disable-extensions', 
-                    '--disable-popup-blocking'
-                ],
-                browser_executable_path=None,
-                headless=background
-            )
-            page = await browser.get(domain)
-            data = []
-            while len(data) == 0:
-                page_content = await page.get_content()
-                soup = BeautifulSoup(page_content, 'html.parser')
-                data = soup.select('h2.tw-tv.tw-zj.transition.tw-lp.tw-ey.tw-iu')
-                # data = soup.select('h2.tw-tv.tw-zj.transition.tw-lp.tw-ey.tw-iu')
-
-            content = page_content
-            browser.stop()
-        uc.loop().run_until_complete(get_script_result())
-        return content
+        async def render(browser, page):
+            await wait_for_selector(page, 'h2.tw-tv.tw-zj.transition.tw-lp.tw-ey.tw-iu', timeout=60)
+            return await page.get_content()
+        return RunInBrowserUseCase().execute(domain, render, headless=background)
 
     def getChapters(self, id: str) -> List[Chapter]:
         list = []
@@ -177,6 +159,6 @@ if __name__ == "__main__":
     sleep(20)
     chps = SlimeReadProvider().getChapters(manga.id)
     pages = SlimeReadProvider().getPages(chps[0])
-    print(pages)
+    log.debug('%s', pages)
 
 
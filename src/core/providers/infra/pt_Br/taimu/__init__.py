@@ -9,6 +9,8 @@ from selenium.webdriver.chrome.options import Options
 from urllib.parse import urljoin
 import re
 import json
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.taimu')
 
 class TaimuProvider(WordpressEtoshoreMangaTheme):
     name = 'Taimu mangas'
@@ -152,14 +154,12 @@ class TaimuProvider(WordpressEtoshoreMangaTheme):
                         links.append(full_url)
                 
                 if links:
-                    print(f"[YUGEN] ✓ {len(links)} páginas extraídas")
+                    log.info('[YUGEN] ✓ %s páginas extraídas', len(links))
                     return Pages(ch.id, ch.number, ch.name, links)
             
-            print("[YUGEN] ✗ Nenhuma página encontrada")
+            log.error('[YUGEN] ✗ Nenhuma página encontrada')
             return Pages(ch.id, ch.number, ch.name, [])
             
         except Exception as e:
-            print(f"[YUGEN] ✗ Erro: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception('[YUGEN] ✗ Erro: %s', e)
             return Pages(ch.id, ch.number, ch.name, [])
\ No newline at end of file
@@ -1,11 +1,11 @@
-import nodriver as uc
-from time import sleep
 from typing import List
 from bs4 import BeautifulSoup
 from core.__seedwork.infra.http import Http
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
 from core.config.login_data import insert_login, LoginData, get_login, delete_login
+from core.browser.application.use_cases import RunInBrowserUseCase
+from core.browser.infra.nodriver.capture import wait_for_login
 
 class BlackoutProvider(Base):
     name = 'Blackout/TopToon'
@@ -36,22 +36,15 @@ class BlackoutProvider(Base):
                 login_info = None
             
         if not login_info:
-            async def getLogin():
-                browser = await uc.start()
-                page = await browser.get(self.login_page)
-                while True:
-                    html_page = await page.get_content()
-                    if self._is_login_page(html_page):
-                        sleep(1)
-                    else:
-                        cookies = await browser.cookies.get_all()
-                        for cookie in cookies:
-                            if cookie.name == 'blackoutcomics_session':
-                                insert_login(LoginData(self.domain, {}, {'blackoutcomics_session': cookie.value}))
-                                break
-                        break
-                browser.stop()
-            uc.loop().run_until_complete(getLogin())
+            async def logged_in(page):
+                return not self._is_login_page(await page.get_content())
+
+            async def getLogin(browser, page):
+                return await wait_for_login(page, logged_in)
+
+            cookies = RunInBrowserUseCase().execute(self.login_page, getLogin, headless=False)
+            if 'blackoutcomics_session' in cookies:
+                insert_login(LoginData(self.domain, {}, {'blackoutcomics_session': cookies['blackoutcomics_session']}))
 
     def getManga(self, link: str) -> Manga:
         response = Http.get(link)
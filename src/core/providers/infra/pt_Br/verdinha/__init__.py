@@ -7,6 +7,8 @@ from core.__seedwork.infra.http import Http
 from core.providers.infra.template.base import Base
 from core.providers.domain.entities import Chapter, Pages, Manga
 from core.config.login_data import insert_login, LoginData, get_login, delete_login
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.verdinha')
 
 
 class VerdinhaProvider(Base):
@@ -46,7 +48,7 @@ class VerdinhaProvider(Base):
         if login_info and login_info.headers.get('authorization'):
             self.access_token = login_info.headers.get('authorization').replace('Bearer ', '')
             self.headers['authorization'] = f'Bearer {self.access_token}'
-            print("[Verdinha] ✅ Token de acesso carregado")
+            log.info('[Verdinha] ✅ Token de acesso carregado')
    
     def _save_token(self, token: str):
         """Salva o token de acesso no banco de dados"""
@@ -57,18 +59,18 @@ class VerdinhaProvider(Base):
             {'authorization': f'Bearer {token}'},
             {}
         ))
-        print("[Verdinha] ✅ Token de acesso salvo")
+        log.info('[Verdinha] ✅ Token de acesso salvo')
    
     def login(self):
         """Realiza login na API da Verdinha"""
         # Verifica se já tem token válido
         login_info = get_login(self.domain_name)
         if login_info and login_info.headers.get('authorization'):
-            print("[Verdinha] ✅ Login encontrado em cache")
+            log.info('[Verdinha] ✅ Login encontrado em cache')
             self._load_token()
             return True
        
-        print("[Verdinha] 🔐 Realizando login...")
+        log.info('[Verdinha] 🔐 Realizando login...')
        
         try:
             login_url = f'{self.base}/auth/login'
@@ -110,18 +112,18 @@ class VerdinhaProvider(Base):
                
                 if access_token:
                     self._save_token(access_token)
-                    print(f"[Verdinha] ✅ Login bem-sucedido! Usuário: {user.get('nome', 'Desconhecido')}")
+                    log.info('[Verdinha] ✅ Login bem-sucedido! Usuário: %s', user.get('nome', 'Desconhecido'))
                     return True
                 else:
-                    print("[Verdinha] ❌ Token não encontrado na resposta")
+                    log.error('[Verdinha] ❌ Token não encontrado na resposta')
                     return False
             else:
-                print(f"[Verdinha] ❌ Falha no login - Status: {response.status}")
-                print(f"[Verdinha] Resposta: {response.content}")
+                log.error('[Verdinha] ❌ Falha no login - Status: %s', response.status)
+                log.info('[Verdinha] Resposta: %s', response.content)
                 return False
                
         except Exception as e:
-            print(f"[Verdinha] ❌ Erro ao fazer login: {e}")
+            log.error('[Verdinha] ❌ Erro ao fazer login: %s', e)
             return False
    
     def getManga(self, link: str) -> Manga:
@@ -139,7 +141,7 @@ class VerdinhaProvider(Base):
            
             # Nova API usa slug ao invés de ID
             api_url = f'{self.base}/obras/{slug}'
-            print(f"[Verdinha] Chamando API: {api_url}")
+            log.info('[Verdinha] Chamando API: %s', api_url)
            
             response = Http.get(api_url, headers=self.headers, timeout=30)
             # JSON já vem direto, sem 'resultado'
@@ -149,7 +151,7 @@ class VerdinhaProvider(Base):
             return Manga(link, title)
            
         except Exception as e:
-            print(f"[Verdinha] Erro em getManga: {e}")
+            log.error('[Verdinha] Erro em getManga: %s', e)
             raise
 
 
@@ -168,7 +170,7 @@ class VerdinhaProvider(Base):
            
             # Nova API usa slug ao invés de ID
             api_url = f'{self.base}/obras/{slug}'
-            print(f"[Verdinha] Chamando API: {api_url}")
+            log.info('[Verdinha] Chamando API: %s', api_url)
            
             response = Http.get(api_url, headers=self.headers, timeout=30)
             # JSON já vem direto, sem 'resultado'
@@ -181,7 +183,7 @@ class VerdinhaProvider(Base):
                 chapters_list.append(Chapter([slug, ch['cap_id']], ch['cap_nome'], title))
             return chapters_list
         except Exception as e:
-            print(f"[Verdinha] Erro em getChapters: {e}")
+            log.error('[Verdinha] Erro em getChapters: %s', e)
             return []
 
 
@@ -193,20 +195,20 @@ class VerdinhaProvider(Base):
        
         images = []
        
-        print(f"[Verdinha] Obtendo páginas para: {ch.name}")
+        log.info('[Verdinha] Obtendo páginas para: %s', ch.name)
        
         time.sleep(random.uniform(0.3, 1))  # Pequena espera para evitar bloqueios
         try:
             # Usar API com Http
             api_url = f"{self.base}/capitulos/{ch.id[1]}"
-            print(f"[Verdinha] Chamando API: {api_url}")
+            log.info('[Verdinha] Chamando API: %s', api_url)
            
             response = Http.get(api_url, headers=self.headers, timeout=30)
             # JSON já vem direto, sem 'resultado'
             data = response.json()
             obra_id = data.get('obr_id', 'Desconhecido')
             cap_numero = data.get('cap_numero', 'Desconhecido')
-            print(f"[Verdinha] API retornou {len(data.get('cap_paginas', []))} páginas")
+            log.info('[Verdinha] API retornou %s páginas', len(data.get('cap_paginas', [])))
 
 
             def clean_path(p):
@@ -232,22 +234,22 @@ class VerdinhaProvider(Base):
                    
                     if full_url and full_url.startswith('http'):
                         images.append(full_url)
-                        print(f"[Verdinha] Página {i+1}: {full_url}")
+                        log.info('[Verdinha] Página %s: %s', i+1, full_url)
                    
                 except Exception as e:
-                    print(f"[Verdinha] Erro ao processar página {i+1}: {e}")
+                    log.error('[Verdinha] Erro ao processar página %s: %s', i+1, e)
                     continue
            
             if images:
-                print(f"[Verdinha] ✅ Sucesso: {len(images)} páginas encontradas")
+                log.info('[Verdinha] ✅ Sucesso: %s páginas encontradas', len(images))
                 return Pages(ch.id, ch.number, ch.name, images)
             else:
-                print("[Verdinha] ⚠️ Nenhuma página válida encontrada")
+                log.warning('[Verdinha] ⚠️ Nenhuma página válida encontrada')
                
         except Exception as e:
-            print(f"[Verdinha] ❌ Erro na API: {e}")
+            log.error('[Verdinha] ❌ Erro na API: %s', e)
 
 
         # Se chegou aqui, API falhou - retornar páginas vazias
-        print("[Verdinha] ❌ Falha na API - retornando lista vazia")
+        log.error('[Verdinha] ❌ Falha na API - retornando lista vazia')
         return Pages(ch.id, ch.number, ch.name, [])
@@ -4,6 +4,8 @@ from bs4 import BeautifulSoup
 from core.__seedwork.infra.http import Http
 from urllib.parse import urljoin
 from core.providers.domain.entities import Chapter, Pages
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.yanpfansub')
 
 class YanpFansubProvider(WordPressMadara):
     name = 'Yanp fansub'
@@ -43,4 +45,4 @@ class YanpFansubProvider(WordPressMadara):
                 number = ch.number
             return Pages(ch.id, number, ch.name, list)
         except Exception as e:
-            print(e)
\ No newline at end of file
+            log.error('%s', e)
\ No newline at end of file
@@ -8,6 +8,8 @@ from core.__seedwork.infra.http import Http
 from core.providers.domain.entities import Chapter, Pages, Manga
 from core.providers.infra.template.manga_reader_cms import MangaReaderCms
 from core.config.login_data import insert_login, LoginData, get_login, delete_login
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.yomucomics')
 
 
 class YomuComicsProvider(MangaReaderCms):
@@ -30,7 +32,7 @@ class YomuComicsProvider(MangaReaderCms):
 
     def getManga(self, link: str) -> Manga:
         response = requests.get(link)
-        print(f"response: {response.status_code}")
+        log.info('response: %s', response.status_code)
         soup = BeautifulSoup(response.content, 'html.parser')
         title = soup.select_one(self.query_title_for_uri).text.strip()
         return Manga(link, title)
@@ -65,7 +67,7 @@ class YomuComicsProvider(MangaReaderCms):
         title, id = ch.name.split(" - ")
         ch.name = title
         images = f"{self.public_images}{id}/{ch.number}"
-        print(f"images: {images}")
+        log.info('images: %s', images)
         list = []
         response = Http.get(images)
         pages = response.json().get("pages", [])
@@ -18,6 +18,8 @@ from core.__seedwork.infra.http.contract.http import Response
 from core.providers.domain.entities import Chapter, Pages, Manga
 from core.providers.infra.template.wordpress_madara import WordPressMadara
 from urllib.parse import urljoin, urlencode, urlparse, urlunparse, parse_qs
+from core.__seedwork.infra.log import get_logger
+log = get_logger('providers.mangamammy')
 
 class MangaMammyProvider(WordPressMadara):
     name = 'Manga Mammy'
@@ -105,7 +107,7 @@ class MangaMammyProvider(WordPressMadara):
             list.append(self._process_page_element(el, uri))
 
         number = re.findall(r'\d+\.?\d*', str(ch.number))[0]
-        print(list)
+        log.debug('%s', list)
         return Pages(ch.id, number, ch.name, list)
 
     def _fetch_dom(self, response: Response, query: str):
@@ -188,7 +190,7 @@ class MangaMammyProvider(WordPressMadara):
                 img.save(file, quality=100, dpi=(72, 72), icc_profile=icc)
                 files.append(file)
             except Exception as e:
-                print(f"<stroke style='color:green;'>[Downloading]:</stroke> <span style='color:red;'>Error</stroke> {e}")
+                log.error('[Downloading]: Error %s', e)
 
             if fn != None:
                 fn(math.ceil(i * 100)/len(pages.pages))
@@ -21,7 +21,7 @@ class WordPressMadara(Base):
         self.timeout=None
 
     def getManga(self, link: str) -> Manga:
-        response = Http.get(link, timeout=getattr(self, 'timeout', None))
+        response = Http.get(link, timeout=getattr(self, 'timeout', None), cache=True)
         soup = BeautifulSoup(response.content, 'html.parser')
         data = soup.select(self.query_title_for_uri)
         element = data.pop()
@@ -30,7 +30,7 @@ class WordPressMadara(Base):
 
     def getChapters(self, id: str) -> List[Chapter]:
         uri = urljoin(self.url, id)
-        response = Http.get(uri, timeout=getattr(self, 'timeout', None))
+        response = Http.get(uri, timeout=getattr(self, 'timeout', None), cache=True)
         soup = BeautifulSoup(response.content, 'html.parser')
         data = soup.select(self.query_title_for_uri)
         element = data.pop()
@@ -105,7 +105,7 @@ class WordPressMadara(Base):
         response = Http.post(uri, data=f'action=manga_get_chapters&manga={data_id}', headers={
             'content-type': 'application/x-www-form-urlencoded',
             'x-referer': self.url
-        }, timeout=getattr(self, 'timeout', None))
+        }, timeout=getattr(self, 'timeout', None), cache=True)
         data = self._fetch_dom(response, self.query_chapters)
         if data:
             return data
@@ -116,7 +116,7 @@ class WordPressMadara(Base):
         if not manga_id.endswith('/'):
             manga_id += '/'
         uri = urljoin(self.url, f'{manga_id}ajax/chapters/')
-        response = Http.post(uri, timeout=getattr(self, 'timeout', None))
+        response = Http.post(uri, timeout=getattr(self, 'timeout', None), cache=True)
         data = self._fetch_dom(response, self.query_chapters)
         if data:
             return data
@@ -20,14 +20,14 @@ class YushukeTheme(Base):
         self.image_selector = "img"
 
     def getManga(self, link: str) -> Manga:
-        response = Http.get(link)
+        response = Http.get(link, cache=True)
         soup = BeautifulSoup(response.content, 'html.parser')
         title = soup.select_one('div.manga-title-row h1')
 
         return Manga(link, title.get_text(strip=True))
 
     def getChapters(self, id: str) -> List[Chapter]:
-        response = Http.get(id)
+        response = Http.get(id, cache=True)
         soup = BeautifulSoup(response.content, 'html.parser')
         title = soup.select_one(self.title)
         chapter_list = []
@@ -67,7 +67,7 @@ class YushukeTheme(Base):
         
         while True:
             api_url = f'{self.chapters_api}manga_id={manga_id}&page={current_page}&order=DESC'
-            response = Http.get(api_url)
+            response = Http.get(api_url, cache=True)
             
             try:
                 data = json.loads(response.content)